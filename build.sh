@@ -1 +1 @@
-python3 src/main.py "/tolkien_fan_club_page/"
+python3 src/main.py "/tolkien_fan_club_page/" "https://artemsenchev.github.io"
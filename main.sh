@@ -1,2 +1,2 @@
 python3 src/main.py "/static_site_gen/"
-cd docs && python3 -m http.server 8888
\ No newline at end of file
+python3 -m http.server 8888 --directory docs
\ No newline at end of file
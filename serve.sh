@@ -0,0 +1 @@
+python3 src/devserver.py 8888
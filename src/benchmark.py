@@ -0,0 +1,102 @@
+import sys
+import time
+
+import htmlnode
+from discovery import find_files, page_include
+from frontmatter import read_metadata
+from gencontent import read_body
+from markdown_blocks import FRAGMENT_CACHE, markdown_to_blocks, markdown_to_html_many, markdown_to_html_node
+
+
+dir_path_content = "./content"
+default_repeat = 200
+
+
+def load_corpus(dir_path_content=dir_path_content):
+    corpus = []
+    for _, entry in find_files(dir_path_content, page_include):
+        corpus.append(read_body(entry.path, read_metadata(entry.path)))
+    return corpus
+
+
+def best_time(fn, repeat):
+    best = None
+    for _ in range(5):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            fn()
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best / repeat
+
+
+def serialize_all(nodes):
+    for node in nodes:
+        node.to_html()
+
+
+def bench_escape(corpus, repeat=default_repeat):
+    """
+    Time serializing the corpus' node trees with and without escaping,
+    by swapping the escape functions for a no-op.
+    """
+    nodes = [markdown_to_html_node(markdown) for markdown in corpus]
+    escaped = best_time(lambda: serialize_all(nodes), repeat)
+    escape_text, escape_attr = htmlnode.escape_text, htmlnode.escape_attr
+    htmlnode.escape_text = htmlnode.escape_attr = lambda text: text
+    try:
+        unescaped = best_time(lambda: serialize_all(nodes), repeat)
+    finally:
+        htmlnode.escape_text, htmlnode.escape_attr = escape_text, escape_attr
+    overhead = (escaped - unescaped) / unescaped * 100
+    print(f"to_html, no escaping: {unescaped * 1e6:9.1f} us per corpus")
+    print(f"to_html, escaping:    {escaped * 1e6:9.1f} us per corpus ({overhead:+.1f}%)")
+
+
+def bench_render(corpus, repeat=default_repeat):
+    parsed = best_time(lambda: [markdown_to_html_node(markdown) for markdown in corpus], repeat)
+    print(f"markdown_to_html_node: {parsed * 1e6:9.1f} us per corpus")
+
+
+def bench_many(corpus, repeat=20):
+    """
+    Snippets per second converting every run of up to three blocks from
+    the corpus one at a time and through markdown_to_html_many(), the
+    latter starting from a cold fragment cache on each repeat.
+    """
+    snippets = []
+    for markdown in corpus:
+        blocks = markdown_to_blocks(markdown)
+        for i in range(len(blocks)):
+            snippets.append("\n\n".join(blocks[i : i + 3]))
+
+    def many():
+        FRAGMENT_CACHE.clear()
+        for _ in markdown_to_html_many(snippets):
+            pass
+
+    single = best_time(lambda: [markdown_to_html_node(snippet).to_html() for snippet in snippets], repeat)
+    batched = best_time(many, repeat)
+    print(f"{len(snippets)} snippets")
+    print(f"markdown_to_html_node: {len(snippets) / single:9.0f} snippets/s")
+    print(f"markdown_to_html_many: {len(snippets) / batched:9.0f} snippets/s")
+
+
+benchmarks = {
+    "escape": bench_escape,
+    "render": bench_render,
+    "many": bench_many,
+}
+
+
+def main():
+    names = sys.argv[1:] or list(benchmarks)
+    corpus = load_corpus()
+    print(f"{len(corpus)} pages, {sum(len(markdown) for markdown in corpus)} chars")
+    for name in names:
+        benchmarks[name](corpus)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+import json
+import os
+import socket
+import sys
+
+from main import build_socket_path
+
+
+# Deliberately imports nothing from the build itself, so it starts
+# in a few milliseconds.
+
+
+def request_build(argv, socket_path=build_socket_path, out=sys.stdout):
+    """
+    Send a build request to the build server on `socket_path`, copy its
+    output to `out` as it arrives and return the build's exit status.
+    """
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        client.connect(socket_path)
+        request = {"argv": argv, "cwd": os.getcwd()}
+        client.sendall(json.dumps(request).encode("utf-8") + b"\n")
+        with client.makefile("rb") as messages:
+            for line in messages:
+                message = json.loads(line)
+                if "output" in message:
+                    out.write(message["output"])
+                    out.flush()
+                elif "status" in message:
+                    return message["status"]
+    finally:
+        client.close()
+    raise ConnectionError("build server closed the connection mid-build")
+
+
+def main():
+    try:
+        status = request_build(sys.argv[1:])
+    except (FileNotFoundError, ConnectionRefusedError):
+        print(f"no build server on {build_socket_path}; start one with: python3 src --daemon", file=sys.stderr)
+        status = 1
+    sys.exit(status)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,241 @@
+import hashlib
+import json
+import os
+
+
+manifest_filename = ".build-manifest.json"
+changes_filename = ".build-changes.json"
+
+
+class StagedOutput:
+    """
+    Builds the site into a staging directory next to the public one.
+
+    Every output file's sha256 is recorded in a manifest. Files whose hash
+    matches the previous build's manifest are hardlinked from it instead
+    of rewritten, which also keeps their mtimes for rsync/CDN uploads.
+    commit() writes the manifest and the list of added, changed and
+    removed paths, then swaps the staging directory into place, so the
+    public directory always holds a complete build and a failed build
+    leaves the last good one untouched.
+    """
+
+    def __init__(self, public_dir):
+        self.public_dir = os.path.normpath(public_dir)
+        self.staging_dir = self.public_dir + ".staging"
+        self.old_dir = self.public_dir + ".old"
+        self.previous_manifest = {}
+        self.manifest = {}
+        self.changes = None
+
+    def begin(self):
+        import shutil
+
+        if os.path.exists(self.staging_dir):
+            shutil.rmtree(self.staging_dir)
+        os.makedirs(self.staging_dir)
+        self.previous_manifest = load_manifest(
+            os.path.join(self.public_dir, manifest_filename)
+        )
+        self.manifest = {}
+        self.changes = None
+        return self.staging_dir
+
+    def rel_path(self, dest_path):
+        return os.path.relpath(dest_path, self.staging_dir).replace(os.sep, "/")
+
+    def previous_path(self, dest_path):
+        rel_path = os.path.relpath(dest_path, self.staging_dir)
+        return os.path.join(self.public_dir, rel_path)
+
+    def write(self, dest_path, data):
+        rel_path = self.rel_path(dest_path)
+        digest = hash_bytes(data)
+        self.manifest[rel_path] = digest
+        prev_path = self.previous_path(dest_path)
+        if rel_path in self.previous_manifest:
+            unchanged = self.previous_manifest[rel_path] == digest
+        else:
+            unchanged = same_contents(prev_path, data)
+        if unchanged and link_file(prev_path, dest_path):
+            return False
+        return write_file(dest_path, data)
+
+    def copy(self, from_path, dest_path, digest=None):
+        """
+        Copy a file into the build. `digest` is the file's sha256 when the
+        caller already knows it, e.g. from a shard's manifest; otherwise
+        the previous build's copy is reused if it is not older than the
+        source.
+        """
+        rel_path = self.rel_path(dest_path)
+        prev_path = self.previous_path(dest_path)
+        previous_digest = self.previous_manifest.get(rel_path)
+        if digest is None:
+            unchanged = previous_digest is not None and is_up_to_date(prev_path, from_path)
+        else:
+            unchanged = previous_digest == digest
+        if unchanged and link_file(prev_path, dest_path):
+            self.manifest[rel_path] = previous_digest
+            return dest_path
+        copy_file(from_path, dest_path)
+        if digest is None:
+            digest = hash_file(dest_path)
+        self.manifest[rel_path] = digest
+        return dest_path
+
+    def keep(self, dest_path):
+        rel_path = self.rel_path(dest_path)
+        prev_path = self.previous_path(dest_path)
+        if rel_path not in self.previous_manifest or not link_file(prev_path, dest_path):
+            return False
+        self.manifest[rel_path] = self.previous_manifest[rel_path]
+        return True
+
+    def commit(self):
+        import shutil
+
+        self.changes = diff_manifests(self.previous_manifest, self.manifest)
+        write_json_file(os.path.join(self.staging_dir, manifest_filename), self.manifest)
+        write_json_file(os.path.join(self.staging_dir, changes_filename), self.changes)
+        if os.path.exists(self.old_dir):
+            shutil.rmtree(self.old_dir)
+        if os.path.exists(self.public_dir):
+            os.rename(self.public_dir, self.old_dir)
+        os.rename(self.staging_dir, self.public_dir)
+        if os.path.exists(self.old_dir):
+            shutil.rmtree(self.old_dir)
+        return self.changes
+
+    def abort(self):
+        import shutil
+
+        shutil.rmtree(self.staging_dir, ignore_errors=True)
+
+
+class MemoryOutput:
+    """
+    Collects the build output as a mapping of output path (relative to
+    `root`, with "/" separators) to bytes instead of writing it to disk.
+    """
+
+    def __init__(self, root):
+        self.root = os.path.normpath(root)
+        self.files = {}
+
+    def begin(self):
+        return self.root
+
+    def rel_path(self, dest_path):
+        return os.path.relpath(dest_path, self.root).replace(os.sep, "/")
+
+    def write(self, dest_path, data):
+        rel_path = self.rel_path(dest_path)
+        changed = self.files.get(rel_path) != data
+        self.files[rel_path] = data
+        return changed
+
+    def copy(self, from_path, dest_path, digest=None):
+        with open(from_path, "rb") as f:
+            self.files[self.rel_path(dest_path)] = f.read()
+        return dest_path
+
+    def keep(self, dest_path):
+        return self.rel_path(dest_path) in self.files
+
+    def commit(self):
+        pass
+
+    def abort(self):
+        self.files.clear()
+
+
+def diff_manifests(old_manifest, new_manifest):
+    return {
+        "added": sorted(path for path in new_manifest if path not in old_manifest),
+        "changed": sorted(
+            path
+            for path, digest in new_manifest.items()
+            if path in old_manifest and old_manifest[path] != digest
+        ),
+        "removed": sorted(path for path in old_manifest if path not in new_manifest),
+    }
+
+
+def load_manifest(path):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def write_json_file(dest_path, data):
+    text = json.dumps(data, indent=1, sort_keys=True)
+    write_file(dest_path, text.encode("utf-8"))
+
+
+def hash_bytes(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def hash_file(path):
+    with open(path, "rb") as f:
+        return hash_bytes(f.read())
+
+
+def write_file(dest_path, data):
+    if same_contents(dest_path, data):
+        return False
+    dest_dir_path = os.path.dirname(dest_path)
+    if dest_dir_path != "":
+        os.makedirs(dest_dir_path, exist_ok=True)
+    with open(dest_path, "wb") as f:
+        f.write(data)
+    return True
+
+
+def copy_file(from_path, dest_path):
+    import shutil
+
+    dest_dir_path = os.path.dirname(dest_path)
+    if dest_dir_path != "":
+        os.makedirs(dest_dir_path, exist_ok=True)
+    return shutil.copy(from_path, dest_path)
+
+
+def keep_file(dest_path):
+    return os.path.exists(dest_path)
+
+
+def same_contents(path, data):
+    try:
+        if os.path.getsize(path) != len(data):
+            return False
+        with open(path, "rb") as f:
+            return f.read() == data
+    except OSError:
+        return False
+
+
+def is_up_to_date(prev_path, from_path):
+    try:
+        prev_stat = os.stat(prev_path)
+        from_stat = os.stat(from_path)
+    except OSError:
+        return False
+    return (
+        prev_stat.st_size == from_stat.st_size
+        and prev_stat.st_mtime >= from_stat.st_mtime
+    )
+
+
+def link_file(prev_path, dest_path):
+    dest_dir_path = os.path.dirname(dest_path)
+    if dest_dir_path != "":
+        os.makedirs(dest_dir_path, exist_ok=True)
+    try:
+        os.link(prev_path, dest_path)
+    except OSError:
+        return False
+    return True
@@ -0,0 +1,154 @@
+import io
+import json
+import os
+import socket
+import socketserver
+import time
+import traceback
+from contextlib import redirect_stderr, redirect_stdout
+
+import main
+from iopool import IOPool
+
+
+class BuildServer:
+    """
+    Long-running build process listening on a Unix socket.
+
+    Each request is the argument list of one `python3 src` command,
+    which is parsed and built in this process, one at a time. Modules
+    stay imported and the I/O pool's threads stay up between builds;
+    each build's Site starts with fresh in-memory caches, but reuses
+    highlighted code from the cache directory.
+    Build output is streamed back as it is printed.
+
+    Messages are JSON lines. The client sends {"argv": [...], "cwd":
+    path}; the server replies with {"output": text} lines and a final
+    {"status": code, "elapsed": seconds}.
+    """
+
+    def __init__(self, socket_path, parser, run=main.run):
+        self.socket_path = socket_path
+        self.parser = parser
+        self.run = run
+        self.cwd = os.getcwd()
+        self.io_pool = None
+        self.server = None
+
+    def serve(self):
+        remove_stale_socket(self.socket_path)
+        os.makedirs(os.path.dirname(self.socket_path) or ".", exist_ok=True)
+        self.server = socketserver.UnixStreamServer(self.socket_path, BuildRequestHandler)
+        self.server.build_server = self
+        self.io_pool = IOPool()
+        print(f"Serving builds on {self.socket_path}")
+        try:
+            self.server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.server.server_close()
+            self.io_pool.close()
+            os.remove(self.socket_path)
+
+    def shutdown(self):
+        self.server.shutdown()
+
+    def build(self, request):
+        """
+        Run one build request with output redirected to the client,
+        and return its exit status.
+        """
+        if request.get("cwd") != self.cwd:
+            print(f"build server runs in {self.cwd}, not {request.get('cwd')}")
+            return 1
+        try:
+            args = self.parser.parse_args(request["argv"])
+            if args.daemon:
+                self.parser.error("--daemon can't be sent to a build server")
+            self.run(self.parser, args, self.io_pool)
+        except SystemExit as e:
+            if e.code is None or isinstance(e.code, int):
+                return e.code or 0
+            print(e.code)
+            return 1
+        except Exception:
+            traceback.print_exc()
+            return 1
+        return 0
+
+
+class BuildRequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        try:
+            request = json.loads(self.rfile.readline())
+        except ValueError:
+            return
+        start = time.perf_counter()
+        output = MessageWriter(self.wfile)
+        with redirect_stdout(output), redirect_stderr(output):
+            status = self.server.build_server.build(request)
+            output.flush()
+        try:
+            send_message(self.wfile, {"status": status, "elapsed": time.perf_counter() - start})
+        except OSError:
+            pass
+
+
+class MessageWriter(io.TextIOBase):
+    """
+    Text stream that sends each complete line as an {"output": text}
+    message. A client that went away stops getting output, but the
+    build runs to the end.
+    """
+
+    def __init__(self, wfile):
+        self.wfile = wfile
+        self.buffer = ""
+        self.closed_by_client = False
+
+    def writable(self):
+        return True
+
+    def write(self, text):
+        self.buffer += text
+        if "\n" in self.buffer:
+            lines, _, self.buffer = self.buffer.rpartition("\n")
+            self.send(lines + "\n")
+        return len(text)
+
+    def flush(self):
+        if self.buffer:
+            text, self.buffer = self.buffer, ""
+            self.send(text)
+
+    def send(self, text):
+        if self.closed_by_client:
+            return
+        try:
+            send_message(self.wfile, {"output": text})
+        except OSError:
+            self.closed_by_client = True
+
+
+def send_message(wfile, message):
+    wfile.write(json.dumps(message).encode("utf-8") + b"\n")
+    wfile.flush()
+
+
+def remove_stale_socket(socket_path):
+    """
+    Remove a socket left behind by a build server that is no longer
+    running; refuse to start if one still answers.
+    """
+    if not os.path.exists(socket_path):
+        return
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        client.connect(socket_path)
+    except OSError:
+        os.remove(socket_path)
+        return
+    finally:
+        client.close()
+    raise ValueError(f"a build server is already running on {socket_path}")
@@ -0,0 +1,179 @@
+import os
+import re
+from urllib.parse import unquote, urljoin, urlsplit
+
+from discovery import default_ignore, find_files, page_include
+from frontmatter import read_metadata
+from gencontent import page_dest_path
+from highlight import HighlightCache, current_highlight_cache
+from listing import default_per_page, listing_page_count, listing_page_url, plan_listings
+from markdown_blocks import BlockType, block_to_block_type, block_to_html_node
+from pageindex import PageIndex, page_url
+from toc import TableOfContents
+
+
+DEEP_HEADING_RE = re.compile(r"#{7,}\s")
+UNSPACED_HEADING_RE = re.compile(r"#{1,6}[^#\s]")
+
+# Below this many pages the process pool costs more than it saves.
+parallel_min_pages = 64
+
+
+def check_site(
+    content_dir,
+    static_dir,
+    public_dir,
+    blog_dir="blog",
+    per_page=default_per_page,
+    page_include=page_include,
+    ignore=default_ignore,
+    workers=None,
+):
+    """
+    Validate every content page the way a build would parse it, without
+    serializing HTML or writing anything, and return the errors as a
+    sorted list of (path, line, message).
+
+    Besides parse errors this reports pages without a title, lines that
+    look like headings but aren't, and internal links and images that
+    point at no page, listing or static file the build would produce.
+    """
+    sources = find_files(content_dir, page_include, ignore)
+    # Highlighting still runs, since it can fail, but into a cache that
+    # is never written to disk.
+    token = current_highlight_cache.set(HighlightCache())
+    try:
+        results = check_pages([entry.path for _, entry in sources], workers)
+    finally:
+        current_highlight_cache.reset(token)
+
+    errors = []
+    page_index = PageIndex(public_dir)
+    checked = []
+    for (rel_path, entry), (metadata, page_errors, links) in zip(sources, results):
+        errors.extend((entry.path, line, message) for line, message in page_errors)
+        if metadata is None:
+            continue
+        dest_path = page_dest_path(public_dir, rel_path)
+        if not metadata.get("draft"):
+            page_index.add(entry.path, dest_path, metadata, entry.stat().st_mtime)
+        checked.append((entry.path, page_url(dest_path, public_dir, "/"), links))
+
+    targets = {page["path"] for page in page_index.pages.values()}
+    targets.add("/sitemap.xml")
+    targets.add(f"/{blog_dir}/feed.xml")
+    for rel_path, _ in find_files(static_dir, ignore=ignore):
+        targets.add("/" + rel_path)
+    try:
+        listings = plan_listings(
+            page_index,
+            os.path.join(content_dir, blog_dir),
+            os.path.join(public_dir, blog_dir),
+            "",
+        )
+    except ValueError as e:
+        errors.append((os.path.join(content_dir, blog_dir), 1, str(e)))
+        listings = []
+    for _, listing_path, _, pages in listings:
+        for number in range(1, listing_page_count(pages, per_page) + 1):
+            targets.add(listing_page_url(listing_path, number))
+
+    for from_path, path, links in checked:
+        for line, url in links:
+            target = link_target(path, url)
+            if target is not None and not link_exists(target, targets):
+                errors.append((from_path, line, f"broken link: {url}"))
+    errors.sort()
+    return errors
+
+
+def check_pages(from_paths, workers=None):
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 1 or len(from_paths) < parallel_min_pages:
+        return [check_page(from_path) for from_path in from_paths]
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(workers) as executor:
+        return list(executor.map(check_page, from_paths, chunksize=16))
+
+
+def check_page(from_path):
+    """
+    Parse one content file into its node tree, block by block. Returns
+    its metadata (None if unreadable), its errors as (line, message)
+    and the URLs it links to as (line, url).
+    """
+    try:
+        metadata = read_metadata(from_path)
+        with open(from_path, "rb") as f:
+            data = f.read()
+        body = data[metadata["body_offset"] :].decode("utf-8")
+    except ValueError as e:
+        return None, [(1, str(e))], []
+    first_line = data.count(b"\n", 0, metadata["body_offset"]) + 1
+
+    errors = []
+    links = []
+    if "title" not in metadata:
+        errors.append((first_line, "no title found"))
+    toc = TableOfContents()
+    for line, block in numbered_blocks(body, first_line):
+        if block_to_block_type(block) == BlockType.PARAGRAPH:
+            if DEEP_HEADING_RE.match(block):
+                errors.append((line, "invalid heading level, at most 6 #s"))
+            elif UNSPACED_HEADING_RE.match(block):
+                errors.append((line, "invalid heading, no space after #"))
+        try:
+            node = block_to_html_node(block, toc)
+        except ValueError as e:
+            errors.append((line, str(e)))
+            continue
+        for url in node_links(node):
+            offset = max(block.find(f"]({url}"), 0)
+            links.append((line + block.count("\n", 0, offset), url))
+    return metadata, errors, links
+
+
+def numbered_blocks(markdown, first_line=1):
+    """
+    Yield (line, block) for the blocks markdown_to_blocks() returns,
+    with the line number each block starts on.
+    """
+    line = first_line
+    for block in markdown.split("\n\n"):
+        if block != "":
+            stripped = block.strip()
+            leading = len(block) - len(block.lstrip())
+            yield line + block.count("\n", 0, leading), stripped
+        line += block.count("\n") + 2
+
+
+def node_links(node):
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        if node.children:
+            stack.extend(reversed(node.children))
+        elif node.props:
+            if node.tag == "a" and "href" in node.props:
+                yield node.props["href"]
+            elif node.tag == "img" and "src" in node.props:
+                yield node.props["src"]
+
+
+def link_target(page_path, url):
+    """
+    Return the root-relative path an internal link on the page at
+    `page_path` points at, or None for external and fragment links.
+    """
+    parts = urlsplit(url)
+    if parts.scheme or parts.netloc or parts.path == "":
+        return None
+    return unquote(urljoin(page_path, parts.path))
+
+
+def link_exists(target, targets):
+    if target.endswith("/index.html"):
+        target = target[: -len("index.html")]
+    return target in targets or target + "/" in targets or target + ".html" in targets
@@ -1,16 +1,13 @@
-import os
-import shutil
-
-
-def copy_files_recursive(source_dir_path, dest_dir_path):
-    if not os.path.exists(dest_dir_path):
-        os.mkdir(dest_dir_path)
-
-    for filename in os.listdir(source_dir_path):
-        from_path = os.path.join(source_dir_path, filename)
-        dest_path = os.path.join(dest_dir_path, filename)
-        print(f" * {from_path} -> {dest_path}")
-        if os.path.isfile(from_path):
-            shutil.copy(from_path, dest_path)
-        else:
-            copy_files_recursive(from_path, dest_path)
+import os
+
+from buildoutput import copy_file
+from discovery import find_files
+
+
+def copy_files_recursive(source_dir_path, dest_dir_path, copy_file=copy_file, sources=None, log=print):
+    if sources is None:
+        sources = find_files(source_dir_path)
+    for rel_path, entry in sources:
+        dest_path = os.path.join(dest_dir_path, *rel_path.split("/"))
+        log(f" * {entry.path} -> {dest_path}")
+        copy_file(entry.path, dest_path)
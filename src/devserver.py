@@ -0,0 +1,220 @@
+import os
+import sys
+import threading
+from collections import OrderedDict
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from frontmatter import read_metadata
+from gencontent import page_template_path, read_body, read_template, render_page
+from images import image_sizes
+from livereload import LiveReload, endpoint, send_events
+
+
+dir_path_static = "./static"
+dir_path_content = "./content"
+template_path = "./template.html"
+default_port = 8888
+default_cache_size = 256
+
+
+class PageCache:
+    """
+    Bounded LRU of rendered pages keyed by source path.
+
+    An entry is only reused while the source and template mtimes it was
+    rendered from are unchanged, so edits show up on the next request.
+    `on_evict` is called with the source path of each evicted entry.
+    """
+
+    def __init__(self, max_size=default_cache_size, on_evict=None):
+        self.max_size = max_size
+        self.on_evict = on_evict
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, from_path):
+        with self.lock:
+            entry = self.entries.get(from_path)
+            if entry is not None:
+                self.entries.move_to_end(from_path)
+            return entry
+
+    def set(self, from_path, entry):
+        evicted = []
+        with self.lock:
+            self.entries[from_path] = entry
+            self.entries.move_to_end(from_path)
+            while len(self.entries) > self.max_size:
+                evicted.append(self.entries.popitem(last=False)[0])
+        if self.on_evict is not None:
+            for evicted_path in evicted:
+                self.on_evict(evicted_path)
+
+
+class DevServer:
+    """
+    Renders pages from the content directory on request.
+
+    With `live_reload`, pages get a script that subscribes to their
+    changes; saving a source file re-renders only its changed blocks
+    and patches them into the open page. Live documents are dropped
+    along with their page's cache entry.
+    """
+
+    def __init__(
+        self,
+        dir_path_content=dir_path_content,
+        dir_path_static=dir_path_static,
+        template_path=template_path,
+        cache_size=default_cache_size,
+        live_reload=False,
+    ):
+        self.dir_path_content = dir_path_content
+        self.dir_path_static = dir_path_static
+        self.template_path = template_path
+        self.live_reload = None
+        on_evict = None
+        if live_reload:
+            self.live_reload = LiveReload(template_path=template_path)
+            on_evict = self.live_reload.forget
+        self.cache = PageCache(cache_size, on_evict)
+        image_sizes.static_dir = dir_path_static
+
+    def content_path(self, url_path):
+        """
+        Map a request path back to the markdown file that renders it, the
+        same way generate_pages_recursive maps sources to outputs.
+        """
+        rel_path = unquote(urlsplit(url_path).path).lstrip("/")
+        if ".." in rel_path.split("/"):
+            return None
+        if rel_path == "" or rel_path.endswith("/"):
+            rel_path += "index.html"
+        root, ext = os.path.splitext(rel_path)
+        if ext == "":
+            candidates = [os.path.join(rel_path, "index.md"), rel_path + ".md"]
+        elif ext == ".html":
+            candidates = [root + ".md"]
+        else:
+            return None
+        for candidate in candidates:
+            from_path = os.path.join(self.dir_path_content, candidate)
+            if os.path.isfile(from_path):
+                return from_path
+        return None
+
+    def render(self, from_path):
+        source_mtime = os.stat(from_path).st_mtime_ns
+        entry = self.cache.get(from_path)
+        if entry is not None:
+            cached_mtime, page_template, template_mtime, page = entry
+            if (
+                cached_mtime == source_mtime
+                and os.stat(page_template).st_mtime_ns == template_mtime
+            ):
+                return page
+        metadata = read_metadata(from_path)
+        page_template = page_template_path(self.template_path, metadata)
+        template_mtime = os.stat(page_template).st_mtime_ns
+        print(f" * rendering {from_path}")
+        template = read_template(page_template)
+        markdown = read_body(from_path, metadata)
+        if self.live_reload is None:
+            html, _, _ = render_page(markdown, template, metadata, "/")
+        else:
+            html = self.live_reload.render(
+                from_path, markdown, metadata, template, (source_mtime, template_mtime), page_template
+            )
+        page = html.encode("utf-8")
+        self.cache.set(from_path, (source_mtime, page_template, template_mtime, page))
+        return page
+
+    def serve(self, port=default_port):
+        handler = partial(DevRequestHandler, self, directory=self.dir_path_static)
+        httpd = ThreadingHTTPServer(("", port), handler)
+        print(f"Serving {self.dir_path_content} on http://localhost:{port}/")
+        if self.live_reload is not None:
+            self.live_reload.start()
+        try:
+            httpd.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            if self.live_reload is not None:
+                self.live_reload.stop()
+            httpd.server_close()
+
+
+class DevRequestHandler(SimpleHTTPRequestHandler):
+    def __init__(self, dev_server, *args, **kwargs):
+        self.dev_server = dev_server
+        super().__init__(*args, **kwargs)
+
+    def do_GET(self):
+        if urlsplit(self.path).path == endpoint and self.dev_server.live_reload is not None:
+            self.send_live_events()
+        elif not self.send_page():
+            super().do_GET()
+
+    def do_HEAD(self):
+        if not self.send_page(head=True):
+            super().do_HEAD()
+
+    def send_page(self, head=False):
+        url_path = urlsplit(self.path).path
+        from_path = self.dev_server.content_path(url_path)
+        if from_path is None:
+            return False
+        is_dir_path = os.path.splitext(url_path)[1] == "" and not url_path.endswith("/")
+        if is_dir_path and os.path.basename(from_path) == "index.md":
+            self.send_response(301)
+            self.send_header("Location", url_path + "/")
+            self.end_headers()
+            return True
+        try:
+            page = self.dev_server.render(from_path)
+        except ValueError as e:
+            self.send_error(500, f"{from_path}: {e}")
+            return True
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(page)))
+        self.end_headers()
+        if not head:
+            self.wfile.write(page)
+        return True
+
+
+    def send_live_events(self):
+        query = parse_qs(urlsplit(self.path).query)
+        from_path = self.dev_server.content_path(query.get("page", [""])[0])
+        if from_path is None:
+            self.send_error(404)
+            return
+        try:
+            version = int(query.get("version", ["0"])[0])
+        except ValueError:
+            version = 0
+        live_reload = self.dev_server.live_reload
+        subscriber = live_reload.subscribe(from_path, version)
+        try:
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Cache-Control", "no-cache")
+            self.end_headers()
+            send_events(self.wfile, subscriber)
+        finally:
+            live_reload.unsubscribe(from_path, subscriber)
+
+
+def main():
+    port = default_port
+    if len(sys.argv) > 1:
+        port = int(sys.argv[1])
+    DevServer(live_reload=True).serve(port)
+
+
+if __name__ == "__main__":
+    main()
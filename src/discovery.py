@@ -0,0 +1,101 @@
+import os
+import re
+
+
+default_ignore = ["*:Zone.Identifier", ".DS_Store", "Thumbs.db", "*~"]
+page_include = ["*.md"]
+
+
+class PathPatterns:
+    """
+    A list of .gitignore-style globs.
+
+    A pattern without a "/" matches a file or directory name at any
+    depth; one with a "/" is anchored to the root being walked. A
+    trailing "/" only matches directories, "**" matches across
+    directories, and a leading "!" re-includes a path an earlier
+    pattern matched. The last matching pattern wins.
+    """
+
+    def __init__(self, patterns=()):
+        self.rules = [compile_pattern(pattern) for pattern in patterns if pattern.strip()]
+
+    def __bool__(self):
+        return bool(self.rules)
+
+    def matches(self, rel_path, is_dir=False):
+        matched = False
+        for regex, negated, dir_only in self.rules:
+            if dir_only and not is_dir:
+                continue
+            if regex.match(rel_path):
+                matched = not negated
+        return matched
+
+
+def compile_pattern(pattern):
+    pattern = pattern.strip()
+    negated = pattern.startswith("!")
+    if negated:
+        pattern = pattern[1:]
+    dir_only = pattern.endswith("/")
+    pattern = pattern.rstrip("/")
+    anchored = "/" in pattern
+    pattern = pattern.lstrip("/")
+
+    parts = []
+    i = 0
+    while i < len(pattern):
+        if pattern.startswith("**/", i):
+            parts.append("(?:.*/)?")
+            i += 3
+        elif pattern.startswith("**", i):
+            parts.append(".*")
+            i += 2
+        elif pattern[i] == "*":
+            parts.append("[^/]*")
+            i += 1
+        elif pattern[i] == "?":
+            parts.append("[^/]")
+            i += 1
+        elif pattern[i] == "[" and "]" in pattern[i + 2 :]:
+            end = pattern.index("]", i + 2)
+            char_class = pattern[i + 1 : end]
+            if char_class.startswith("!"):
+                char_class = "^" + char_class[1:]
+            parts.append(f"[{char_class}]")
+            i = end + 1
+        else:
+            parts.append(re.escape(pattern[i]))
+            i += 1
+    prefix = "" if anchored else "(?:.*/)?"
+    return re.compile(f"{prefix}{''.join(parts)}$", re.DOTALL), negated, dir_only
+
+
+def find_files(root, include=None, ignore=default_ignore):
+    """
+    Walk `root` with os.scandir and return a list of (rel_path, entry)
+    pairs sorted by rel_path, where rel_path uses "/" separators and
+    entry is the os.DirEntry, whose stat() result is cached.
+
+    Ignored directories are not descended into. With `include` set, only
+    files matching one of its patterns are returned.
+    """
+    include = PathPatterns(include or ())
+    ignore = PathPatterns(ignore or ())
+    files = []
+    pending = [("", root)]
+    while pending:
+        rel_dir, dir_path = pending.pop()
+        with os.scandir(dir_path) as entries:
+            for entry in entries:
+                rel_path = rel_dir + entry.name
+                is_dir = entry.is_dir()
+                if ignore.matches(rel_path, is_dir):
+                    continue
+                if is_dir:
+                    pending.append((rel_path + "/", entry.path))
+                elif not include or include.matches(rel_path):
+                    files.append((rel_path, entry))
+    files.sort(key=lambda item: item[0])
+    return files
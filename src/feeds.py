@@ -0,0 +1,68 @@
+from html import escape
+
+from buildoutput import write_file
+from pageindex import iso_date, page_updated
+
+
+def write_sitemap(page_index, dest_path, site_url, write_file=write_file):
+    """
+    Write the sitemap of every page. `site_url` must be absolute, since
+    sitemap <loc> values can't be relative.
+    """
+    lines = [
+        '<?xml version="1.0" encoding="UTF-8"?>',
+        '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">',
+    ]
+    for page in page_index.sorted_pages():
+        lines.append(
+            f"  <url><loc>{escape(site_url + page['url'], quote=False)}</loc>"
+            f"<lastmod>{iso_date(page['mtime'])}</lastmod></url>"
+        )
+    lines.append("</urlset>")
+    return write_file(dest_path, ("\n".join(lines) + "\n").encode("utf-8"))
+
+
+def write_atom_feed(
+    page_index,
+    dir_path_content,
+    dest_path,
+    feed_url,
+    title,
+    author,
+    site_url,
+    write_file=write_file,
+):
+    """
+    Write an Atom feed of the pages under `dir_path_content`, newest
+    first. `site_url` must be absolute, since entry ids are URLs.
+    """
+    pages = page_index.pages_under(dir_path_content)
+    pages.sort(key=page_updated, reverse=True)
+    updated = max((page_updated(page) for page in pages), default=iso_date(0))
+    lines = [
+        '<?xml version="1.0" encoding="utf-8"?>',
+        '<feed xmlns="http://www.w3.org/2005/Atom">',
+        f"  <title>{escape(title, quote=False)}</title>",
+        f"  <id>{escape(site_url + feed_url, quote=False)}</id>",
+        f'  <link rel="self" href="{escape_attr(site_url + feed_url)}"/>',
+        f"  <updated>{updated}</updated>",
+        f"  <author><name>{escape(author, quote=False)}</name></author>",
+    ]
+    for page in pages:
+        url = escape_attr(site_url + page["url"])
+        lines.extend(
+            [
+                "  <entry>",
+                f"    <title>{escape(page['title'], quote=False)}</title>",
+                f'    <link href="{url}"/>',
+                f"    <id>{url}</id>",
+                f"    <updated>{page_updated(page)}</updated>",
+                "  </entry>",
+            ]
+        )
+    lines.append("</feed>")
+    return write_file(dest_path, ("\n".join(lines) + "\n").encode("utf-8"))
+
+
+def escape_attr(value):
+    return escape(value, quote=True)
@@ -0,0 +1,16 @@
+import os
+
+
+def write_fixture(path, data, mtime=None):
+    """
+    Write a file for a test, creating its directory, and set its mtime
+    if given. `data` is text or bytes. Returns `path`.
+    """
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    with open(path, "wb") as f:
+        f.write(data)
+    if mtime is not None:
+        os.utime(path, (mtime, mtime))
+    return path
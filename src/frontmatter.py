@@ -0,0 +1,71 @@
+FRONT_MATTER_FENCE = "---"
+max_front_matter_lines = 64
+
+# Fields the build uses as text, and as true/false.
+STRING_FIELDS = ("title", "date", "template")
+BOOL_FIELDS = ("draft",)
+
+
+def read_metadata(path):
+    """
+    Read a content file's metadata without parsing its body.
+
+    Only the front matter lines are read, plus the lines up to the first
+    "# " heading when the front matter has no title. "body_offset" is the
+    byte offset where the markdown body starts.
+    """
+    metadata = {}
+    body_offset = 0
+    with open(path, "rb") as f:
+        if f.readline().decode("utf-8").rstrip() == FRONT_MATTER_FENCE:
+            header_lines = []
+            for _ in range(max_front_matter_lines):
+                line = f.readline().decode("utf-8")
+                if line.rstrip() == FRONT_MATTER_FENCE:
+                    body_offset = f.tell()
+                    break
+                header_lines.append(line)
+            if body_offset == 0:
+                raise ValueError(f"invalid front matter in {path}, closing --- not found")
+            metadata = parse_metadata_lines(header_lines)
+            for key in STRING_FIELDS:
+                if key in metadata and not isinstance(metadata[key], str):
+                    raise ValueError(f"invalid front matter in {path}, {key} must be a string")
+            for key in BOOL_FIELDS:
+                if key in metadata and not isinstance(metadata[key], bool):
+                    raise ValueError(f"invalid front matter in {path}, {key} must be true or false")
+        else:
+            f.seek(0)
+        if "title" not in metadata:
+            for line in f:
+                line = line.decode("utf-8").rstrip("\n")
+                if line.startswith("# "):
+                    metadata["title"] = line[2:]
+                    break
+    metadata["body_offset"] = body_offset
+    return metadata
+
+
+def parse_metadata_lines(lines):
+    metadata = {}
+    for line in lines:
+        line = line.strip()
+        if line == "" or line.startswith("#"):
+            continue
+        key, sep, value = line.partition(":")
+        if sep == "":
+            raise ValueError(f"invalid front matter line: {line}")
+        metadata[key.strip()] = parse_value(value.strip())
+    return metadata
+
+
+def parse_value(value):
+    if value.startswith("[") and value.endswith("]"):
+        return [parse_value(item.strip()) for item in value[1:-1].split(",") if item.strip()]
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in "\"'":
+        return value[1:-1]
+    if value.lower() in ("true", "yes"):
+        return True
+    if value.lower() in ("false", "no"):
+        return False
+    return value
@@ -1,53 +1,193 @@
-import os
-from pathlib import Path
-from markdown_blocks import markdown_to_html_node
-
-
-def generate_pages_recursive(dir_path_content, template_path, dest_dir_path, basepath):
-    for filename in os.listdir(dir_path_content):
-        from_path = os.path.join(dir_path_content, filename)
-        dest_path = os.path.join(dest_dir_path, filename)
-        if os.path.isfile(from_path):
-            dest_path = Path(dest_path).with_suffix(".html")
-            generate_page(from_path, template_path, dest_path, basepath)
-        else:
-            generate_pages_recursive(from_path, template_path, dest_path, basepath)
-
-
-def generate_page(from_path, template_path, dest_path, basepath):
-    print(f" * {from_path} {template_path} -> {dest_path}")
-    from_file = open(from_path, "r")
-    markdown_content = from_file.read()
-    from_file.close()
-
-    template_file = open(template_path, "r")
-    template = template_file.read()
-    template_file.close()
-
-    node = markdown_to_html_node(markdown_content)
-    html = node.to_html()
-
-    title = extract_title(markdown_content)
-    template = template.replace("{{ Title }}", title)
-    template = template.replace("{{ Content }}", html)
-
-    template = template.replace('href="/', f'href="{basepath}')
-    template = template.replace('src="/', f'src="{basepath}')
-    template = template.replace('href=\'/', f'href=\'{basepath}')
-    template = template.replace('src=\'/', f'src=\'{basepath}')
-
-    print("after replace ", template)
-
-    dest_dir_path = os.path.dirname(dest_path)
-    if dest_dir_path != "":
-        os.makedirs(dest_dir_path, exist_ok=True)
-    to_file = open(dest_path, "w")
-    to_file.write(template)
-
-
-def extract_title(md):
-    lines = md.split("\n")
-    for line in lines:
-        if line.startswith("# "):
-            return line[2:]
-    raise ValueError("no title found")
+import os
+import re
+import zlib
+from buildoutput import write_file
+from discovery import find_files, page_include
+from frontmatter import read_metadata
+from htmlnode import escape_text
+from inlinecss import current_css_inliner
+from iopool import IOPool
+from markdown_blocks import markdown_to_html_node
+from toc import TableOfContents
+
+
+TITLE_RE = re.compile(r"^# (.*)$", re.MULTILINE)
+
+
+def generate_pages_recursive(
+    dir_path_content,
+    template_path,
+    dest_dir_path,
+    basepath,
+    search_index=None,
+    page_index=None,
+    write_file=write_file,
+    io_pool=None,
+    shard=None,
+    sources=None,
+    memory_report=None,
+    log=print,
+):
+    """
+    Render every page under dir_path_content, or the (rel_path, entry)
+    work list from discovery.find_files() given as `sources`.
+
+    Metadata is scanned first so drafts are dropped before their bodies
+    are read. Bodies are then prefetched and output written on io_pool,
+    overlapping file I/O with rendering.
+
+    With `shard` set to (index, count) only the pages in_shard() assigns
+    to it are rendered; every page is still added to page_index and
+    reserved in search_index so site-wide output and search page ids
+    are the same in every shard.
+
+    With a memstats.MemoryReport as `memory_report`, each page's
+    rendering is measured into it. Progress goes to `log`.
+    """
+    if io_pool is None:
+        with IOPool() as io_pool:
+            return generate_pages_recursive(
+                dir_path_content,
+                template_path,
+                dest_dir_path,
+                basepath,
+                search_index,
+                page_index,
+                write_file,
+                io_pool,
+                shard,
+                sources,
+                memory_report,
+                log,
+            )
+
+    if sources is None:
+        sources = find_files(dir_path_content, page_include)
+    all_metadata = io_pool.map(read_metadata, [entry.path for _, entry in sources])
+    render_list = []
+    for (rel_path, entry), metadata in zip(sources, all_metadata):
+        from_path = entry.path
+        dest_path = page_dest_path(dest_dir_path, rel_path)
+        if metadata.get("draft"):
+            log(f" * skipping draft {from_path}")
+            continue
+        if page_index is not None:
+            page_index.add(from_path, dest_path, metadata, entry.stat().st_mtime)
+        if search_index is not None:
+            search_index.reserve_page(dest_path)
+        if not in_shard(rel_path, shard):
+            continue
+        render_list.append((from_path, dest_path, metadata))
+
+    templates = {}
+    bodies = io_pool.prefetch(lambda page: read_body(page[0], page[2]), render_list)
+    for (from_path, dest_path, metadata), markdown_content in zip(render_list, bodies):
+        page_template = page_template_path(template_path, metadata)
+        if page_template not in templates:
+            templates[page_template] = read_template(page_template)
+        log(f" * {from_path} {page_template} -> {dest_path}")
+        render_args = (markdown_content, templates[page_template], metadata, basepath)
+        if memory_report is None:
+            html, title, node = render_page(*render_args)
+        else:
+            html, title, node = memory_report.measure(from_path, render_page, *render_args)
+        if search_index is not None:
+            search_index.add_page(dest_path, title, node)
+        io_pool.submit(write_file, dest_path, html.encode("utf-8"))
+    io_pool.wait()
+
+
+def page_dest_path(dest_dir_path, rel_path):
+    rel_path = os.path.splitext(rel_path)[0] + ".html"
+    return os.path.join(dest_dir_path, *rel_path.split("/"))
+
+
+def in_shard(rel_path, shard):
+    """
+    Deterministically assign a content path to one of `count` shards.
+
+    The shard depends only on the path itself, so adding or removing
+    other files never moves a page to a different shard.
+    """
+    if shard is None:
+        return True
+    index, count = shard
+    rel_path = rel_path.replace(os.sep, "/")
+    return zlib.crc32(rel_path.encode("utf-8")) % count == index - 1
+
+
+def generate_page(
+    from_path,
+    template_path,
+    dest_path,
+    basepath,
+    search_index=None,
+    write_file=write_file,
+    metadata=None,
+):
+    if metadata is None:
+        metadata = read_metadata(from_path)
+    template_path = page_template_path(template_path, metadata)
+    print(f" * {from_path} {template_path} -> {dest_path}")
+    markdown_content = read_body(from_path, metadata)
+
+    template = read_template(template_path)
+
+    template, title, node = render_page(markdown_content, template, metadata, basepath)
+    if search_index is not None:
+        search_index.add_page(dest_path, title, node)
+
+    write_file(dest_path, template.encode("utf-8"))
+
+
+def render_page(markdown_content, template, metadata, basepath):
+    toc = TableOfContents()
+    node = markdown_to_html_node(markdown_content, toc)
+    html = node.to_html()
+
+    title = metadata.get("title")
+    if title is None:
+        title = extract_title(markdown_content)
+
+    toc_html = ""
+    if "{{ TOC }}" in template:
+        toc_node = toc.to_html_node()
+        if toc_node is not None:
+            toc_html = toc_node.to_html()
+    return render_template(template, title, html, basepath, toc_html), title, node
+
+
+def page_template_path(template_path, metadata):
+    if "template" in metadata:
+        return os.path.join(os.path.dirname(template_path), metadata["template"])
+    return template_path
+
+
+def read_body(from_path, metadata):
+    with open(from_path, "rb") as from_file:
+        from_file.seek(metadata["body_offset"])
+        return from_file.read().decode("utf-8")
+
+
+def read_template(template_path):
+    with open(template_path, "r", encoding="utf-8") as template_file:
+        return current_css_inliner.get().apply(template_file.read())
+
+
+def render_template(template, title, html, basepath, toc_html=""):
+    template = template.replace("{{ Title }}", escape_text(title))
+    template = template.replace("{{ TOC }}", toc_html)
+    template = template.replace("{{ Content }}", html)
+
+    template = template.replace('href="/', f'href="{basepath}')
+    template = template.replace('src="/', f'src="{basepath}')
+    template = template.replace('href=\'/', f'href=\'{basepath}')
+    template = template.replace('src=\'/', f'src=\'{basepath}')
+    return template
+
+
+def extract_title(md):
+    match = TITLE_RE.search(md)
+    if match is None:
+        raise ValueError("no title found")
+    return match.group(1)
@@ -0,0 +1,181 @@
+import contextvars
+import hashlib
+import html
+import os
+import re
+
+
+class Lexer:
+    """
+    Regex lexer: `rules` is a list of (token class, pattern) pairs tried
+    left to right at each position. Text no rule matches is emitted as a
+    plain, unclassed token.
+
+    Bump `version` when the rules change so cached output is invalidated.
+    """
+
+    name = None
+    version = 1
+    rules = []
+
+    def __init__(self):
+        self.classes = [token_class for token_class, _ in self.rules]
+        self.pattern = None
+
+    def tokenize(self, code):
+        if self.pattern is None:
+            self.pattern = re.compile(
+                "|".join(f"({pattern})" for _, pattern in self.rules), re.MULTILINE
+            )
+        cursor = 0
+        for match in self.pattern.finditer(code):
+            if match.start() == match.end():
+                continue
+            if match.start() > cursor:
+                yield None, code[cursor : match.start()]
+            yield self.classes[match.lastindex - 1], match.group()
+            cursor = match.end()
+        if cursor < len(code):
+            yield None, code[cursor:]
+
+
+class PythonLexer(Lexer):
+    name = "python"
+    rules = [
+        ("comment", r"#[^\n]*"),
+        ("string", r'[rbfuRBFU]{0,2}(?:"""[\s\S]*?"""|\'\'\'[\s\S]*?\'\'\')'),
+        ("string", r'[rbfuRBFU]{0,2}(?:"(?:\\.|[^"\\\n])*"|\'(?:\\.|[^\'\\\n])*\')'),
+        ("decorator", r"^[ \t]*@[\w.]+"),
+        (
+            "keyword",
+            r"\b(?:False|None|True|and|as|assert|async|await|break|class|continue"
+            r"|def|del|elif|else|except|finally|for|from|global|if|import|in|is"
+            r"|lambda|match|case|nonlocal|not|or|pass|raise|return|try|while"
+            r"|with|yield)\b",
+        ),
+        (
+            "builtin",
+            r"\b(?:print|len|range|open|str|int|float|list|dict|set|tuple|isinstance"
+            r"|super|enumerate|zip|map|filter|sorted|min|max|self)\b",
+        ),
+        ("number", r"\b(?:0[xob][\da-fA-F_]+|\d[\d_]*\.?\d*(?:[eE][+-]?\d+)?j?)\b"),
+    ]
+
+
+class ShellLexer(Lexer):
+    name = "shell"
+    rules = [
+        ("comment", r"(?<![\w$])#[^\n]*"),
+        ("string", r"'[^']*'"),
+        ("string", r'"(?:\\.|[^"\\])*"'),
+        ("variable", r"\$(?:\{[^}\n]*\}|\w+|[@*#?$!0-9])"),
+        (
+            "keyword",
+            r"\b(?:if|then|else|elif|fi|for|while|until|do|done|case|esac|in"
+            r"|function|return|export|local)\b",
+        ),
+        ("builtin", r"\b(?:cd|echo|exit|set|unset|source|alias|read|test|eval|exec)\b"),
+        ("operator", r"&&|\|\||[|;&<>]"),
+    ]
+
+
+class JsonLexer(Lexer):
+    name = "json"
+    rules = [
+        ("key", r'"(?:\\.|[^"\\])*"(?=\s*:)'),
+        ("string", r'"(?:\\.|[^"\\])*"'),
+        ("number", r"-?\b\d+(?:\.\d+)?(?:[eE][+-]?\d+)?\b"),
+        ("keyword", r"\b(?:true|false|null)\b"),
+    ]
+
+
+LEXERS = {}
+
+
+def register_lexer(lexer, *aliases):
+    for name in (lexer.name,) + aliases:
+        LEXERS[name] = lexer
+
+
+def get_lexer(language):
+    return LEXERS.get(language.lower())
+
+
+register_lexer(PythonLexer(), "py", "python3")
+register_lexer(ShellLexer(), "sh", "bash", "zsh", "console")
+register_lexer(JsonLexer())
+
+
+class HighlightCache:
+    """
+    Highlighted HTML keyed by (language, lexer version, code hash), kept in
+    memory and, when `cache_dir` is set, on disk so later builds reuse it.
+    """
+
+    def __init__(self, cache_dir=None):
+        self.cache_dir = cache_dir
+        self.entries = {}
+
+    def get(self, key):
+        if key in self.entries:
+            return self.entries[key]
+        if self.cache_dir is None:
+            return None
+        try:
+            with open(self.key_path(key), "r", encoding="utf-8") as f:
+                highlighted = f.read()
+        except OSError:
+            return None
+        self.entries[key] = highlighted
+        return highlighted
+
+    def set(self, key, highlighted):
+        self.entries[key] = highlighted
+        if self.cache_dir is None:
+            return
+        os.makedirs(self.cache_dir, exist_ok=True)
+        # Write then rename, so concurrent builds sharing cache_dir never
+        # read a half-written entry.
+        key_path = self.key_path(key)
+        tmp_path = f"{key_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(highlighted)
+        os.replace(tmp_path, key_path)
+
+    def key_path(self, key):
+        return os.path.join(self.cache_dir, "-".join(key) + ".html")
+
+
+highlight_cache = HighlightCache()
+
+# The cache highlight() uses when none is given. A site build sets its
+# own for the build's duration, so sites built in one process don't
+# share cache directories.
+current_highlight_cache = contextvars.ContextVar("highlight_cache", default=highlight_cache)
+
+
+def highlight(code, language, cache=None):
+    """
+    Return `code` as escaped HTML with <span class="tok-..."> tokens, or
+    None when no lexer is registered for `language`.
+    """
+    if cache is None:
+        cache = current_highlight_cache.get()
+    lexer = get_lexer(language)
+    if lexer is None:
+        return None
+    digest = hashlib.sha256(code.encode("utf-8")).hexdigest()
+    key = (lexer.name, str(lexer.version), digest)
+    highlighted = cache.get(key)
+    if highlighted is not None:
+        return highlighted
+    parts = []
+    for token_class, text in lexer.tokenize(code):
+        text = html.escape(text, quote=False)
+        if token_class is None:
+            parts.append(text)
+        else:
+            parts.append(f'<span class="tok-{token_class}">{text}</span>')
+    highlighted = "".join(parts)
+    cache.set(key, highlighted)
+    return highlighted
@@ -1,53 +1,99 @@
-class HTMLNode:
-    def __init__(self, tag=None, value=None, children=None, props=None):
-        self.tag = tag
-        self.value = value
-        self.children = children
-        self.props = props
-
-    def to_html(self):
-        raise NotImplementedError("to_html method not implemented")
-
-    def props_to_html(self):
-        if self.props is None:
-            return ""
-        props_html = ""
-        for prop in self.props:
-            props_html += f' {prop}="{self.props[prop]}"'
-        return props_html
-
-    def __repr__(self):
-        return f"HTMLNode({self.tag}, {self.value}, children: {self.children}, {self.props})"
-
-
-class LeafNode(HTMLNode):
-    def __init__(self, tag, value, props=None):
-        super().__init__(tag, value, None, props)
-
-    def to_html(self):
-        if self.value is None:
-            raise ValueError("invalid HTML: no value")
-        if self.tag is None:
-            return self.value
-        return f"<{self.tag}{self.props_to_html()}>{self.value}</{self.tag}>"
-
-    def __repr__(self):
-        return f"LeafNode({self.tag}, {self.value}, {self.props})"
-
-
-class ParentNode(HTMLNode):
-    def __init__(self, tag, children, props=None):
-        super().__init__(tag, None, children, props)
-
-    def to_html(self):
-        if self.tag is None:
-            raise ValueError("invalid HTML: no tag")
-        if self.children is None:
-            raise ValueError("invalid HTML: no children")
-        children_html = ""
-        for child in self.children:
-            children_html += child.to_html()
-        return f"<{self.tag}{self.props_to_html()}>{children_html}</{self.tag}>"
-
-    def __repr__(self):
-        return f"ParentNode({self.tag}, children: {self.children}, {self.props})"
+TEXT_ESCAPES = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
+ATTR_ESCAPES = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;"})
+
+# Elements that have no content and must not get a closing tag.
+VOID_ELEMENTS = frozenset(
+    ["area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "track", "wbr"]
+)
+
+
+class HTMLNode:
+    def __init__(self, tag=None, value=None, children=None, props=None):
+        self.tag = tag
+        self.value = value
+        self.children = children
+        self.props = props
+
+    def to_html(self):
+        raise NotImplementedError("to_html method not implemented")
+
+    def props_to_html(self):
+        if not self.props:
+            return ""
+        parts = []
+        for name, value in self.props.items():
+            if value.__class__ is not str:
+                value = str(value)
+            parts.append(f' {name}="{escape_attr(value)}"')
+        return "".join(parts)
+
+    def __repr__(self):
+        return f"HTMLNode({self.tag}, {self.value}, children: {self.children}, {self.props})"
+
+
+class LeafNode(HTMLNode):
+    def __init__(self, tag, value, props=None):
+        super().__init__(tag, value, None, props)
+
+    def to_html(self):
+        tag = self.tag
+        if self.value is None:
+            raise ValueError("invalid HTML: no value")
+        if tag is None:
+            return escape_text(self.value)
+        if tag in VOID_ELEMENTS:
+            return f"<{tag}{self.props_to_html()}>"
+        return f"<{tag}{self.props_to_html()}>{escape_text(self.value)}</{tag}>"
+
+    def __repr__(self):
+        return f"LeafNode({self.tag}, {self.value}, {self.props})"
+
+
+class RawHTMLNode(LeafNode):
+    """
+    Markup that is already HTML, such as highlighted code, inserted
+    without escaping. `text` is its plain text, for the search index.
+    """
+
+    def __init__(self, html, text=None):
+        super().__init__(None, html)
+        self.text = text
+
+    def to_html(self):
+        if self.value is None:
+            raise ValueError("invalid HTML: no value")
+        return self.value
+
+    def __repr__(self):
+        return f"RawHTMLNode({self.value})"
+
+
+class ParentNode(HTMLNode):
+    def __init__(self, tag, children, props=None):
+        super().__init__(tag, None, children, props)
+
+    def to_html(self):
+        tag = self.tag
+        if tag is None:
+            raise ValueError("invalid HTML: no tag")
+        if self.children is None:
+            raise ValueError("invalid HTML: no children")
+        children_html = "".join([child.to_html() for child in self.children])
+        return f"<{tag}{self.props_to_html()}>{children_html}</{tag}>"
+
+    def __repr__(self):
+        return f"ParentNode({self.tag}, children: {self.children}, {self.props})"
+
+
+def escape_text(text):
+    # Most text has nothing to escape; the scans are much cheaper than
+    # translate(), which builds a new string.
+    if "&" in text or "<" in text or ">" in text:
+        return text.translate(TEXT_ESCAPES)
+    return text
+
+
+def escape_attr(value):
+    if "&" in value or '"' in value or "<" in value or ">" in value:
+        return value.translate(ATTR_ESCAPES)
+    return value
@@ -0,0 +1,114 @@
+import contextvars
+import os
+import struct
+from urllib.parse import unquote, urlsplit
+
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+# JPEG start-of-frame markers, which carry the image dimensions. C4, C8
+# and CC share the range but are other segments.
+JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+# Markers with no length field.
+JPEG_STANDALONE_MARKERS = frozenset(range(0xD0, 0xDA)) | {0x01}
+
+
+def image_size(path):
+    """
+    Return the (width, height) of a PNG or JPEG file read from its
+    header, or None for other or malformed files. Only the PNG IHDR
+    chunk or the JPEG segment headers up to the start-of-frame are read;
+    pixel data is never touched.
+    """
+    with open(path, "rb") as f:
+        head = f.read(24)
+        if head.startswith(PNG_SIGNATURE):
+            if head[12:16] != b"IHDR" or len(head) < 24:
+                return None
+            return struct.unpack(">II", head[16:24])
+        if head.startswith(b"\xff\xd8"):
+            f.seek(2)
+            return jpeg_size(f)
+    return None
+
+
+def jpeg_size(f):
+    while True:
+        byte = f.read(1)
+        if byte != b"\xff":
+            return None
+        marker = f.read(1)
+        # Any number of 0xFF fill bytes may precede a marker.
+        while marker == b"\xff":
+            marker = f.read(1)
+        if marker == b"":
+            return None
+        marker = marker[0]
+        if marker in JPEG_STANDALONE_MARKERS:
+            continue
+        header = f.read(2)
+        if len(header) < 2:
+            return None
+        (length,) = struct.unpack(">H", header)
+        if marker in JPEG_SOF_MARKERS:
+            frame = f.read(5)
+            if len(frame) < 5:
+                return None
+            height, width = struct.unpack(">xHH", frame)
+            return width, height
+        if marker == 0xDA or length < 2:
+            # Start of scan without a frame header first.
+            return None
+        f.seek(length - 2, os.SEEK_CUR)
+
+
+class ImageSizes:
+    """
+    Dimensions of images under `static_dir`, keyed by path and reused
+    while the file's mtime is unchanged, so a build reads each image's
+    header at most once.
+    """
+
+    def __init__(self, static_dir=None):
+        self.static_dir = static_dir
+        self.entries = {}
+
+    def get(self, url):
+        """
+        Return the (width, height) of the static file a root-relative
+        image URL points at, or None if it can't be found or read.
+        """
+        path = self.static_path(url)
+        if path is None:
+            return None
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+        entry = self.entries.get(path)
+        if entry is not None and entry[0] == mtime:
+            return entry[1]
+        try:
+            size = image_size(path)
+        except (OSError, struct.error):
+            return None
+        self.entries[path] = (mtime, size)
+        return size
+
+    def static_path(self, url):
+        if self.static_dir is None:
+            return None
+        parts = urlsplit(url)
+        if parts.scheme or parts.netloc or not parts.path.startswith("/"):
+            return None
+        rel_path = unquote(parts.path).lstrip("/")
+        if ".." in rel_path.split("/"):
+            return None
+        return os.path.join(self.static_dir, *rel_path.split("/"))
+
+
+image_sizes = ImageSizes()
+
+# The sizes image_to_leaf() looks images up in; a site build sets its own.
+current_image_sizes = contextvars.ContextVar("image_sizes", default=image_sizes)
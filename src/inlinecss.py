@@ -0,0 +1,126 @@
+import contextvars
+import os
+import re
+
+
+LINK_RE = re.compile(r"<link\b[^>]*>", re.IGNORECASE)
+ATTR_RE = re.compile(r"""([\w-]+)\s*=\s*(?:"([^"]*)"|'([^']*)')""")
+
+CSS_TOKEN_RE = re.compile(
+    r"""("(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*')"""
+    r"""|(/\*[\s\S]*?\*/|\s+)"""
+    r"""|([{};:,>])"""
+    r"""|([^"'/\s{};:,>]+|/)"""
+)
+
+# url() and @import references relative to the stylesheet would resolve
+# against the page once inlined, so such stylesheets stay linked.
+RELATIVE_REF_RE = re.compile(
+    r"""(?:url\(|@import)\s*["']?(?![a-z][\w+.-]*:|/|["'])""", re.IGNORECASE
+)
+
+CSS_PUNCTUATION = frozenset("{};:,>")
+
+# Inlined CSS is sent with every page; keeping it small leaves room for
+# the page in the first TCP round trip (about 14 KiB).
+default_max_size = 8 * 1024
+
+
+def minify_css(css):
+    """
+    Drop comments and unneeded whitespace and semicolons. Strings are
+    kept as they are, and a space before ":" is kept since it separates
+    a selector from a pseudo-class.
+    """
+    out = []
+    space = False
+    for match in CSS_TOKEN_RE.finditer(css):
+        string, blank, punctuation, text = match.groups()
+        if blank is not None:
+            space = True
+            continue
+        if punctuation is not None:
+            if punctuation == "}" and out and out[-1] == ";":
+                out.pop()
+            if space and punctuation == ":" and out and out[-1] not in CSS_PUNCTUATION:
+                out.append(" ")
+            out.append(punctuation)
+        else:
+            if space and out and out[-1] not in CSS_PUNCTUATION:
+                out.append(" ")
+            out.append(string if string is not None else text)
+        space = False
+    return "".join(out)
+
+
+class CssInliner:
+    """
+    Replaces <link rel="stylesheet"> tags in a template's <head> with
+    <style> elements holding the minified stylesheet, for root-relative
+    stylesheets under `static_dir` whose minified size is at most
+    `max_size` bytes. Larger ones stay linked. Disabled while `max_size`
+    is None.
+
+    Minified stylesheets are kept by path and reused while the file's
+    mtime is unchanged, so the work is done once per build.
+    """
+
+    def __init__(self, static_dir=None, max_size=None):
+        self.static_dir = static_dir
+        self.max_size = max_size
+        self.entries = {}
+
+    def apply(self, template):
+        if self.max_size is None or self.static_dir is None:
+            return template
+        head_end = template.lower().find("</head>")
+        if head_end == -1:
+            return template
+        head = LINK_RE.sub(self.replace_link, template[:head_end])
+        return head + template[head_end:]
+
+    def replace_link(self, match):
+        attrs = {}
+        for name, double, single in ATTR_RE.findall(match.group()):
+            attrs[name.lower()] = double or single
+        if attrs.get("rel", "").lower() != "stylesheet":
+            return match.group()
+        css = self.get(attrs.get("href", ""))
+        if css is None or len(css.encode("utf-8")) > self.max_size:
+            return match.group()
+        if "media" in attrs:
+            return f'<style media="{attrs["media"]}">{css}</style>'
+        return f"<style>{css}</style>"
+
+    def get(self, href):
+        """
+        Return the minified stylesheet `href` points at, or None if it
+        isn't a static file or can't safely be inlined.
+        """
+        if not href.startswith("/") or href.startswith("//"):
+            return None
+        rel_path = href.split("?", 1)[0].split("#", 1)[0].lstrip("/")
+        if ".." in rel_path.split("/"):
+            return None
+        path = os.path.join(self.static_dir, *rel_path.split("/"))
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+        entry = self.entries.get(path)
+        if entry is not None and entry[0] == mtime:
+            return entry[1]
+        with open(path, "r", encoding="utf-8") as f:
+            css = f.read()
+        if RELATIVE_REF_RE.search(css) or "</style" in css.lower():
+            minified = None
+        else:
+            minified = minify_css(css)
+        self.entries[path] = (mtime, minified)
+        return minified
+
+
+css_inliner = CssInliner()
+
+# The inliner read_template() applies; a site build sets its own.
+current_css_inliner = contextvars.ContextVar("css_inliner", default=css_inliner)
@@ -0,0 +1,106 @@
+import threading
+from collections import deque
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+
+
+default_io_workers = 8
+
+
+class IOPool:
+    """
+    Bounded thread pool for file reads and writes.
+
+    submit() blocks once `max_pending` jobs are in flight, so a fast
+    renderer cannot queue up an unbounded amount of output in memory.
+    wait() re-raises the first error any job hit.
+    """
+
+    def __init__(self, workers=default_io_workers, max_pending=None):
+        if max_pending is None:
+            max_pending = workers * 4
+        self.workers = workers
+        self.executor = ThreadPoolExecutor(max_workers=workers)
+        self.slots = threading.BoundedSemaphore(max_pending)
+        self.pending = []
+
+    def submit(self, fn, *args):
+        self.slots.acquire()
+        try:
+            future = self.executor.submit(fn, *args)
+        except BaseException:
+            self.slots.release()
+            raise
+        future.add_done_callback(lambda _: self.slots.release())
+        self.pending.append(future)
+        return future
+
+    def prefetch(self, fn, items, lookahead=None):
+        """
+        Yield fn(item) for each item in order, running up to `lookahead`
+        calls ahead of the consumer on the pool.
+        """
+        if lookahead is None:
+            lookahead = self.workers * 2
+        futures = deque()
+        items = iter(items)
+        for item in items:
+            futures.append(self.executor.submit(fn, item))
+            if len(futures) >= lookahead:
+                break
+        while futures:
+            result = futures.popleft().result()
+            for item in items:
+                futures.append(self.executor.submit(fn, item))
+                break
+            yield result
+
+    def map(self, fn, items):
+        return list(self.executor.map(fn, items))
+
+    def wait(self):
+        pending, self.pending = self.pending, []
+        for future in pending:
+            future.result()
+
+    def cancel(self):
+        """
+        Cancel queued jobs and wait for running ones, dropping their
+        errors.
+        """
+        pending, self.pending = self.pending, []
+        for future in pending:
+            future.cancel()
+        for future in pending:
+            if not future.cancelled():
+                future.exception()
+
+    @contextmanager
+    def batch(self):
+        """
+        Use a long-lived pool for one batch of jobs: on leaving the block
+        the batch is waited for, or on an error cancelled, and the pool
+        stays open for the next one.
+        """
+        try:
+            yield self
+            self.wait()
+        except BaseException:
+            self.cancel()
+            raise
+
+    def close(self):
+        try:
+            self.wait()
+        finally:
+            self.executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.executor.shutdown(wait=True, cancel_futures=True)
+        return False
@@ -0,0 +1,157 @@
+import hashlib
+import json
+import os
+import re
+
+from buildoutput import keep_file, write_file
+from gencontent import read_template, render_template
+from htmlnode import LeafNode, ParentNode
+from pageindex import page_updated, page_url
+
+
+default_per_page = 10
+TAG_SLUG_RE = re.compile(r"[^a-z0-9]+")
+
+
+def generate_listing_pages(
+    page_index,
+    dir_path_content,
+    dest_dir_path,
+    template_path,
+    basepath,
+    title,
+    per_page=default_per_page,
+    state=None,
+    write_file=write_file,
+    keep_file=keep_file,
+    log=print,
+):
+    """
+    Generate paginated listing pages and per-tag pages for a collection.
+
+    Listings are built from the page index alone, newest first. `state`
+    maps each listing page to a signature of its slice of the collection,
+    the template and the basepath; pages whose signature is unchanged are
+    kept from the previous build instead of being rendered again. The dict
+    is updated in place.
+    """
+    if state is None:
+        state = {}
+    listings = plan_listings(page_index, dir_path_content, dest_dir_path, title)
+    # Hashed after stylesheets are inlined, so a stylesheet edit counts
+    # as a template change.
+    template = read_template(template_path)
+    template_digest = hashlib.sha1(f"{basepath}\n{template}".encode("utf-8")).hexdigest()
+
+    new_state = {}
+    for listing_dir_path, listing_path, listing_title, listing_pages in listings:
+        page_count = listing_page_count(listing_pages, per_page)
+        for number in range(1, page_count + 1):
+            dest_path = listing_page_path(listing_dir_path, number)
+            rel_path = os.path.relpath(dest_path, page_index.public_dir)
+            page_slice = listing_pages[(number - 1) * per_page : number * per_page]
+            signature = slice_signature(
+                template_digest, listing_title, number, page_count, page_slice
+            )
+            new_state[rel_path] = signature
+            if state.get(rel_path) == signature and keep_file(dest_path):
+                continue
+            log(f" * listing {listing_path} page {number} -> {dest_path}")
+            node = listing_to_html_node(
+                listing_title, listing_path, number, page_count, page_slice
+            )
+            html = render_template(template, listing_title, node.to_html(), basepath)
+            write_file(dest_path, html.encode("utf-8"))
+    state.clear()
+    state.update(new_state)
+    return state
+
+
+def plan_listings(page_index, dir_path_content, dest_dir_path, title):
+    """
+    Return the collection listing and one listing per tag as (dest dir,
+    URL path, title, pages) tuples, pages newest first.
+    """
+    pages = page_index.pages_under(dir_path_content)
+    pages.sort(key=page_updated, reverse=True)
+    collection_path = page_url(
+        os.path.join(dest_dir_path, "index.html"), page_index.public_dir, "/"
+    )
+    if collection_path in (page["path"] for page in page_index.pages.values()):
+        raise ValueError(f"listing page conflicts with content page: {collection_path}")
+
+    listings = [(dest_dir_path, collection_path, title, pages)]
+    tags = {}
+    for page in pages:
+        for tag in page["tags"]:
+            tags.setdefault(tag, []).append(page)
+    for tag in sorted(tags):
+        slug = tag_slug(tag)
+        listings.append(
+            (
+                os.path.join(dest_dir_path, "tags", slug),
+                f"{collection_path}tags/{slug}/",
+                f"{title}: {tag}",
+                tags[tag],
+            )
+        )
+    return listings
+
+
+def listing_page_count(pages, per_page):
+    return max(1, -(-len(pages) // per_page))
+
+
+def listing_to_html_node(title, listing_path, number, page_count, pages):
+    items = []
+    for page in pages:
+        children = [LeafNode("a", page["title"], {"href": page["path"]})]
+        if page["date"]:
+            children.append(LeafNode(None, f" ({page['date']})"))
+        items.append(ParentNode("li", children))
+    children = [LeafNode("h1", title)]
+    if items:
+        children.append(ParentNode("ul", items))
+    nav = []
+    if number > 1:
+        nav.append(LeafNode("a", "Newer", {"href": listing_page_url(listing_path, number - 1)}))
+    if number < page_count:
+        nav.append(LeafNode("a", "Older", {"href": listing_page_url(listing_path, number + 1)}))
+    if nav:
+        children.append(ParentNode("nav", nav))
+    return ParentNode("div", children)
+
+
+def listing_page_path(listing_dir_path, number):
+    if number == 1:
+        return os.path.join(listing_dir_path, "index.html")
+    return os.path.join(listing_dir_path, "page", str(number), "index.html")
+
+
+def listing_page_url(listing_path, number):
+    if number == 1:
+        return listing_path
+    return f"{listing_path}page/{number}/"
+
+
+def slice_signature(template_digest, title, number, page_count, pages):
+    entries = [[page["path"], page["title"], page["date"]] for page in pages]
+    data = json.dumps([template_digest, title, number, page_count, entries])
+    return hashlib.sha1(data.encode("utf-8")).hexdigest()
+
+
+def tag_slug(tag):
+    return TAG_SLUG_RE.sub("-", str(tag).lower()).strip("-")
+
+
+def load_state(path):
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_state(path, state):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(state, f, indent=1, sort_keys=True)
@@ -0,0 +1,296 @@
+import difflib
+import json
+import os
+import queue
+import threading
+import time
+
+from frontmatter import read_metadata
+from gencontent import extract_title, page_template_path, read_body, read_template, render_template
+from markdown_blocks import block_to_html_node, markdown_to_blocks
+from toc import TableOfContents
+
+
+endpoint = "/__live"
+poll_interval = 0.05
+keepalive_interval = 15
+
+# Patches arrive as {"ops": [[start, end, [html, ...]], ...]}, in
+# descending order of `start`: each replaces the content root's element
+# children start..end with the given fragments. {"reload": true} asks
+# for a full reload.
+CLIENT_SCRIPT = """<script>
+(function () {
+  var url = "%s?page=" + encodeURIComponent(location.pathname) + "&version=%d";
+  var source = new EventSource(url);
+  source.onmessage = function (event) {
+    var message = JSON.parse(event.data);
+    var root = document.querySelector("[data-live-root]");
+    if (message.reload || !root) {
+      location.reload();
+      return;
+    }
+    message.ops.forEach(function (op) {
+      var old = Array.prototype.slice.call(root.children, op[0], op[1]);
+      var fragment = document.createElement("template");
+      fragment.innerHTML = op[2].join("");
+      root.insertBefore(fragment.content, root.children[op[1]] || null);
+      old.forEach(function (child) { root.removeChild(child); });
+    });
+  };
+})();
+</script>"""
+
+
+class LiveDocument:
+    """
+    Block-level render state of one page.
+
+    update() diffs the page's new block list against the previous one
+    and renders only the blocks that changed, plus every block that
+    adds a heading or holds an image, since heading ids depend on the
+    headings before them and image sizes on the image files. It
+    returns the patch ops that turn the old content into the new, or
+    None if something outside the content changed and the page needs a
+    full reload.
+    """
+
+    def __init__(self):
+        self.blocks = []
+        # (html, rerender) per block
+        self.fragments = []
+        self.metadata = None
+        self.template = None
+        self.title = None
+        self.toc_html = ""
+        self.template_path = None
+        # (source mtime, template mtime) the document was rendered from
+        self.mtime = None
+        self.version = 0
+
+    def update(self, markdown, metadata, template, mtime=None):
+        toc = TableOfContents()
+        blocks = markdown_to_blocks(markdown)
+        fragments = []
+        ops = []
+        matcher = difflib.SequenceMatcher(None, self.blocks, blocks)
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+            if tag != "equal":
+                new_fragments = [render_fragment(block, toc) for block in blocks[j1:j2]]
+                fragments.extend(new_fragments)
+                ops.append([i1, i2, [html for html, _ in new_fragments]])
+                continue
+            for i, block in zip(range(i1, i2), blocks[j1:j2]):
+                fragment = self.fragments[i]
+                if fragment[1]:
+                    fragment = render_fragment(block, toc)
+                    if fragment[0] != self.fragments[i][0]:
+                        ops.append([i, i + 1, [fragment[0]]])
+                fragments.append(fragment)
+
+        title = metadata.get("title")
+        if title is None:
+            title = extract_title(markdown)
+        toc_html = ""
+        if "{{ TOC }}" in template:
+            toc_node = toc.to_html_node()
+            if toc_node is not None:
+                toc_html = toc_node.to_html()
+        reload = (
+            metadata != self.metadata
+            or template != self.template
+            or title != self.title
+            or toc_html != self.toc_html
+        )
+
+        self.blocks = blocks
+        self.fragments = fragments
+        self.metadata = metadata
+        self.template = template
+        self.title = title
+        self.toc_html = toc_html
+        self.mtime = mtime
+        if reload or ops:
+            self.version += 1
+        if reload:
+            return None
+        ops.reverse()
+        return ops
+
+    def page_html(self):
+        content = "".join(html for html, _ in self.fragments)
+        html = render_template(
+            self.template,
+            self.title,
+            f"<div data-live-root>{content}</div>",
+            "/",
+            self.toc_html,
+        )
+        return inject_client(html, self.version)
+
+
+def render_fragment(block, toc):
+    headings = len(toc.headings)
+    html = block_to_html_node(block, toc).to_html()
+    return html, len(toc.headings) != headings or "<img" in html
+
+
+def inject_client(html, version):
+    script = CLIENT_SCRIPT % (endpoint, version)
+    index = html.rfind("</body>")
+    if index == -1:
+        return html + script
+    return html[:index] + script + html[index:]
+
+
+class LiveReload:
+    """
+    Live documents of the pages open in a browser, and their subscribers.
+
+    Pages rendered through render() and files changed on disk both go
+    through update(), which pushes the resulting patch to every
+    subscriber of that page. A watcher thread polls the sources and
+    templates of subscribed pages every `poll_interval` seconds;
+    `template_path` is the default template, as in the build.
+
+    Documents are kept until forget() is called for them, once the last
+    subscriber has gone.
+    """
+
+    def __init__(self, poll_interval=poll_interval, template_path=None):
+        self.poll_interval = poll_interval
+        self.template_path = template_path
+        self.documents = {}
+        self.subscribers = {}
+        self.forgotten = set()
+        self.lock = threading.Lock()
+        self.watcher = None
+        self.stopping = threading.Event()
+
+    def render(self, from_path, markdown, metadata, template, mtime=None, template_path=None):
+        with self.lock:
+            self.forgotten.discard(from_path)
+            document = self.update(from_path, markdown, metadata, template, mtime, template_path)
+            return document.page_html()
+
+    def update(self, from_path, markdown, metadata, template, mtime=None, template_path=None):
+        document = self.documents.get(from_path)
+        if document is None:
+            document = self.documents[from_path] = LiveDocument()
+        version = document.version
+        ops = document.update(markdown, metadata, template, mtime)
+        document.template_path = template_path
+        if document.version != version:
+            message = {"reload": True} if ops is None else {"ops": ops}
+            for subscriber in self.subscribers.get(from_path, ()):
+                subscriber.put(message)
+        return document
+
+    def subscribe(self, from_path, version):
+        """
+        Return a queue of patch messages for `from_path`. A page
+        rendered at a different version than the live document gets a
+        reload straight away.
+        """
+        subscriber = queue.Queue()
+        with self.lock:
+            self.subscribers.setdefault(from_path, []).append(subscriber)
+            document = self.documents.get(from_path)
+            if document is None or document.version != version:
+                subscriber.put({"reload": True})
+        return subscriber
+
+    def unsubscribe(self, from_path, subscriber):
+        with self.lock:
+            subscribers = self.subscribers.get(from_path, [])
+            if subscriber in subscribers:
+                subscribers.remove(subscriber)
+            if not subscribers:
+                self.subscribers.pop(from_path, None)
+                if from_path in self.forgotten:
+                    self.forgotten.discard(from_path)
+                    self.documents.pop(from_path, None)
+
+    def forget(self, from_path):
+        """
+        Drop the document of `from_path` now, or when its last subscriber
+        goes if it still has any.
+        """
+        with self.lock:
+            if from_path in self.subscribers:
+                self.forgotten.add(from_path)
+            else:
+                self.documents.pop(from_path, None)
+
+    def poll(self):
+        """
+        Re-read the subscribed pages whose source or template mtime
+        changed.
+        """
+        with self.lock:
+            for from_path in list(self.subscribers):
+                document = self.documents.get(from_path)
+                if document is None:
+                    continue
+                try:
+                    mtime = os.stat(from_path).st_mtime_ns
+                    if document.template_path is not None:
+                        mtime = (mtime, os.stat(document.template_path).st_mtime_ns)
+                except OSError:
+                    continue
+                if mtime == document.mtime:
+                    continue
+                try:
+                    self.reread(from_path, document)
+                except (OSError, ValueError) as e:
+                    print(f" * live reload of {from_path} failed: {e}")
+                    document.mtime = mtime
+
+    def reread(self, from_path, document):
+        source_mtime = os.stat(from_path).st_mtime_ns
+        metadata = read_metadata(from_path)
+        markdown = read_body(from_path, metadata)
+        if document.template_path is None:
+            self.update(from_path, markdown, metadata, document.template, source_mtime)
+            return
+        template_path = page_template_path(self.template_path, metadata)
+        mtime = (source_mtime, os.stat(template_path).st_mtime_ns)
+        template = read_template(template_path)
+        self.update(from_path, markdown, metadata, template, mtime, template_path)
+
+    def start(self):
+        def watch():
+            while not self.stopping.wait(self.poll_interval):
+                self.poll()
+
+        self.watcher = threading.Thread(target=watch, daemon=True)
+        self.watcher.start()
+
+    def stop(self):
+        self.stopping.set()
+        if self.watcher is not None:
+            self.watcher.join()
+            self.watcher = None
+
+
+def send_events(wfile, subscriber):
+    """
+    Write messages from `subscriber` to an open text/event-stream
+    response until the client goes away.
+    """
+    last_write = time.monotonic()
+    while True:
+        try:
+            message = subscriber.get(timeout=1)
+        except queue.Empty:
+            if time.monotonic() - last_write < keepalive_interval:
+                continue
+            data = b": keepalive\n\n"
+        else:
+            data = f"data: {json.dumps(message)}\n\n".encode("utf-8")
+        try:
+            wfile.write(data)
+            wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            return
+        last_write = time.monotonic()
@@ -1,32 +1,125 @@
-import os
-import shutil
-import sys
-
-from copystatic import copy_files_recursive
-from gencontent import generate_pages_recursive
-
-
-dir_path_static = "./static"
-dir_path_public = "./docs"
-dir_path_content = "./content"
-template_path = "./template.html"
-default_basepath = "/"
-
-
-def main():
-    basepath = default_basepath
-    if len(sys.argv) > 1:
-        basepath = sys.argv[1]
-
-    print("Deleting public directory...")
-    if os.path.exists(dir_path_public):
-        shutil.rmtree(dir_path_public)
-
-    print("Copying static files to public directory...")
-    copy_files_recursive(dir_path_static, dir_path_public)
-
-    print("Generating content...")
-    generate_pages_recursive(dir_path_content, template_path, dir_path_public, basepath)
-
-
-main()
+dir_path_static = "./static"
+dir_path_public = "./docs"
+dir_path_content = "./content"
+template_path = "./template.html"
+dir_path_cache = "./.cache"
+default_basepath = "/"
+default_site_url = ""
+blog_feed_title = "Tolkien Fan Club Blog"
+blog_feed_author = "Tolkien Fan Club"
+blog_listing_title = "Blog"
+blog_posts_per_page = 10
+default_memory_threshold_kib = 1024
+default_inline_css_max_size = 8192
+build_socket_path = "./.cache/build.sock"
+
+
+def main(argv=None):
+    parser = make_parser()
+    args = parser.parse_args(argv)
+    if args.daemon:
+        from buildserver import BuildServer
+
+        BuildServer(build_socket_path, parser).serve()
+        return
+    run(parser, args)
+
+
+def make_parser():
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="static_site_gen", description="Build the site from content/ into docs/."
+    )
+    parser.add_argument("basepath", nargs="?", default=default_basepath)
+    parser.add_argument("site_url", nargs="?", default=default_site_url)
+    parser.add_argument(
+        "--shard",
+        type=parse_shard,
+        metavar="I/N",
+        help="render only shard I of N into docs.shardI",
+    )
+    parser.add_argument(
+        "--merge",
+        type=int,
+        metavar="N",
+        help="combine docs.shard1..docs.shardN into docs",
+    )
+    parser.add_argument(
+        "--memory",
+        type=int,
+        nargs="?",
+        const=default_memory_threshold_kib,
+        metavar="KIB",
+        help="measure each page's memory use and report pages whose peak "
+        f"exceeds KIB (default {default_memory_threshold_kib})",
+    )
+    parser.add_argument(
+        "--inline-css",
+        type=int,
+        nargs="?",
+        const=default_inline_css_max_size,
+        metavar="BYTES",
+        help="inline stylesheets of up to BYTES minified into the template's <head> "
+        f"(default {default_inline_css_max_size})",
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="validate the content and report errors without building anything",
+    )
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help=f"keep running and serve builds requested by src/buildclient.py on {build_socket_path}",
+    )
+    return parser
+
+
+def run(parser, args, io_pool=None):
+    if args.shard is not None and args.merge is not None:
+        parser.error("--shard and --merge are mutually exclusive")
+    if args.check and (args.shard is not None or args.merge is not None):
+        parser.error("--check can't be combined with --shard or --merge")
+
+    from sitebuilder import Site
+
+    site = Site(
+        content_dir=dir_path_content,
+        static_dir=dir_path_static,
+        public_dir=dir_path_public,
+        template_path=template_path,
+        cache_dir=dir_path_cache,
+        basepath=args.basepath,
+        site_url=args.site_url,
+        blog_title=blog_listing_title,
+        feed_title=blog_feed_title,
+        feed_author=blog_feed_author,
+        posts_per_page=blog_posts_per_page,
+        memory_threshold=None if args.memory is None else args.memory * 1024,
+        inline_css_max_size=args.inline_css,
+        io_pool=io_pool,
+    )
+    if args.check:
+        errors = site.check()
+        for from_path, line, message in errors:
+            print(f"{from_path}:{line}: {message}")
+        if errors:
+            parser.exit(1, f"{len(errors)} errors\n")
+        print("Content OK")
+    elif args.merge is not None:
+        site.merge(args.merge)
+    else:
+        site.build(shard=args.shard)
+
+
+def parse_shard(text):
+    index, _, count = text.partition("/")
+    index, count = int(index), int(count)
+    if not 1 <= index <= count:
+        raise ValueError(text)
+    return index, count
+
+
+if __name__ == "__main__":
+    main()
@@ -1,150 +1,271 @@
-from enum import Enum
-
-from htmlnode import ParentNode
-from inline_markdown import text_to_textnodes
-from textnode import text_node_to_html_node, TextNode, TextType
-
-
-class BlockType(Enum):
-    PARAGRAPH = "paragraph"
-    HEADING = "heading"
-    CODE = "code"
-    QUOTE = "quote"
-    OLIST = "ordered_list"
-    ULIST = "unordered_list"
-
-
-def markdown_to_blocks(markdown):
-    blocks = markdown.split("\n\n")
-    filtered_blocks = []
-    for block in blocks:
-        if block == "":
-            continue
-        block = block.strip()
-        filtered_blocks.append(block)
-    return filtered_blocks
-
-
-def block_to_block_type(block):
-    lines = block.split("\n")
-
-    if block.startswith(("# ", "## ", "### ", "#### ", "##### ", "###### ")):
-        return BlockType.HEADING
-    if len(lines) > 1 and lines[0].startswith("```") and lines[-1].startswith("```"):
-        return BlockType.CODE
-    if block.startswith(">"):
-        for line in lines:
-            if not line.startswith(">"):
-                return BlockType.PARAGRAPH
-        return BlockType.QUOTE
-    if block.startswith("- "):
-        for line in lines:
-            if not line.startswith("- "):
-                return BlockType.PARAGRAPH
-        return BlockType.ULIST
-    if block.startswith("1. "):
-        i = 1
-        for line in lines:
-            if not line.startswith(f"{i}. "):
-                return BlockType.PARAGRAPH
-            i += 1
-        return BlockType.OLIST
-    return BlockType.PARAGRAPH
-
-
-def markdown_to_html_node(markdown):
-    blocks = markdown_to_blocks(markdown)
-    children = []
-    for block in blocks:
-        html_node = block_to_html_node(block)
-        children.append(html_node)
-    return ParentNode("div", children, None)
-
-
-def block_to_html_node(block):
-    block_type = block_to_block_type(block)
-    if block_type == BlockType.PARAGRAPH:
-        return paragraph_to_html_node(block)
-    if block_type == BlockType.HEADING:
-        return heading_to_html_node(block)
-    if block_type == BlockType.CODE:
-        return code_to_html_node(block)
-    if block_type == BlockType.OLIST:
-        return olist_to_html_node(block)
-    if block_type == BlockType.ULIST:
-        return ulist_to_html_node(block)
-    if block_type == BlockType.QUOTE:
-        return quote_to_html_node(block)
-    raise ValueError("invalid block type")
-
-
-def text_to_children(text):
-    text_nodes = text_to_textnodes(text)
-    children = []
-    for text_node in text_nodes:
-        html_node = text_node_to_html_node(text_node)
-        children.append(html_node)
-    return children
-
-
-def paragraph_to_html_node(block):
-    lines = block.split("\n")
-    paragraph = " ".join(lines)
-    children = text_to_children(paragraph)
-    return ParentNode("p", children)
-
-
-def heading_to_html_node(block):
-    level = 0
-    for char in block:
-        if char == "#":
-            level += 1
-        else:
-            break
-    if level + 1 >= len(block):
-        raise ValueError(f"invalid heading level: {level}")
-    text = block[level + 1 :]
-    children = text_to_children(text)
-    return ParentNode(f"h{level}", children)
-
-
-def code_to_html_node(block):
-    if not block.startswith("```") or not block.endswith("```"):
-        raise ValueError("invalid code block")
-    text = block[4:-3]
-    raw_text_node = TextNode(text, TextType.TEXT)
-    child = text_node_to_html_node(raw_text_node)
-    code = ParentNode("code", [child])
-    return ParentNode("pre", [code])
-
-
-def olist_to_html_node(block):
-    items = block.split("\n")
-    html_items = []
-    for item in items:
-        text = item[3:]
-        children = text_to_children(text)
-        html_items.append(ParentNode("li", children))
-    return ParentNode("ol", html_items)
-
-
-def ulist_to_html_node(block):
-    items = block.split("\n")
-    html_items = []
-    for item in items:
-        text = item[2:]
-        children = text_to_children(text)
-        html_items.append(ParentNode("li", children))
-    return ParentNode("ul", html_items)
-
-
-def quote_to_html_node(block):
-    lines = block.split("\n")
-    new_lines = []
-    for line in lines:
-        if not line.startswith(">"):
-            raise ValueError("invalid quote block")
-        new_lines.append(line.lstrip(">").strip())
-    content = " ".join(new_lines)
-    children = text_to_children(content)
-    return ParentNode("blockquote", children)
+from collections import deque
+from enum import Enum
+
+from highlight import highlight
+from htmlnode import ParentNode, RawHTMLNode
+from inline_markdown import text_to_textnodes
+from textnode import text_node_to_html_node, TextNode, TextType
+from toc import TableOfContents
+
+
+# Rendered HTML of recently seen blocks, for markdown_to_html_many().
+FRAGMENT_CACHE = {}
+fragment_cache_size = 4096
+default_chunk_size = 256
+
+
+class BlockType(Enum):
+    PARAGRAPH = "paragraph"
+    HEADING = "heading"
+    CODE = "code"
+    QUOTE = "quote"
+    OLIST = "ordered_list"
+    ULIST = "unordered_list"
+
+
+def markdown_to_blocks(markdown):
+    blocks = markdown.split("\n\n")
+    filtered_blocks = []
+    for block in blocks:
+        if block == "":
+            continue
+        block = block.strip()
+        filtered_blocks.append(block)
+    return filtered_blocks
+
+
+BLOCK_RULES = {}
+BLOCK_RENDERERS = {}
+
+
+def register_block(block_type, render, detect=None, first_chars=""):
+    """
+    Register render(block, toc) for `block_type` and, with `detect`, the
+    rule that recognises it. detect(block) is only tried on blocks that
+    start with one of `first_chars`, after the rules registered before it
+    for that character; a block no rule claims is a paragraph.
+    """
+    BLOCK_RENDERERS[block_type] = render
+    if detect is None:
+        return
+    for char in first_chars:
+        rules = [rule for rule in BLOCK_RULES.get(char, []) if rule[0] != block_type]
+        rules.append((block_type, detect))
+        BLOCK_RULES[char] = rules
+
+
+def block_to_block_type(block):
+    for block_type, detect in BLOCK_RULES.get(block[:1], ()):
+        if detect(block):
+            return block_type
+    return BlockType.PARAGRAPH
+
+
+def is_heading(block):
+    return block.startswith(("# ", "## ", "### ", "#### ", "##### ", "###### "))
+
+
+def is_code(block):
+    lines = block.split("\n")
+    return len(lines) > 1 and lines[0].startswith("```") and lines[-1].startswith("```")
+
+
+def is_quote(block):
+    return all(line.startswith(">") for line in block.split("\n"))
+
+
+def is_ulist(block):
+    return all(line.startswith("- ") for line in block.split("\n"))
+
+
+def is_olist(block):
+    for i, line in enumerate(block.split("\n"), 1):
+        if not line.startswith(f"{i}. "):
+            return False
+    return True
+
+
+def markdown_to_html_node(markdown, toc=None):
+    if toc is None:
+        toc = TableOfContents()
+    blocks = markdown_to_blocks(markdown)
+    children = []
+    for block in blocks:
+        html_node = block_to_html_node(block, toc)
+        children.append(html_node)
+    return ParentNode("div", children, None)
+
+
+def markdown_to_html_many(markdowns, workers=None, chunk_size=default_chunk_size):
+    """
+    Yield markdown_to_html_node(markdown).to_html() for each string in
+    `markdowns`, in order.
+
+    Blocks are looked up in FRAGMENT_CACHE first, so boilerplate that
+    recurs across snippets is converted once. With `workers`, chunks of
+    `chunk_size` snippets are converted in a process pool, each worker
+    keeping its own cache; a bounded number of chunks is in flight, so
+    `markdowns` can be a long-running generator. Extensions registered
+    after import are only seen by workers on platforms that fork.
+    """
+    if workers is None:
+        for markdown in markdowns:
+            yield markdown_to_html_cached(markdown)
+        return
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(workers) as executor:
+        pending = deque()
+        for chunk in chunked(markdowns, chunk_size):
+            pending.append(executor.submit(markdown_to_html_chunk, chunk))
+            if len(pending) > workers * 2:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def markdown_to_html_chunk(markdowns):
+    return [markdown_to_html_cached(markdown) for markdown in markdowns]
+
+
+def markdown_to_html_cached(markdown):
+    toc = TableOfContents()
+    parts = []
+    for block in markdown_to_blocks(markdown):
+        html = FRAGMENT_CACHE.get(block)
+        if html is None:
+            headings = len(toc.headings)
+            html = block_to_html_node(block, toc).to_html()
+            # A heading's id depends on the headings before it on the
+            # page, and an image's size on the file it points at, so
+            # blocks with either are never cached.
+            if len(toc.headings) == headings and "<img" not in html:
+                if len(FRAGMENT_CACHE) >= fragment_cache_size:
+                    del FRAGMENT_CACHE[next(iter(FRAGMENT_CACHE))]
+                FRAGMENT_CACHE[block] = html
+        parts.append(html)
+    return "<div>" + "".join(parts) + "</div>"
+
+
+def chunked(items, size):
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def block_to_html_node(block, toc=None):
+    block_type = block_to_block_type(block)
+    render = BLOCK_RENDERERS.get(block_type)
+    if render is None:
+        raise ValueError("invalid block type")
+    return render(block, toc)
+
+
+def text_to_children(text):
+    text_nodes = text_to_textnodes(text)
+    children = []
+    for text_node in text_nodes:
+        html_node = text_node_to_html_node(text_node)
+        children.append(html_node)
+    return children
+
+
+def paragraph_to_html_node(block, toc=None):
+    lines = block.split("\n")
+    paragraph = " ".join(lines)
+    children = text_to_children(paragraph)
+    return ParentNode("p", children)
+
+
+def heading_to_html_node(block, toc=None):
+    level = 0
+    for char in block:
+        if char == "#":
+            level += 1
+        else:
+            break
+    if level + 1 >= len(block):
+        raise ValueError(f"invalid heading level: {level}")
+    text = block[level + 1 :]
+    text_nodes = text_to_textnodes(text)
+    children = []
+    for text_node in text_nodes:
+        children.append(text_node_to_html_node(text_node))
+    if toc is None:
+        toc = TableOfContents()
+    plain_text = "".join(text_node.text for text_node in text_nodes)
+    heading_id = toc.add(level, plain_text)
+    return ParentNode(f"h{level}", children, {"id": heading_id})
+
+
+def code_to_html_node(block, toc=None):
+    if not block.startswith("```") or not block.endswith("```"):
+        raise ValueError("invalid code block")
+    first_line, newline, rest = block.partition("\n")
+    if newline == "":
+        first_line, text = "```", block[3:-3]
+    else:
+        text = rest[:-3]
+    language = first_line[3:].strip()
+    if language == "":
+        raw_text_node = TextNode(text, TextType.TEXT)
+        child = text_node_to_html_node(raw_text_node)
+        code = ParentNode("code", [child])
+        return ParentNode("pre", [code])
+    highlighted = highlight(text, language)
+    if highlighted is None:
+        child = text_node_to_html_node(TextNode(text, TextType.TEXT))
+    else:
+        child = RawHTMLNode(highlighted, text)
+    code = ParentNode("code", [child], {"class": f"language-{language}"})
+    return ParentNode("pre", [code])
+
+
+def olist_to_html_node(block, toc=None):
+    items = block.split("\n")
+    html_items = []
+    for item in items:
+        text = item[3:]
+        children = text_to_children(text)
+        html_items.append(ParentNode("li", children))
+    return ParentNode("ol", html_items)
+
+
+def ulist_to_html_node(block, toc=None):
+    items = block.split("\n")
+    html_items = []
+    for item in items:
+        text = item[2:]
+        children = text_to_children(text)
+        html_items.append(ParentNode("li", children))
+    return ParentNode("ul", html_items)
+
+
+def quote_to_html_node(block, toc=None):
+    lines = block.split("\n")
+    new_lines = []
+    for line in lines:
+        if not line.startswith(">"):
+            raise ValueError("invalid quote block")
+        new_lines.append(line.lstrip(">").strip())
+    content = " ".join(new_lines)
+    children = text_to_children(content)
+    return ParentNode("blockquote", children)
+
+
+register_block(BlockType.PARAGRAPH, paragraph_to_html_node)
+register_block(BlockType.HEADING, heading_to_html_node, is_heading, "#")
+register_block(BlockType.CODE, code_to_html_node, is_code, "`")
+register_block(BlockType.QUOTE, quote_to_html_node, is_quote, ">")
+register_block(BlockType.ULIST, ulist_to_html_node, is_ulist, "-")
+register_block(BlockType.OLIST, olist_to_html_node, is_olist, "1")
+
+# The built-in extensions register through the hooks above, so they are
+# enabled for every caller, not just the site build. Imported last since
+# markdown_extensions imports from this module.
+import markdown_extensions  # noqa: E402,F401
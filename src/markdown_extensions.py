@@ -0,0 +1,123 @@
+import re
+from enum import Enum
+
+from htmlnode import LeafNode, ParentNode
+from inline_markdown import register_inline, split_nodes_delimiter
+from markdown_blocks import (
+    block_to_html_node,
+    markdown_to_blocks,
+    register_block,
+    text_to_children,
+)
+from textnode import register_text_type
+
+
+class ExtBlockType(Enum):
+    TABLE = "table"
+    ADMONITION = "admonition"
+
+
+class ExtTextType(Enum):
+    STRIKETHROUGH = "strikethrough"
+
+
+TABLE_SEPARATOR_RE = re.compile(r"^\|?\s*:?-+:?\s*(?:\|\s*:?-+:?\s*)*\|?\s*$")
+TABLE_CELL_SPLIT_RE = re.compile(r"(?<!\\)\|")
+ADMONITION_RE = re.compile(r'^!!! +([\w-]+)(?: +"([^"]*)")? *$')
+
+
+def is_table(block):
+    lines = block.split("\n")
+    return len(lines) >= 2 and TABLE_SEPARATOR_RE.match(lines[1]) is not None
+
+
+def table_cells(line):
+    line = line.strip()
+    if line.startswith("|"):
+        line = line[1:]
+    if line.endswith("|") and not line.endswith("\\|"):
+        line = line[:-1]
+    return [cell.strip().replace("\\|", "|") for cell in TABLE_CELL_SPLIT_RE.split(line)]
+
+
+def table_alignments(line):
+    alignments = []
+    for cell in table_cells(line):
+        if cell.startswith(":") and cell.endswith(":"):
+            alignments.append("center")
+        elif cell.endswith(":"):
+            alignments.append("right")
+        elif cell.startswith(":"):
+            alignments.append("left")
+        else:
+            alignments.append(None)
+    return alignments
+
+
+def table_row(line, tag, alignments):
+    cells = table_cells(line)
+    cells += [""] * (len(alignments) - len(cells))
+    row = []
+    for cell, alignment in zip(cells, alignments):
+        props = None
+        if alignment is not None:
+            props = {"style": f"text-align: {alignment}"}
+        row.append(ParentNode(tag, text_to_children(cell), props))
+    return ParentNode("tr", row)
+
+
+def table_to_html_node(block, toc=None):
+    lines = block.split("\n")
+    alignments = table_alignments(lines[1])
+    head = ParentNode("thead", [table_row(lines[0], "th", alignments)])
+    children = [head]
+    if len(lines) > 2:
+        rows = [table_row(line, "td", alignments) for line in lines[2:]]
+        children.append(ParentNode("tbody", rows))
+    return ParentNode("table", children)
+
+
+def is_admonition(block):
+    return ADMONITION_RE.match(block.partition("\n")[0]) is not None
+
+
+def admonition_to_html_node(block, toc=None):
+    first_line, _, body = block.partition("\n")
+    match = ADMONITION_RE.match(first_line)
+    if match is None:
+        raise ValueError("invalid admonition block")
+    kind, title = match.groups()
+    if title is None:
+        title = kind.replace("-", " ").capitalize()
+    lines = []
+    for line in body.split("\n"):
+        if line.startswith("    "):
+            line = line[4:]
+        elif line.startswith("\t"):
+            line = line[1:]
+        lines.append(line)
+    children = []
+    if title != "":
+        children.append(ParentNode("p", text_to_children(title), {"class": "admonition-title"}))
+    for body_block in markdown_to_blocks("\n".join(lines)):
+        children.append(block_to_html_node(body_block, toc))
+    return ParentNode("div", children, {"class": f"admonition {kind}"})
+
+
+def split_nodes_strikethrough(old_nodes):
+    return split_nodes_delimiter(old_nodes, "~~", ExtTextType.STRIKETHROUGH)
+
+
+def strikethrough_to_leaf(text_node):
+    return LeafNode("del", text_node.text)
+
+
+def register_extensions():
+    """Enable tables, !!! admonitions and ~~strikethrough~~."""
+    register_block(ExtBlockType.TABLE, table_to_html_node, is_table, "|")
+    register_block(ExtBlockType.ADMONITION, admonition_to_html_node, is_admonition, "!")
+    register_text_type(ExtTextType.STRIKETHROUGH, strikethrough_to_leaf)
+    register_inline(split_nodes_strikethrough)
+
+
+register_extensions()
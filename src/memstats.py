@@ -0,0 +1,163 @@
+import contextvars
+import tracemalloc
+
+from htmlnode import HTMLNode
+from textnode import TextNode
+
+
+# Pages whose rendering peaks above this many bytes are listed in the
+# build report.
+default_threshold = 1024 * 1024
+
+# Node counts of the measure() call running in this context, if any.
+node_counts = contextvars.ContextVar("node_counts", default=None)
+# Highest absolute traced memory seen by measure() calls nested in the
+# one running in this context, if any.
+nested_peak = contextvars.ContextVar("nested_peak", default=None)
+
+# Started reports using the counting hook, and the __init__ methods it
+# replaced while installed.
+counting_users = 0
+original_inits = {}
+
+
+class MemoryReport:
+    """
+    Opt-in per-page memory accounting for a build.
+
+    measure() renders a page under tracemalloc and records its peak
+    traced allocation above what was already allocated, with the
+    number of TextNode and HTMLNode objects created while rendering.
+    Tracing slows rendering down noticeably, so it is only on between
+    start() and stop().
+
+    Allocations made by other threads during a render, such as I/O pool
+    reads and writes, are traced too, so the peaks are an upper bound.
+    Reports may overlap and measure() calls may nest: a nested call adds
+    its node counts and peak to the enclosing one. tracemalloc keeps a
+    single peak for the whole process, though, so measure() calls must
+    not run concurrently in different threads.
+    """
+
+    def __init__(self, threshold=default_threshold):
+        self.threshold = threshold
+        self.pages = []
+        self.started = False
+        self.started_tracing = False
+
+    def start(self):
+        if self.started:
+            return
+        install_counting()
+        self.started = True
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self.started_tracing = True
+
+    def stop(self):
+        if not self.started:
+            return
+        uninstall_counting()
+        self.started = False
+        if self.started_tracing:
+            tracemalloc.stop()
+            self.started_tracing = False
+
+    def measure(self, path, render, *args):
+        """
+        Return render(*args), recording its memory use under `path`.
+        """
+        counts = {TextNode: 0, HTMLNode: 0}
+        peaks = [0]
+        # Resetting the process-wide peak below would lose the enclosing
+        # measure()'s peak so far, so it is carried through nested_peak.
+        record_peak(nested_peak.get())
+        token = node_counts.set(counts)
+        peak_token = nested_peak.set(peaks)
+        tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0]
+        try:
+            result = render(*args)
+        finally:
+            record_peak(peaks)
+            node_counts.reset(token)
+            nested_peak.reset(peak_token)
+            outer = node_counts.get()
+            if outer is not None:
+                for cls, count in counts.items():
+                    outer[cls] += count
+            record_peak(nested_peak.get(), peaks[0])
+        self.pages.append((path, peaks[0] - baseline, counts[TextNode], counts[HTMLNode]))
+        return result
+
+    def over_threshold(self):
+        pages = [page for page in self.pages if page[1] > self.threshold]
+        return sorted(pages, key=lambda page: page[1], reverse=True)
+
+    def report(self):
+        if not self.pages:
+            return "Memory: no pages rendered"
+        path, peak, _, _ = max(self.pages, key=lambda page: page[1])
+        lines = [f"Memory: {len(self.pages)} pages, largest peak {format_size(peak)} ({path})"]
+        pages = self.over_threshold()
+        if pages:
+            lines.append(f"Pages over {format_size(self.threshold)}:")
+        for path, peak, text_nodes, html_nodes in pages:
+            lines.append(
+                f"  {path}: peak {format_size(peak)}, "
+                f"{text_nodes} text nodes, {html_nodes} HTML nodes"
+            )
+        return "\n".join(lines)
+
+
+def record_peak(peaks, peak=None):
+    """
+    Raise peaks[0], a measure() call's highest absolute traced memory,
+    to `peak` or the current tracemalloc peak.
+    """
+    if peaks is None:
+        return
+    if peak is None:
+        peak = tracemalloc.get_traced_memory()[1]
+    peaks[0] = max(peaks[0], peak)
+
+
+def install_counting():
+    """
+    Wrap TextNode and HTMLNode __init__ to count into node_counts. The
+    wrappers are shared by every started report and removed again by
+    uninstall_counting() when the last one stops.
+    """
+    global counting_users
+    if counting_users == 0:
+        for cls in (TextNode, HTMLNode):
+            original_inits[cls] = cls.__init__
+            cls.__init__ = counting_init(cls, cls.__init__)
+    counting_users += 1
+
+
+def uninstall_counting():
+    global counting_users
+    counting_users -= 1
+    if counting_users == 0:
+        for cls, init in original_inits.items():
+            cls.__init__ = init
+        original_inits.clear()
+
+
+def counting_init(cls, init):
+    def __init__(node, *args, **kwargs):
+        counts = node_counts.get()
+        if counts is not None:
+            counts[cls] += 1
+        init(node, *args, **kwargs)
+
+    return __init__
+
+
+def format_size(size):
+    if size < 1024:
+        return f"{size} B"
+    if size < 1024 * 1024:
+        return f"{size / 1024:.1f} KiB"
+    return f"{size / (1024 * 1024):.1f} MiB"
@@ -0,0 +1,79 @@
+import os
+import re
+from datetime import datetime, timezone
+
+
+DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+
+class PageIndex:
+    """
+    In-memory metadata for every generated page, keyed by output URL.
+
+    Filled from the front matter scan before any page body is parsed, so
+    site-wide outputs like the sitemap and feeds never have to re-walk or
+    re-read the content tree.
+    """
+
+    def __init__(self, public_dir, basepath="/"):
+        self.public_dir = public_dir
+        self.basepath = basepath
+        self.pages = {}
+
+    def add(self, from_path, dest_path, metadata, mtime=None):
+        url = self.page_url(dest_path)
+        if mtime is None:
+            mtime = os.path.getmtime(from_path)
+        tags = metadata.get("tags", [])
+        if isinstance(tags, str):
+            tags = [tags]
+        self.pages[url] = {
+            "url": url,
+            "path": page_url(dest_path, self.public_dir, "/"),
+            "title": metadata.get("title"),
+            "date": metadata.get("date"),
+            "tags": tags,
+            "source": os.path.normpath(from_path),
+            "mtime": mtime,
+        }
+
+    def page_url(self, dest_path):
+        return page_url(dest_path, self.public_dir, self.basepath)
+
+    def pages_under(self, dir_path_content):
+        dir_path_content = os.path.normpath(dir_path_content) + os.sep
+        return [
+            page
+            for page in self.sorted_pages()
+            if page["source"].startswith(dir_path_content)
+        ]
+
+    def sorted_pages(self):
+        return [self.pages[url] for url in sorted(self.pages)]
+
+
+def page_url(dest_path, public_dir, basepath):
+    rel_path = os.path.relpath(dest_path, public_dir).replace(os.sep, "/")
+    if rel_path == "index.html":
+        rel_path = ""
+    elif rel_path.endswith("/index.html"):
+        rel_path = rel_path[: -len("index.html")]
+    return basepath + rel_path
+
+
+def page_updated(page):
+    date = page.get("date")
+    if not date:
+        return iso_date(page["mtime"])
+    try:
+        if not DATE_RE.fullmatch(date):
+            raise ValueError
+        datetime.strptime(date, "%Y-%m-%d")
+    except ValueError:
+        raise ValueError(f"invalid date in {page['source']}: {date}, expected YYYY-MM-DD") from None
+    return f"{date}T00:00:00Z"
+
+
+def iso_date(timestamp):
+    moment = datetime.fromtimestamp(timestamp, timezone.utc).replace(microsecond=0)
+    return moment.isoformat().replace("+00:00", "Z")
@@ -0,0 +1,153 @@
+import json
+import os
+import re
+
+from buildoutput import write_file
+from htmlnode import LeafNode, RawHTMLNode
+from pageindex import page_url
+
+
+WORD_RE = re.compile(r"\w+")
+SHARD_PREFIX_RE = re.compile(r"[a-z0-9]+")
+shard_prefix_length = 2
+
+
+class SearchIndex:
+    """
+    Inverted index of every rendered page: term -> page ids with positions.
+
+    Pages get a stable integer id the first time they are added, and
+    re-adding a page replaces its postings.
+    """
+
+    def __init__(self, public_dir, basepath="/"):
+        self.public_dir = public_dir
+        self.basepath = basepath
+        self.pages = {}
+        self.page_ids = {}
+        self.page_terms = {}
+        self.postings = {}
+
+    def reserve_page(self, dest_path):
+        """
+        Give a page its id ahead of add_page(), so sharded builds that
+        each render a subset of the pages agree on every page's id.
+        """
+        url = self.page_url(dest_path)
+        if url in self.page_ids:
+            return self.page_ids[url]
+        page_id = len(self.pages)
+        self.page_ids[url] = page_id
+        self.pages[page_id] = None
+        return page_id
+
+    def add_page(self, dest_path, title, node):
+        url = self.page_url(dest_path)
+        page_id = self.reserve_page(dest_path)
+        self._remove_postings(page_id)
+        self.pages[page_id] = [url, title]
+
+        positions = {}
+        words = WORD_RE.findall(node_text(node).lower())
+        for position, term in enumerate(words):
+            positions.setdefault(term, []).append(position)
+        for term, term_positions in positions.items():
+            self.postings.setdefault(term, {})[page_id] = term_positions
+        self.page_terms[page_id] = list(positions)
+
+    def merge(self, other):
+        """
+        Add the pages another shard's index rendered. Both indexes must
+        have reserved the same page ids.
+        """
+        for page_id, page in other.pages.items():
+            if page is None:
+                self.pages.setdefault(page_id, None)
+                continue
+            if self.pages.get(page_id) is not None:
+                raise ValueError(f"search page {page[0]} was rendered by two shards")
+            self.pages[page_id] = page
+            self.page_ids[page[0]] = page_id
+            self.page_terms[page_id] = list(other.page_terms.get(page_id, []))
+            for term in self.page_terms[page_id]:
+                self.postings.setdefault(term, {})[page_id] = other.postings[term][page_id]
+
+    def _remove_postings(self, page_id):
+        for term in self.page_terms.pop(page_id, []):
+            term_postings = self.postings[term]
+            del term_postings[page_id]
+            if not term_postings:
+                del self.postings[term]
+
+    def page_url(self, dest_path):
+        return page_url(dest_path, self.public_dir, self.basepath)
+
+    def shards(self):
+        shards = {}
+        for term, term_postings in sorted(self.postings.items()):
+            shard = shards.setdefault(shard_key(term), {})
+            shard[term] = [
+                [page_id] + term_positions
+                for page_id, term_positions in sorted(term_postings.items())
+            ]
+        return shards
+
+    def write(self, dest_dir_path, write_file=write_file):
+        """
+        Write the shards, the page table and the manifest.
+
+        The manifest is the only file a client has to fetch up front; it
+        lists the shard keys so a query only downloads the shards of its
+        own terms.
+        """
+        shards = self.shards()
+        for key, shard in sorted(shards.items()):
+            write_json(os.path.join(dest_dir_path, f"{key}.json"), shard, write_file)
+        pages = [self.pages[page_id] for page_id in range(len(self.pages))]
+        write_json(os.path.join(dest_dir_path, "pages.json"), pages, write_file)
+        manifest = {
+            "prefix": shard_prefix_length,
+            "shards": sorted(shards),
+        }
+        write_json(os.path.join(dest_dir_path, "manifest.json"), manifest, write_file)
+
+    @classmethod
+    def load(cls, src_dir_path, public_dir, basepath="/"):
+        index = cls(public_dir, basepath)
+        with open(os.path.join(src_dir_path, "pages.json"), encoding="utf-8") as f:
+            pages = json.load(f)
+        with open(os.path.join(src_dir_path, "manifest.json"), encoding="utf-8") as f:
+            manifest = json.load(f)
+        for page_id, page in enumerate(pages):
+            index.pages[page_id] = page
+            if page is not None:
+                index.page_ids[page[0]] = page_id
+                index.page_terms[page_id] = []
+        for key in manifest["shards"]:
+            with open(os.path.join(src_dir_path, f"{key}.json"), encoding="utf-8") as f:
+                shard = json.load(f)
+            for term, entries in shard.items():
+                for entry in entries:
+                    index.postings.setdefault(term, {})[entry[0]] = entry[1:]
+                    index.page_terms[entry[0]].append(term)
+        return index
+
+
+def node_text(node):
+    if isinstance(node, RawHTMLNode):
+        return node.text or ""
+    if isinstance(node, LeafNode):
+        return node.value or ""
+    return " ".join(node_text(child) for child in node.children)
+
+
+def shard_key(term):
+    prefix = term[:shard_prefix_length]
+    if SHARD_PREFIX_RE.fullmatch(prefix):
+        return prefix
+    return "_"
+
+
+def write_json(path, data, write_file=write_file):
+    text = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+    write_file(path, text.encode("utf-8"))
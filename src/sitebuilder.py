@@ -0,0 +1,357 @@
+import os
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+
+from buildoutput import MemoryOutput, StagedOutput, load_manifest, manifest_filename
+from contentcheck import check_site
+from copystatic import copy_files_recursive
+from discovery import default_ignore, find_files, page_include
+from feeds import write_atom_feed, write_sitemap
+from gencontent import generate_pages_recursive
+from highlight import HighlightCache, current_highlight_cache
+from images import ImageSizes, current_image_sizes
+from inlinecss import CssInliner, current_css_inliner
+from iopool import IOPool, default_io_workers
+from listing import default_per_page, generate_listing_pages, load_state, save_state
+from memstats import MemoryReport
+from pageindex import PageIndex
+from searchindex import SearchIndex
+
+
+class Site:
+    """
+    A configured site and its build.
+
+    build() writes the site to `public_dir` through a staging directory
+    and returns the added/changed/removed output paths, or with
+    write=False returns a dict of output path -> bytes without writing
+    anything to disk.
+
+    build(shard=(i, n)) renders only the i-th of n shards of the pages
+    into shard_dir(i); merge(n) then combines the n shard directories
+    into `public_dir`. Shards can run as separate processes or on
+    separate machines, as long as their directories are gathered
+    before the merge.
+
+    Content files matching `page_include` are rendered and static files
+    are copied, skipping anything matching the .gitignore-style `ignore`
+    patterns in either tree.
+
+    The sitemap and the blog's Atom feed need absolute URLs, so they are
+    only written when an absolute `site_url` is given.
+
+    With `memory_threshold` set, every page is rendered under
+    tracemalloc and pages whose peak allocation exceeds that many bytes
+    are listed at the end of the build; the last build's
+    memstats.MemoryReport is kept as `memory_report`.
+
+    With `inline_css_max_size` set, stylesheets linked from a template's
+    <head> whose minified size is at most that many bytes are inlined
+    into the template when it is loaded, once per build.
+
+    Builds use a fresh iopool.IOPool of `io_workers` threads unless a
+    long-lived `io_pool` is given, as the build server does.
+
+    The highlight cache, image sizes and stylesheet inliner belong to
+    the Site and are made current only while it builds, so several
+    sites can be built in one process. Only builds that write print
+    their progress.
+    """
+
+    def __init__(
+        self,
+        content_dir="./content",
+        static_dir="./static",
+        public_dir="./docs",
+        template_path="./template.html",
+        cache_dir=None,
+        basepath="/",
+        site_url="",
+        blog_dir="blog",
+        blog_title="Blog",
+        feed_title="Blog",
+        feed_author="",
+        posts_per_page=default_per_page,
+        io_workers=default_io_workers,
+        page_include=page_include,
+        ignore=default_ignore,
+        memory_threshold=None,
+        inline_css_max_size=None,
+        io_pool=None,
+    ):
+        self.content_dir = content_dir
+        self.static_dir = static_dir
+        self.public_dir = public_dir
+        self.template_path = template_path
+        self.cache_dir = cache_dir
+        self.basepath = basepath
+        if site_url and not urlsplit(site_url).netloc:
+            raise ValueError(f"site URL must be absolute, like https://example.com: {site_url}")
+        self.site_url = site_url.rstrip("/")
+        self.blog_dir = blog_dir
+        self.blog_title = blog_title
+        self.feed_title = feed_title
+        self.feed_author = feed_author
+        self.posts_per_page = posts_per_page
+        self.io_workers = io_workers
+        self.page_include = page_include
+        self.ignore = ignore
+        self.memory_threshold = memory_threshold
+        self.memory_report = None
+        self.inline_css_max_size = inline_css_max_size
+        self.io_pool = io_pool
+        self.highlight_cache = HighlightCache()
+        self.image_sizes = ImageSizes()
+        self.css_inliner = CssInliner()
+
+    def build(self, write=True, shard=None):
+        public_dir = self.public_dir
+        if shard is not None:
+            check_shard(shard)
+            public_dir = self.shard_dir(shard[0])
+        if write:
+            output = StagedOutput(public_dir)
+            log = print
+        else:
+            output = MemoryOutput(public_dir)
+            log = quiet
+        log("Preparing staging directory...")
+        memory_report = None
+        if self.memory_threshold is not None:
+            memory_report = MemoryReport(self.memory_threshold)
+            memory_report.start()
+        self.memory_report = memory_report
+        dest_dir_path = output.begin()
+        try:
+            with self.rendering(write):
+                states = self.generate(dest_dir_path, output, write, shard, memory_report, log)
+        except BaseException:
+            log("Build failed, keeping the previous public directory")
+            output.abort()
+            raise
+        finally:
+            if memory_report is not None:
+                memory_report.stop()
+        if not write:
+            output.commit()
+            return output.files
+        changes = self.commit(output)
+        # Saved only once the output they describe is in place.
+        for state_path, state in states:
+            save_state(state_path, state)
+        if memory_report is not None:
+            print(memory_report.report())
+        return changes
+
+    @contextmanager
+    def rendering(self, persist_state=True):
+        """
+        Make this site's highlight cache, image sizes and stylesheet
+        inliner the current ones for the duration of the block.
+        """
+        if persist_state and self.cache_dir is not None:
+            self.highlight_cache.cache_dir = os.path.join(self.cache_dir, "highlight")
+        else:
+            self.highlight_cache.cache_dir = None
+        self.image_sizes.static_dir = self.static_dir
+        self.css_inliner.static_dir = self.static_dir
+        self.css_inliner.max_size = self.inline_css_max_size
+        tokens = [
+            (current_highlight_cache, current_highlight_cache.set(self.highlight_cache)),
+            (current_image_sizes, current_image_sizes.set(self.image_sizes)),
+            (current_css_inliner, current_css_inliner.set(self.css_inliner)),
+        ]
+        try:
+            yield
+        finally:
+            for var, token in reversed(tokens):
+                var.reset(token)
+
+    def check(self, workers=None):
+        """
+        Validate the content without rendering or writing anything and
+        return the errors as sorted (path, line, message) tuples; see
+        contentcheck.check_site().
+        """
+        return check_site(
+            self.content_dir,
+            self.static_dir,
+            self.public_dir,
+            self.blog_dir,
+            self.posts_per_page,
+            self.page_include,
+            self.ignore,
+            workers,
+        )
+
+    def shard_dir(self, index):
+        return f"{os.path.normpath(self.public_dir)}.shard{index}"
+
+    def merge(self, shard_count):
+        """
+        Combine the output of shards 1..shard_count into `public_dir`.
+
+        Files are taken from each shard's manifest; the partial search
+        indexes are merged into one. A path written with different
+        content by two shards is an error.
+        """
+        check_shard((1, shard_count))
+        output = StagedOutput(self.public_dir)
+        print("Preparing staging directory...")
+        dest_dir_path = output.begin()
+        try:
+            search_index = SearchIndex(dest_dir_path, self.basepath)
+            digests = {}
+            for index in range(1, shard_count + 1):
+                shard_dir = self.shard_dir(index)
+                manifest_path = os.path.join(shard_dir, manifest_filename)
+                if not os.path.exists(manifest_path):
+                    raise ValueError(f"shard {index}/{shard_count} is missing: {shard_dir}")
+                print(f"Merging {shard_dir}...")
+                for rel_path, digest in sorted(load_manifest(manifest_path).items()):
+                    if rel_path.startswith("search/"):
+                        continue
+                    if digests.setdefault(rel_path, digest) != digest:
+                        raise ValueError(f"shards disagree on the contents of {rel_path}")
+                    output.copy(
+                        os.path.join(shard_dir, rel_path),
+                        os.path.join(dest_dir_path, rel_path),
+                        digest,
+                    )
+                shard_search_dir = os.path.join(shard_dir, "search")
+                if os.path.exists(os.path.join(shard_search_dir, "pages.json")):
+                    search_index.merge(
+                        SearchIndex.load(shard_search_dir, dest_dir_path, self.basepath)
+                    )
+            print("Writing search index...")
+            search_index.write(os.path.join(dest_dir_path, "search"), output.write)
+        except BaseException:
+            print("Merge failed, keeping the previous public directory")
+            output.abort()
+            raise
+        return self.commit(output)
+
+    def commit(self, output):
+        print("Swapping staging directory into place...")
+        changes = output.commit()
+        print(
+            f"{len(changes['added'])} added, {len(changes['changed'])} changed, "
+            f"{len(changes['removed'])} removed"
+        )
+        return changes
+
+    def generate(
+        self, dest_dir_path, output, persist_state=True, shard=None, memory_report=None, log=print
+    ):
+        """
+        Generate the site into dest_dir_path. In a sharded build the
+        first shard also copies static files and writes the listings,
+        sitemap and feed; every shard scans all page metadata, so these
+        come out the same as in a single build.
+
+        Returns the (path, state) pairs to save once the output has been
+        committed.
+        """
+        cache_dir = self.cache_dir if persist_state else None
+        first_shard = shard is None or shard[0] == 1
+
+        search_index = SearchIndex(dest_dir_path, self.basepath)
+        page_index = PageIndex(dest_dir_path, self.basepath)
+        content_sources = find_files(self.content_dir, self.page_include, self.ignore)
+        if self.io_pool is None:
+            io_pool_context = IOPool(self.io_workers)
+        else:
+            io_pool_context = self.io_pool.batch()
+        with io_pool_context as io_pool:
+            log("Generating content...")
+            generate_pages_recursive(
+                self.content_dir,
+                self.template_path,
+                dest_dir_path,
+                self.basepath,
+                search_index,
+                page_index,
+                output.write,
+                io_pool,
+                shard,
+                content_sources,
+                memory_report,
+                log,
+            )
+
+            if first_shard:
+                # Pages take precedence over static files with the same
+                # output path, whichever shard rendered them.
+                def copy_static(from_path, dest_path):
+                    if page_index.page_url(dest_path) not in page_index.pages:
+                        io_pool.submit(output.copy, from_path, dest_path)
+
+                log("Copying static files...")
+                copy_files_recursive(
+                    self.static_dir,
+                    dest_dir_path,
+                    copy_static,
+                    find_files(self.static_dir, ignore=self.ignore),
+                    log,
+                )
+
+        log("Writing search index...")
+        search_index.write(os.path.join(dest_dir_path, "search"), output.write)
+        if not first_shard:
+            return []
+
+        blog_content_dir = os.path.join(self.content_dir, self.blog_dir)
+        blog_dest_dir = os.path.join(dest_dir_path, self.blog_dir)
+        log("Generating listing pages...")
+        listing_state = {}
+        if cache_dir is not None:
+            listing_state_path = os.path.join(cache_dir, "listings.json")
+            listing_state = load_state(listing_state_path)
+        generate_listing_pages(
+            page_index,
+            blog_content_dir,
+            blog_dest_dir,
+            self.template_path,
+            self.basepath,
+            self.blog_title,
+            self.posts_per_page,
+            listing_state,
+            output.write,
+            output.keep,
+            log,
+        )
+        states = []
+        if cache_dir is not None:
+            states.append((listing_state_path, listing_state))
+
+        if not self.site_url:
+            log("No site URL given, skipping the sitemap and feed")
+            return states
+        log("Writing sitemap and feeds...")
+        write_sitemap(
+            page_index,
+            os.path.join(dest_dir_path, "sitemap.xml"),
+            self.site_url,
+            output.write,
+        )
+        write_atom_feed(
+            page_index,
+            blog_content_dir,
+            os.path.join(blog_dest_dir, "feed.xml"),
+            f"{self.basepath}{self.blog_dir}/feed.xml",
+            self.feed_title,
+            self.feed_author or self.feed_title,
+            self.site_url,
+            output.write,
+        )
+        return states
+
+
+def check_shard(shard):
+    index, count = shard
+    if count < 1 or not 1 <= index <= count:
+        raise ValueError(f"invalid shard {index}/{count}")
+
+
+def quiet(*args, **kwargs):
+    pass
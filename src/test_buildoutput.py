@@ -0,0 +1,92 @@
+import json
+import os
+import tempfile
+import unittest
+
+from buildoutput import StagedOutput, changes_filename, diff_manifests, manifest_filename
+
+
+class TestStagedOutput(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.public = os.path.join(self.tmp.name, "docs")
+        self.output = StagedOutput(self.public)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def build(self, files):
+        staging = self.output.begin()
+        for rel_path, data in files.items():
+            self.output.write(os.path.join(staging, rel_path), data)
+        return self.output.commit()
+
+    def read(self, rel_path):
+        with open(os.path.join(self.public, rel_path), "rb") as f:
+            return f.read()
+
+    def test_commit_swaps_into_place(self):
+        self.build({"index.html": b"one", "blog/index.html": b"blog"})
+        self.build({"index.html": b"two"})
+        self.assertEqual(self.read("index.html"), b"two")
+        self.assertFalse(os.path.exists(os.path.join(self.public, "blog")))
+        self.assertFalse(os.path.exists(self.output.staging_dir))
+        self.assertFalse(os.path.exists(self.output.old_dir))
+
+    def test_unchanged_files_are_hardlinked(self):
+        self.build({"same.html": b"same", "changed.html": b"old"})
+        same_inode = os.stat(os.path.join(self.public, "same.html")).st_ino
+        changed_inode = os.stat(os.path.join(self.public, "changed.html")).st_ino
+        self.build({"same.html": b"same", "changed.html": b"new"})
+        self.assertEqual(os.stat(os.path.join(self.public, "same.html")).st_ino, same_inode)
+        self.assertNotEqual(
+            os.stat(os.path.join(self.public, "changed.html")).st_ino, changed_inode
+        )
+        self.assertEqual(self.read("changed.html"), b"new")
+
+    def test_commit_reports_changes(self):
+        changes = self.build({"a.html": b"a", "b.html": b"b"})
+        self.assertEqual(changes, {"added": ["a.html", "b.html"], "changed": [], "removed": []})
+        changes = self.build({"a.html": b"a2", "c.html": b"c"})
+        self.assertEqual(changes, {"added": ["c.html"], "changed": ["a.html"], "removed": ["b.html"]})
+        self.assertEqual(json.loads(self.read(changes_filename)), changes)
+        self.assertEqual(sorted(json.loads(self.read(manifest_filename))), ["a.html", "c.html"])
+
+    def test_unchanged_files_keep_mtime(self):
+        self.build({"same.html": b"same"})
+        path = os.path.join(self.public, "same.html")
+        os.utime(path, (1000000000, 1000000000))
+        self.build({"same.html": b"same"})
+        self.assertEqual(os.stat(path).st_mtime, 1000000000)
+
+    def test_keep_requires_previous_entry(self):
+        staging = self.output.begin()
+        self.assertFalse(self.output.keep(os.path.join(staging, "index.html")))
+        self.output.abort()
+        self.build({"index.html": b"one"})
+        staging = self.output.begin()
+        self.assertTrue(self.output.keep(os.path.join(staging, "index.html")))
+        self.assertEqual(self.output.commit()["changed"], [])
+        self.assertEqual(self.read("index.html"), b"one")
+
+    def test_abort_keeps_previous_build(self):
+        self.build({"index.html": b"good"})
+        staging = self.output.begin()
+        self.output.write(os.path.join(staging, "index.html"), b"half")
+        self.output.abort()
+        self.assertEqual(self.read("index.html"), b"good")
+        self.assertFalse(os.path.exists(staging))
+
+
+class TestDiffManifests(unittest.TestCase):
+    def test_diff(self):
+        old = {"a": "1", "b": "2", "c": "3"}
+        new = {"a": "1", "b": "9", "d": "4"}
+        self.assertEqual(
+            diff_manifests(old, new),
+            {"added": ["d"], "changed": ["b"], "removed": ["c"]},
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,128 @@
+import io
+import os
+import tempfile
+import threading
+import time
+import unittest
+from contextlib import redirect_stdout
+
+from buildclient import request_build
+from buildserver import BuildServer, MessageWriter, remove_stale_socket
+from main import make_parser, run
+
+
+def start_server(test_case, socket_path, run):
+    """
+    Serve builds on `socket_path` from a thread until the test ends.
+    """
+    server = BuildServer(socket_path, make_parser(), run)
+
+    def serve():
+        with redirect_stdout(io.StringIO()):
+            server.serve()
+
+    thread = threading.Thread(target=serve)
+    thread.start()
+    test_case.addCleanup(thread.join)
+    deadline = time.monotonic() + 5
+    while server.server is None or not os.path.exists(socket_path):
+        test_case.assertLess(time.monotonic(), deadline)
+        time.sleep(0.01)
+    test_case.addCleanup(server.shutdown)
+    return server
+
+
+class TestBuildServer(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.socket_path = os.path.join(self.tmp.name, "build.sock")
+        self.builds = []
+        self.server = start_server(self, self.socket_path, self.fake_run)
+
+    def fake_run(self, parser, args, io_pool):
+        self.builds.append((args.basepath, io_pool))
+        if args.basepath == "/fail/":
+            raise ValueError("no title found")
+        print("Generating content...")
+        print("done", end="")
+
+    def request(self, argv):
+        out = io.StringIO()
+        return request_build(argv, self.socket_path, out), out.getvalue()
+
+    def test_build(self):
+        self.assertEqual(self.request(["/site/"]), (0, "Generating content...\ndone"))
+        self.assertEqual(self.request(["/site/"])[0], 0)
+        (_, first_pool), (_, second_pool) = self.builds
+        self.assertIs(first_pool, second_pool)
+
+    def test_errors(self):
+        status, output = self.request(["/fail/"])
+        self.assertEqual(status, 1)
+        self.assertIn("ValueError: no title found", output)
+        status, output = self.request(["--shard", "2/1"])
+        self.assertEqual(status, 2)
+        self.assertIn("invalid parse_shard value", output)
+        self.assertEqual(self.request(["--daemon"])[0], 2)
+        self.assertEqual(self.builds, [("/fail/", self.server.io_pool)])
+
+    def test_one_server_per_socket(self):
+        with self.assertRaises(ValueError):
+            remove_stale_socket(self.socket_path)
+
+
+class TestBuildServerSite(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        root = self.tmp.name
+        files = {
+            "content/index.md": "# Home\n\n[Tom](/blog/tom/)",
+            "content/blog/tom/index.md": "---\ndate: 2024-01-01\n---\n# Tom\n\nHey dol!",
+            "static/index.css": "body {}",
+            "template.html": "<title>{{ Title }}</title>{{ Content }}",
+        }
+        for rel_path, text in files.items():
+            path = os.path.join(root, rel_path)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(text)
+        self.addCleanup(os.chdir, os.getcwd())
+        os.chdir(root)
+        self.socket_path = os.path.join(root, "build.sock")
+        self.server = start_server(self, self.socket_path, run)
+
+    def request(self, argv):
+        out = io.StringIO()
+        return request_build(argv, self.socket_path, out), out.getvalue()
+
+    def test_builds_share_io_pool(self):
+        status, output = self.request(["/site/"])
+        self.assertEqual(status, 0, output)
+        self.assertIn("10 added, 0 changed, 0 removed", output)
+        io_pool = self.server.io_pool
+        with open(os.path.join("content", "index.md"), "a", encoding="utf-8") as f:
+            f.write("\n\nMore.")
+        status, output = self.request(["/site/"])
+        self.assertEqual(status, 0, output)
+        self.assertIs(self.server.io_pool, io_pool)
+        with open(os.path.join("docs", "index.html"), encoding="utf-8") as f:
+            self.assertIn("<p>More.</p>", f.read())
+        with open(os.path.join("docs", "blog", "tom", "index.html"), encoding="utf-8") as f:
+            self.assertIn("Hey dol!", f.read())
+
+
+class TestMessageWriter(unittest.TestCase):
+    def test_sends_whole_lines(self):
+        wfile = io.BytesIO()
+        writer = MessageWriter(wfile)
+        writer.write("a")
+        writer.write("b\nc\nd")
+        self.assertEqual(wfile.getvalue(), b'{"output": "ab\\nc\\n"}\n')
+        writer.flush()
+        self.assertEqual(wfile.getvalue().splitlines()[-1], b'{"output": "d"}')
+
+
+if __name__ == "__main__":
+    unittest.main()
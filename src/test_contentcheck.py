@@ -0,0 +1,116 @@
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+
+from contentcheck import check_pages, link_target, numbered_blocks
+from highlight import highlight_cache
+from main import main
+from sitebuilder import Site
+
+
+class TestCheckSite(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = self.tmp.name
+        files = {
+            "content/index.md": "# Home\n\n[Tom](/blog/tom) [Blog](/blog/) [Tags](/blog/tags/tom/)\n\n![Tom](/images/tom.png)",
+            "content/blog/tom/index.md": "---\ntags: [tom]\n---\n# Tom\n\n[Home](../../) [Feed](/blog/feed.xml) [Top](#top)\n\n[Old](https://example.com/gone)",
+            "content/broken.md": (
+                "---\ntitle: Broken\n---\nIntro with **bold\n\n"
+                "####### Too deep\n\n#Unspaced\n\n"
+                "Text\nthen a [missing](/blog/missing/) link\n\n"
+                "```\nunclosed"
+            ),
+            "content/untitled.md": "No title here, only [a draft](/draft/)",
+            "content/draft.md": "---\ndraft: true\n---\n# Draft",
+            "content/bad_front_matter.md": "---\ntitle: x\n",
+            "static/images/tom.png": "png",
+        }
+        for rel_path, text in files.items():
+            path = os.path.join(self.root, rel_path)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(text)
+        self.site = Site(
+            content_dir=os.path.join(self.root, "content"),
+            static_dir=os.path.join(self.root, "static"),
+            public_dir=os.path.join(self.root, "docs"),
+        )
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def content_path(self, rel_path):
+        return os.path.join(self.root, "content", rel_path)
+
+    def test_reports_errors_with_lines(self):
+        errors = [(os.path.relpath(path, self.site.content_dir), line, message) for path, line, message in self.site.check()]
+        self.assertEqual(
+            errors,
+            [
+                ("bad_front_matter.md", 1, f"invalid front matter in {self.content_path('bad_front_matter.md')}, closing --- not found"),
+                ("broken.md", 4, "invalid markdown, formatted section not closed"),
+                ("broken.md", 6, "invalid heading level, at most 6 #s"),
+                ("broken.md", 8, "invalid heading, no space after #"),
+                ("broken.md", 11, "broken link: /blog/missing/"),
+                ("broken.md", 13, "invalid markdown, formatted section not closed"),
+                ("untitled.md", 1, "broken link: /draft/"),
+                ("untitled.md", 1, "no title found"),
+            ],
+        )
+        self.assertFalse(os.path.exists(self.site.public_dir))
+
+    def test_parallel_matches_serial(self):
+        from_paths = [self.content_path(rel_path) for rel_path in ("index.md", "broken.md", "untitled.md")] * 30
+        self.assertEqual(check_pages(from_paths, workers=2), check_pages(from_paths, workers=1))
+
+    def test_clean_content(self):
+        for rel_path in ("broken.md", "untitled.md", "bad_front_matter.md"):
+            os.remove(self.content_path(rel_path))
+        self.assertEqual(self.site.check(), [])
+
+    def test_highlight_cache_not_written(self):
+        with open(self.content_path("code.md"), "w", encoding="utf-8") as f:
+            f.write("# Code\n\n```python\nprint('tom')\n```")
+        cache_dir = os.path.join(self.root, ".cache", "highlight")
+        self.addCleanup(setattr, highlight_cache, "cache_dir", highlight_cache.cache_dir)
+        highlight_cache.cache_dir = cache_dir
+        self.site.check()
+        self.assertFalse(os.path.exists(cache_dir))
+        self.assertEqual(highlight_cache.cache_dir, cache_dir)
+
+    def test_numbered_blocks(self):
+        markdown = "\n\n# A\n\nb\nc\n\n\n\nd"
+        self.assertEqual(list(numbered_blocks(markdown, 3)), [(5, "# A"), (7, "b\nc"), (12, "d")])
+
+    def test_link_target(self):
+        self.assertEqual(link_target("/blog/tom/", "../"), "/blog/")
+        self.assertEqual(link_target("/blog/tom/", "a%20b.png?x=1#y"), "/blog/tom/a b.png")
+        self.assertIsNone(link_target("/", "#top"))
+        self.assertIsNone(link_target("/", "mailto:tom@example.com"))
+        self.assertIsNone(link_target("/", "//example.com/x"))
+
+
+class TestCheckCommand(unittest.TestCase):
+    def test_exit_status(self):
+        cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as root:
+            os.makedirs(os.path.join(root, "content"))
+            os.makedirs(os.path.join(root, "static"))
+            with open(os.path.join(root, "content", "index.md"), "w", encoding="utf-8") as f:
+                f.write("# Home\n\n_unclosed")
+            os.chdir(root)
+            try:
+                out = StringIO()
+                with redirect_stdout(out), self.assertRaises(SystemExit) as exit:
+                    main(["--check"])
+            finally:
+                os.chdir(cwd)
+        self.assertEqual(exit.exception.code, 1)
+        self.assertEqual(out.getvalue(), "./content/index.md:3: invalid markdown, formatted section not closed\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
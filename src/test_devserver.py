@@ -0,0 +1,51 @@
+import os
+import tempfile
+import unittest
+
+from devserver import DevServer, PageCache
+from fixtures import write_fixture
+
+
+class TestDevServer(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.content = os.path.join(self.tmp.name, "content")
+        self.template = os.path.join(self.tmp.name, "template.html")
+        write_fixture(self.template, "<title>{{ Title }}</title>{{ Content }}")
+        write_fixture(os.path.join(self.content, "index.md"), "# Home")
+        write_fixture(os.path.join(self.content, "about.md"), "# About")
+        write_fixture(os.path.join(self.content, "blog", "tom", "index.md"), "# Tom")
+        self.server = DevServer(self.content, self.tmp.name, self.template, cache_size=2)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_content_path(self):
+        tom = os.path.join(self.content, "blog", "tom", "index.md")
+        self.assertEqual(self.server.content_path("/"), os.path.join(self.content, "index.md"))
+        self.assertEqual(self.server.content_path("/blog/tom/"), tom)
+        self.assertEqual(self.server.content_path("/blog/tom"), tom)
+        self.assertEqual(self.server.content_path("/blog/tom/index.html?x=1"), tom)
+        self.assertEqual(self.server.content_path("/about.html"), os.path.join(self.content, "about.md"))
+        self.assertIsNone(self.server.content_path("/index.css"))
+        self.assertIsNone(self.server.content_path("/../template"))
+
+    def test_render_is_cached_until_source_changes(self):
+        from_path = os.path.join(self.content, "about.md")
+        self.assertEqual(self.server.render(from_path), b"<title>About</title><div><h1 id=\"about\">About</h1></div>")
+        cached = self.server.render(from_path)
+        self.assertIs(self.server.render(from_path), cached)
+        write_fixture(from_path, "# About us", mtime=1)
+        self.assertIn(b"<title>About us</title>", self.server.render(from_path))
+
+    def test_lru_eviction(self):
+        cache = PageCache(max_size=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        self.assertEqual(list(cache.entries), ["a", "c"])
+
+
+if __name__ == "__main__":
+    unittest.main()
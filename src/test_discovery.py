@@ -0,0 +1,89 @@
+import os
+import tempfile
+import unittest
+
+from discovery import PathPatterns, find_files
+
+
+class TestPathPatterns(unittest.TestCase):
+    def test_name_patterns_match_at_any_depth(self):
+        patterns = PathPatterns(["*:Zone.Identifier"])
+        self.assertTrue(patterns.matches("tom.png:Zone.Identifier"))
+        self.assertTrue(patterns.matches("images/tom.png:Zone.Identifier"))
+        self.assertFalse(patterns.matches("images/tom.png"))
+
+    def test_anchored_patterns(self):
+        patterns = PathPatterns(["/drafts", "blog/*.tmp"])
+        self.assertTrue(patterns.matches("drafts", is_dir=True))
+        self.assertFalse(patterns.matches("blog/drafts", is_dir=True))
+        self.assertTrue(patterns.matches("blog/a.tmp"))
+        self.assertFalse(patterns.matches("blog/tom/a.tmp"))
+
+    def test_double_star(self):
+        patterns = PathPatterns(["blog/**/*.tmp"])
+        self.assertTrue(patterns.matches("blog/a.tmp"))
+        self.assertTrue(patterns.matches("blog/tom/old/a.tmp"))
+        self.assertFalse(patterns.matches("a.tmp"))
+
+    def test_directory_only_and_negation(self):
+        patterns = PathPatterns(["build/", "*.css", "!keep.css"])
+        self.assertTrue(patterns.matches("build", is_dir=True))
+        self.assertFalse(patterns.matches("build"))
+        self.assertTrue(patterns.matches("styles.css"))
+        self.assertFalse(patterns.matches("images/keep.css"))
+
+    def test_character_classes(self):
+        patterns = PathPatterns(["file[0-9].txt", "x[!a].txt"])
+        self.assertTrue(patterns.matches("file3.txt"))
+        self.assertFalse(patterns.matches("filea.txt"))
+        self.assertTrue(patterns.matches("xb.txt"))
+        self.assertFalse(patterns.matches("xa.txt"))
+
+
+class TestFindFiles(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        for rel_path in [
+            "index.md",
+            "blog/tom/index.md",
+            "blog/tom/notes.txt",
+            "blog/a/index.md",
+            "images/tom.png",
+            "images/tom.png:Zone.Identifier",
+            "drafts/wip.md",
+        ]:
+            path = os.path.join(self.tmp.name, rel_path)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "w") as f:
+                f.write(rel_path)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_sorted_and_ignored(self):
+        files = find_files(self.tmp.name)
+        self.assertEqual(
+            [rel_path for rel_path, _ in files],
+            [
+                "blog/a/index.md",
+                "blog/tom/index.md",
+                "blog/tom/notes.txt",
+                "drafts/wip.md",
+                "images/tom.png",
+                "index.md",
+            ],
+        )
+        rel_path, entry = files[-1]
+        self.assertEqual(entry.path, os.path.join(self.tmp.name, "index.md"))
+        self.assertEqual(entry.stat().st_size, len("index.md"))
+
+    def test_include_and_ignored_directories(self):
+        files = find_files(self.tmp.name, include=["*.md"], ignore=["drafts/"])
+        self.assertEqual(
+            [rel_path for rel_path, _ in files],
+            ["blog/a/index.md", "blog/tom/index.md", "index.md"],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+import os
+import tempfile
+import unittest
+
+from feeds import write_atom_feed, write_sitemap
+from pageindex import PageIndex, page_updated
+
+
+class TestFeeds(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.content = os.path.join(self.tmp.name, "content")
+        self.public = os.path.join(self.tmp.name, "docs")
+        self.index = PageIndex(self.public, "/site/")
+        self.add_page("index.md", "index.html", "Home", 100)
+        self.add_page("blog/tom/index.md", "blog/tom/index.html", "Tom & Goldberry", 300)
+        self.add_page("blog/old/index.md", "blog/old/index.html", "Old", 200)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def add_page(self, source, dest, title, mtime):
+        from_path = os.path.join(self.content, source)
+        os.makedirs(os.path.dirname(from_path), exist_ok=True)
+        with open(from_path, "w", encoding="utf-8") as f:
+            f.write(f"# {title}")
+        os.utime(from_path, (mtime, mtime))
+        self.index.add(from_path, os.path.join(self.public, dest), {"title": title})
+
+    def test_sitemap(self):
+        dest_path = os.path.join(self.public, "sitemap.xml")
+        self.assertTrue(write_sitemap(self.index, dest_path, "https://example.org"))
+        with open(dest_path, encoding="utf-8") as f:
+            sitemap = f.read()
+        self.assertIn(
+            "<url><loc>https://example.org/site/blog/tom/</loc>"
+            "<lastmod>1970-01-01T00:05:00Z</lastmod></url>",
+            sitemap,
+        )
+        self.assertEqual(sitemap.count("<url>"), 3)
+        self.assertFalse(write_sitemap(self.index, dest_path, "https://example.org"))
+
+    def test_atom_feed_only_covers_collection(self):
+        dest_path = os.path.join(self.public, "blog", "feed.xml")
+        write_atom_feed(
+            self.index,
+            os.path.join(self.content, "blog"),
+            dest_path,
+            "/site/blog/feed.xml",
+            "Blog",
+            "Tom Bombadil",
+            "https://example.org",
+        )
+        with open(dest_path, encoding="utf-8") as f:
+            feed = f.read()
+        self.assertIn("<updated>1970-01-01T00:05:00Z</updated>", feed)
+        self.assertIn("<title>Tom &amp; Goldberry</title>", feed)
+        self.assertIn("<id>https://example.org/site/blog/feed.xml</id>", feed)
+        self.assertIn("<author><name>Tom Bombadil</name></author>", feed)
+        self.assertIn("<id>https://example.org/site/blog/tom/</id>", feed)
+        self.assertNotIn("Home", feed)
+        self.assertLess(feed.index("Goldberry"), feed.index("Old"))
+
+
+class TestPageUpdated(unittest.TestCase):
+    def test_dates(self):
+        page = {"source": "tom.md", "mtime": 300, "date": "2024-03-01"}
+        self.assertEqual(page_updated(page), "2024-03-01T00:00:00Z")
+        self.assertEqual(page_updated(dict(page, date=None)), "1970-01-01T00:05:00Z")
+        for date in ("2024-3-1", "2024-02-30", "March 1st", "2024-03-01T10:00:00Z"):
+            with self.assertRaisesRegex(ValueError, "invalid date in tom.md"):
+                page_updated(dict(page, date=date))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+import os
+import tempfile
+import unittest
+
+from frontmatter import max_front_matter_lines, read_metadata
+
+
+DOC = """---
+title: "Tom: a mistake?"
+date: 2024-03-01
+tags: [tolkien, characters]
+draft: false
+---
+# Heading
+
+Body text
+"""
+
+
+class TestFrontMatter(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "index.md")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def read(self, text):
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write(text)
+        return read_metadata(self.path)
+
+    def body(self, metadata):
+        with open(self.path, "rb") as f:
+            f.seek(metadata["body_offset"])
+            return f.read().decode("utf-8")
+
+    def test_read_metadata(self):
+        metadata = self.read(DOC)
+        self.assertEqual(
+            metadata,
+            {
+                "title": "Tom: a mistake?",
+                "date": "2024-03-01",
+                "tags": ["tolkien", "characters"],
+                "draft": False,
+                "body_offset": len(DOC) - len("# Heading\n\nBody text\n"),
+            },
+        )
+        self.assertEqual(self.body(metadata), "# Heading\n\nBody text\n")
+
+    def test_no_front_matter(self):
+        self.assertEqual(self.read("# Title\n"), {"title": "Title", "body_offset": 0})
+
+    def test_unclosed_front_matter(self):
+        with self.assertRaisesRegex(ValueError, "closing --- not found"):
+            self.read("---\ntitle: x\n# Title\n")
+
+    def test_closing_fence_on_last_line(self):
+        metadata = self.read("---\ntitle: X\n---")
+        self.assertEqual(metadata["title"], "X")
+        self.assertEqual(self.body(metadata), "")
+
+    def test_front_matter_line_limit(self):
+        # The closing fence counts towards the limit.
+        lines = "".join(f"k{i}: v\n" for i in range(max_front_matter_lines - 1))
+        self.assertEqual(len(self.read(f"---\n{lines}---\n# T")), max_front_matter_lines + 1)
+        with self.assertRaises(ValueError):
+            self.read(f"---\n{lines}k: v\n---\n")
+
+    def test_string_fields(self):
+        for value in ("true", "[a, b]"):
+            with self.assertRaisesRegex(ValueError, "index.md, title must be a string"):
+                self.read(f"---\ntitle: {value}\n---\n# Heading")
+
+    def test_bool_fields(self):
+        self.assertTrue(self.read("---\ndraft: yes\n---\n# T")["draft"])
+        for value in ('"false"', "maybe", "[true]"):
+            with self.assertRaisesRegex(ValueError, "index.md, draft must be true or false"):
+                self.read(f"---\ndraft: {value}\n---\n# T")
+
+    def test_read_metadata_title_fallback(self):
+        self.assertEqual(
+            self.read("Intro\n\n# Tolkien Fan Club\n\nmore"),
+            {"title": "Tolkien Fan Club", "body_offset": 0},
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,247 @@
+import random
+import re
+import sys
+import time
+import unittest
+
+import supporting_funcs
+from inline_markdown import text_to_textnodes
+from markdown_blocks import markdown_to_html_node
+from textnode import TextNode, TextType
+
+
+# Differential fuzzing of the inline and quote parsers against the
+# implementations they replaced, plus linear-time checks on hostile input.
+# Inputs come from a seeded generator, so a failure always reproduces.
+seed = 20240601
+fuzz_cases = 2000
+
+# Quadrupling the input of a linear parser should take about 4x as long;
+# a quadratic one takes 16x. The budget sits between the two with room
+# for a noisy machine.
+scale = 4
+max_growth = 8
+
+
+# Reference implementations, as they were before the linear rewrite.
+
+
+def ref_split_nodes(old_nodes, extract, markdown, text_type):
+    new_nodes = []
+    for old_node in old_nodes:
+        if old_node.text_type != TextType.TEXT:
+            new_nodes.append(old_node)
+            continue
+        original_text = old_node.text
+        matches = extract(original_text)
+        if len(matches) == 0:
+            new_nodes.append(old_node)
+            continue
+        for label, url in matches:
+            sections = original_text.split(markdown.format(label, url), 1)
+            if sections[0] != "":
+                new_nodes.append(TextNode(sections[0], TextType.TEXT))
+            new_nodes.append(TextNode(label, text_type, url))
+            original_text = sections[1]
+        if original_text != "":
+            new_nodes.append(TextNode(original_text, TextType.TEXT))
+    return new_nodes
+
+
+def ref_text_to_textnodes(text):
+    from inline_markdown import extract_markdown_images, extract_markdown_links, split_nodes_delimiter
+
+    nodes = [TextNode(text, TextType.TEXT)]
+    nodes = split_nodes_delimiter(nodes, "**", TextType.BOLD)
+    nodes = split_nodes_delimiter(nodes, "_", TextType.ITALIC)
+    nodes = split_nodes_delimiter(nodes, "`", TextType.CODE)
+    nodes = ref_split_nodes(nodes, extract_markdown_images, "![{}]({})", TextType.IMAGE)
+    nodes = ref_split_nodes(nodes, extract_markdown_links, "[{}]({})", TextType.LINK)
+    return nodes
+
+
+def ref_convert_inline_formatting(text):
+    text = re.sub(r"\[([^\]]+)\]\(([^)]+)\)", r'<a href="\2">\1</a>', text)
+    text = re.sub(r"\*\*(.*?)\*\*", r"<b>\1</b>", text)
+    text = re.sub(r"_(.*?)_", r"<i>\1</i>", text)
+    return text
+
+
+def ref_process_nested_quotes(lines):
+    from htmlnode import LeafNode, ParentNode
+
+    if not lines:
+        return []
+    current_level_nodes = []
+    current_depth = lines[0].count(">")
+    while lines:
+        line_depth = lines[0].count(">")
+        if line_depth > current_depth:
+            nested_nodes = ref_process_nested_quotes(lines)
+            current_level_nodes.append(ParentNode("blockquote", nested_nodes))
+        elif line_depth == current_depth:
+            stripped_line = lines.pop(0).lstrip("> ").strip()
+            if stripped_line:
+                last = current_level_nodes[-1] if current_level_nodes else None
+                if isinstance(last, LeafNode) and last.tag == "blockquote":
+                    last.value += " " + stripped_line
+                else:
+                    current_level_nodes.append(LeafNode("blockquote", stripped_line))
+        else:
+            break
+    return [ParentNode("blockquote", current_level_nodes)]
+
+
+# Hostile input generators.
+
+inline_tokens = [
+    "a", "b", " ", " ", "\n", "[", "]", "(", ")", "!", "*", "**", "_", "`",
+    "[a](b)", "![x](y.png)", "[](u)", "[t]()", "[a](", "**b", "_i", "![", "](",
+]
+
+
+def random_inline(rng, max_tokens=40):
+    return "".join(rng.choice(inline_tokens) for _ in range(rng.randrange(max_tokens)))
+
+
+def random_quote_lines(rng, max_lines=20):
+    lines = []
+    for _ in range(rng.randrange(1, max_lines)):
+        depth = rng.randrange(1, 5)
+        lines.append(">" * depth + rng.choice(["", " ", "  "]) + rng.choice(["", "a", "b c", "> d"]))
+    return lines
+
+
+def outcome(fn, *args):
+    try:
+        return fn(*args)
+    except ValueError as e:
+        return ("ValueError", str(e))
+
+
+def best_time(fn, arg, repeat=3):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(arg)
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+
+class TestDifferential(unittest.TestCase):
+    def test_text_to_textnodes(self):
+        rng = random.Random(seed)
+        for _ in range(fuzz_cases):
+            text = random_inline(rng)
+            self.assertEqual(outcome(text_to_textnodes, text), outcome(ref_text_to_textnodes, text), repr(text))
+
+    def test_convert_inline_formatting(self):
+        rng = random.Random(seed)
+        for _ in range(fuzz_cases):
+            text = random_inline(rng)
+            self.assertEqual(
+                supporting_funcs.convert_inline_formatting(text),
+                ref_convert_inline_formatting(text),
+                repr(text),
+            )
+
+    def test_legacy_split_nodes(self):
+        # Images are split before links, as in supporting_funcs; the old
+        # link splitter cut text inside an image when run on its own.
+        def ref_split_links(old_nodes):
+            def valid_links(text):
+                links = supporting_funcs.extract_markdown_links(text)
+                return [(label, url) for label, url in links if label and url]
+
+            return ref_split_nodes(old_nodes, valid_links, "[{}]({})", TextType.LINK)
+
+        rng = random.Random(seed)
+        for _ in range(fuzz_cases):
+            node = TextNode(random_inline(rng), TextType.TEXT)
+            nodes = supporting_funcs.split_nodes_image([node])
+            self.assertEqual(
+                nodes,
+                ref_split_nodes([node], supporting_funcs.extract_markdown_images, "![{}]({})", TextType.IMAGE),
+                repr(node.text),
+            )
+            self.assertEqual(supporting_funcs.split_nodes_links(nodes), ref_split_links(nodes), repr(node.text))
+
+    def test_process_nested_quotes(self):
+        rng = random.Random(seed)
+        for _ in range(fuzz_cases):
+            lines = random_quote_lines(rng)
+            actual = [node.to_html() for node in supporting_funcs.process_nested_quotes(list(lines))]
+            expected = [node.to_html() for node in ref_process_nested_quotes(list(lines))]
+            self.assertEqual(actual, expected, repr(lines))
+
+    def test_deeply_nested_quotes(self):
+        # Well past the recursion limit, where the reference parser fails,
+        # so the shape is checked directly: each level holds its text and
+        # then the next level.
+        depth = 3 * sys.getrecursionlimit()
+        lines = [">" * (i + 1) + " a" for i in range(depth)]
+        (node,) = supporting_funcs.process_nested_quotes(lines)
+        for level in range(depth):
+            leaf = node.children[0]
+            self.assertEqual((leaf.tag, leaf.value), ("blockquote", "a"))
+            if level < depth - 1:
+                node = node.children[1].children[0]
+        self.assertEqual(len(node.children), 1)
+
+
+class TestLinearTime(unittest.TestCase):
+    def assertLinear(self, fn, make_input, size):
+        small = best_time(fn, make_input(size))
+        large = best_time(fn, make_input(size * scale))
+        growth = large / small
+        self.assertLess(growth, max_growth, f"{scale}x the input took {growth:.1f}x as long")
+
+    def test_many_links(self):
+        self.assertLinear(text_to_textnodes, lambda n: "see [a](b) and ![c](d.png) " * n, 2000)
+
+    def test_many_links_legacy(self):
+        self.assertLinear(
+            lambda text: supporting_funcs.split_nodes_links([TextNode(text, TextType.TEXT)]),
+            lambda n: "see [a](b) " * n,
+            2000,
+        )
+
+    def test_unclosed_brackets(self):
+        self.assertLinear(supporting_funcs.convert_inline_formatting, lambda n: "[a" * n, 5000)
+        self.assertLinear(supporting_funcs.convert_inline_formatting, lambda n: "[a](b" * n, 5000)
+
+    def test_unclosed_emphasis(self):
+        self.assertLinear(supporting_funcs.convert_inline_formatting, lambda n: "**a _b\n" * n, 5000)
+
+    def test_long_quote(self):
+        self.assertLinear(
+            lambda lines: supporting_funcs.process_nested_quotes(list(lines)),
+            lambda n: ["> " + "word " * 5] * n,
+            3000,
+        )
+
+    def test_nested_quotes(self):
+        self.assertLinear(
+            lambda lines: supporting_funcs.process_nested_quotes(list(lines)),
+            lambda n: [">" * (i % 50 + 1) + " a" for i in range(n)],
+            2000,
+        )
+
+    def test_hostile_page(self):
+        def page(n):
+            return "\n\n".join(
+                [
+                    "# Title",
+                    "[a](b) " * n,
+                    "\n".join(["> quoted line"] * n),
+                    "\n".join(f"- item [{i}](u{i})" for i in range(n)),
+                ]
+            )
+
+        self.assertLinear(markdown_to_html_node, page, 1000)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+import os
+import tempfile
+import unittest
+
+from highlight import LEXERS, HighlightCache, Lexer, get_lexer, highlight, register_lexer
+from markdown_blocks import code_to_html_node
+
+
+class TestHighlight(unittest.TestCase):
+    def test_python_tokens(self):
+        tokens = list(get_lexer("py").tokenize('def f():  # hi\n    return "x"'))
+        self.assertIn(("keyword", "def"), tokens)
+        self.assertIn(("comment", "# hi"), tokens)
+        self.assertIn(("string", '"x"'), tokens)
+        self.assertEqual("".join(text for _, text in tokens), 'def f():  # hi\n    return "x"')
+
+    def test_json_keys(self):
+        html = highlight('{"a": "b<c"}', "json", HighlightCache())
+        self.assertEqual(
+            html,
+            '{<span class="tok-key">"a"</span>: <span class="tok-string">"b&lt;c"</span>}',
+        )
+
+    def test_unknown_language(self):
+        self.assertIsNone(highlight("x", "cobol", HighlightCache()))
+
+    def test_code_block_language(self):
+        node = code_to_html_node("```shell\necho $HOME\n```")
+        self.assertEqual(
+            node.to_html(),
+            '<pre><code class="language-shell"><span class="tok-builtin">echo</span> '
+            '<span class="tok-variable">$HOME</span>\n</code></pre>',
+        )
+        self.assertEqual(code_to_html_node("```\nplain\n```").to_html(), "<pre><code>plain\n</code></pre>")
+
+    def test_disk_cache(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = HighlightCache(tmp)
+            first = highlight("x = 1", "python", cache)
+            self.assertEqual(len(os.listdir(tmp)), 1)
+            fresh = HighlightCache(tmp)
+            self.assertEqual(highlight("x = 1", "python", fresh), first)
+            self.assertEqual(len(fresh.entries), 1)
+
+    def test_register_lexer(self):
+        class IniLexer(Lexer):
+            name = "ini"
+            rules = [("key", r"^\w+(?==)")]
+
+        lexers = dict(LEXERS)
+
+        def restore_lexers():
+            LEXERS.clear()
+            LEXERS.update(lexers)
+
+        self.addCleanup(restore_lexers)
+        register_lexer(IniLexer(), "cfg")
+        self.assertEqual(
+            highlight("a=1", "cfg", HighlightCache()), '<span class="tok-key">a</span>=1'
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
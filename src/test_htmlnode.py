@@ -1,69 +1,103 @@
-import unittest
-from htmlnode import HTMLNode
-from htmlnode import LeafNode
-from htmlnode import ParentNode
-from textnode import TextNode
-from htmlnode import text_node_to_html_node
-from textnode import TextType
-
-class TestHTMLNode(unittest.TestCase):
-    def test_props_to_html_empty(self):
-        # Test props_to_html with empty props
-        node = HTMLNode("div", "Hello, world!")
-        self.assertEqual(node.props_to_html(), "")
-
-    def test_props_to_html_single_prop(self):
-        # Test props_to_html with a single prop
-        node = HTMLNode("div", "Hello, world!", None, {"class": "container"})
-        self.assertEqual(node.props_to_html(), ' class="container"')
-
-    def test_props_to_html_multiple_props(self):
-        # Test props_to_html with multiple props
-        node = HTMLNode("a", "Click me!", None, {"href": "https://www.google.com", "target": "_blank"})
-        # The order of props might be different, so we need to check each part separately
-        result = node.props_to_html()
-        self.assertIn(' href="https://www.google.com"', result)
-        self.assertIn(' target="_blank"', result)
-        self.assertEqual(len(result.strip().split()), 2)  # Should have exactly 2 props
-
-    def test_leaf_to_html_p(self):
-        node = LeafNode("p", "Hello, world!")
-        node1 = LeafNode("p", "Hello, world!", {"class": "text"})
-        self.assertEqual(node.tag, "p")
-        self.assertEqual(node.to_html(), "<p>Hello, world!</p>")
-        self.assertEqual(node.props_to_html(), "")
-        self.assertEqual(node1.to_html(), '<p class="text">Hello, world!</p>')
-        self.assertEqual(node1.props_to_html(), ' class="text"')
-
-    def test_to_html_with_children(self):
-        child_node = LeafNode("span", "child")
-        parent_node = ParentNode("div", [child_node])
-        self.assertEqual(parent_node.to_html(), "<div><span>child</span></div>")
-
-
-
-    def test_to_html_with_props(self):
-        child_node = LeafNode("span", "child")
-        parent_node = ParentNode("div", [child_node], {"class": "container"})
-        self.assertEqual(
-            parent_node.to_html(),
-            '<div class="container"><span>child</span></div>',
-        )
-
-    def test_to_html_with_grandchildren(self):
-        grandchild_node = LeafNode("b", "grandchild")
-        child_node = ParentNode("span", [grandchild_node])
-        parent_node = ParentNode("div", [child_node])
-        self.assertEqual(
-            parent_node.to_html(),
-            "<div><span><b>grandchild</b></span></div>",
-        )
-
-    def test_text(self):
-        node = TextNode("This is a text node", TextType.TEXT)
-        html_node = text_node_to_html_node(node)
-        self.assertEqual(html_node.tag, None)
-        self.assertEqual(html_node.value, "This is a text node")
-
-if __name__ == "__main__":
+import unittest
+from htmlnode import HTMLNode
+from htmlnode import LeafNode
+from htmlnode import ParentNode
+from htmlnode import RawHTMLNode
+from htmlnode import escape_attr, escape_text
+from textnode import TextNode
+from textnode import text_node_to_html_node
+from textnode import TextType
+
+class TestHTMLNode(unittest.TestCase):
+    def test_props_to_html_empty(self):
+        # Test props_to_html with empty props
+        node = HTMLNode("div", "Hello, world!")
+        self.assertEqual(node.props_to_html(), "")
+
+    def test_props_to_html_single_prop(self):
+        # Test props_to_html with a single prop
+        node = HTMLNode("div", "Hello, world!", None, {"class": "container"})
+        self.assertEqual(node.props_to_html(), ' class="container"')
+
+    def test_props_to_html_multiple_props(self):
+        # Test props_to_html with multiple props
+        node = HTMLNode("a", "Click me!", None, {"href": "https://www.google.com", "target": "_blank"})
+        # The order of props might be different, so we need to check each part separately
+        result = node.props_to_html()
+        self.assertIn(' href="https://www.google.com"', result)
+        self.assertIn(' target="_blank"', result)
+        self.assertEqual(len(result.strip().split()), 2)  # Should have exactly 2 props
+
+    def test_leaf_to_html_p(self):
+        node = LeafNode("p", "Hello, world!")
+        node1 = LeafNode("p", "Hello, world!", {"class": "text"})
+        self.assertEqual(node.tag, "p")
+        self.assertEqual(node.to_html(), "<p>Hello, world!</p>")
+        self.assertEqual(node.props_to_html(), "")
+        self.assertEqual(node1.to_html(), '<p class="text">Hello, world!</p>')
+        self.assertEqual(node1.props_to_html(), ' class="text"')
+
+    def test_to_html_with_children(self):
+        child_node = LeafNode("span", "child")
+        parent_node = ParentNode("div", [child_node])
+        self.assertEqual(parent_node.to_html(), "<div><span>child</span></div>")
+
+
+
+    def test_to_html_with_props(self):
+        child_node = LeafNode("span", "child")
+        parent_node = ParentNode("div", [child_node], {"class": "container"})
+        self.assertEqual(
+            parent_node.to_html(),
+            '<div class="container"><span>child</span></div>',
+        )
+
+    def test_to_html_with_grandchildren(self):
+        grandchild_node = LeafNode("b", "grandchild")
+        child_node = ParentNode("span", [grandchild_node])
+        parent_node = ParentNode("div", [child_node])
+        self.assertEqual(
+            parent_node.to_html(),
+            "<div><span><b>grandchild</b></span></div>",
+        )
+
+    def test_text(self):
+        node = TextNode("This is a text node", TextType.TEXT)
+        html_node = text_node_to_html_node(node)
+        self.assertEqual(html_node.tag, None)
+        self.assertEqual(html_node.value, "This is a text node")
+
+    def test_leaf_escapes_value(self):
+        node = LeafNode("code", 'if a < b && c > "d":')
+        self.assertEqual(node.to_html(), '<code>if a &lt; b &amp;&amp; c &gt; "d":</code>')
+        self.assertEqual(LeafNode(None, "<br>").to_html(), "&lt;br&gt;")
+
+    def test_props_escape_quotes(self):
+        node = LeafNode("img", "", {"src": "a.png?x=1&y=2", "alt": 'Tom "Old Tom"'})
+        self.assertEqual(
+            node.to_html(),
+            '<img src="a.png?x=1&amp;y=2" alt="Tom &quot;Old Tom&quot;">',
+        )
+
+    def test_void_elements(self):
+        self.assertEqual(LeafNode("br", "").to_html(), "<br>")
+        node = ParentNode("p", [LeafNode("img", "", {"src": "a.png", "alt": ""}), LeafNode(None, "x")])
+        self.assertEqual(node.to_html(), '<p><img src="a.png" alt="">x</p>')
+
+    def test_uncommon_tags(self):
+        self.assertEqual(LeafNode("kbd", "Ctrl").to_html(), "<kbd>Ctrl</kbd>")
+        self.assertEqual(ParentNode("section", [LeafNode("kbd", "C")]).to_html(), "<section><kbd>C</kbd></section>")
+
+    def test_raw_html_is_not_escaped(self):
+        node = ParentNode("pre", [RawHTMLNode('<span class="x">&lt;</span>', "<")])
+        self.assertEqual(node.to_html(), '<pre><span class="x">&lt;</span></pre>')
+
+    def test_escape_skips_clean_strings(self):
+        text = "Nothing to see here, it's fine"
+        self.assertIs(escape_text(text), text)
+        self.assertIs(escape_attr(text), text)
+        self.assertEqual(escape_text("'\"&"), "'\"&amp;")
+        self.assertEqual(escape_attr("'\"&"), "'&quot;&amp;")
+
+if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,77 @@
+import os
+import struct
+import tempfile
+import unittest
+
+from fixtures import write_fixture
+from images import ImageSizes, image_size
+from textnode import TextNode, TextType, image_to_leaf
+
+
+def png(width, height):
+    return b"\x89PNG\r\n\x1a\n" + struct.pack(">I4sII", 13, b"IHDR", width, height) + b"\x08\x06\x00\x00\x00"
+
+
+def jpeg(width, height, sof=0xC0):
+    app0 = b"\xff\xe0" + struct.pack(">H", 16) + b"JFIF\x00" + b"\x00" * 9
+    dht = b"\xff\xc4" + struct.pack(">H", 5) + b"\x00\x00\x00"
+    frame = b"\xff\xff" + bytes([sof]) + struct.pack(">HBHHB", 11, 8, height, width, 1) + b"\x01\x11\x00"
+    return b"\xff\xd8" + app0 + dht + frame + b"\xff\xda" + b"\x00" * 100
+
+
+class TestImageSize(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        os.makedirs(os.path.join(self.tmp.name, "images"))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write(self, rel_path, data, mtime=None):
+        return write_fixture(os.path.join(self.tmp.name, rel_path), data, mtime)
+
+    def test_png(self):
+        self.assertEqual(image_size(self.write("a.png", png(928, 468))), (928, 468))
+
+    def test_jpeg(self):
+        self.assertEqual(image_size(self.write("a.jpg", jpeg(640, 480))), (640, 480))
+        self.assertEqual(image_size(self.write("p.jpg", jpeg(300, 200, sof=0xC2))), (300, 200))
+
+    def test_unknown_or_truncated(self):
+        self.assertIsNone(image_size(self.write("a.gif", b"GIF89a\x01\x00\x01\x00")))
+        self.assertIsNone(image_size(self.write("b.png", b"png")))
+        self.assertIsNone(image_size(self.write("c.png", png(1, 1)[:12])))
+        self.assertIsNone(image_size(self.write("f.png", png(1, 1)[:20])))
+        self.assertIsNone(ImageSizes(self.tmp.name).get("/f.png"))
+        self.assertIsNone(image_size(self.write("d.jpg", jpeg(640, 480)[:30])))
+        self.assertIsNone(image_size(self.write("e.jpg", b"\xff\xd8\xff\xda\x00\x02")))
+
+    def test_cached_until_mtime_changes(self):
+        sizes = ImageSizes(self.tmp.name)
+        self.write("images/tom.png", png(10, 20), mtime=1)
+        self.assertEqual(sizes.get("/images/tom.png"), (10, 20))
+        path = os.path.join(self.tmp.name, "images", "tom.png")
+        self.assertEqual(sizes.entries[path], (1_000_000_000, (10, 20)))
+        self.write("images/tom.png", png(30, 40), mtime=2)
+        self.assertEqual(sizes.get("/images/tom.png?v=2"), (30, 40))
+
+    def test_only_root_relative_static_urls(self):
+        sizes = ImageSizes(self.tmp.name)
+        self.write("images/tom.png", png(10, 20))
+        self.assertIsNone(sizes.get("images/tom.png"))
+        self.assertIsNone(sizes.get("https://example.com/images/tom.png"))
+        self.assertIsNone(sizes.get("//example.com/images/tom.png"))
+        self.assertIsNone(sizes.get("/../images/tom.png"))
+        self.assertIsNone(sizes.get("/images/missing.png"))
+        self.assertIsNone(ImageSizes().get("/images/tom.png"))
+
+    def test_image_leaf(self):
+        node = image_to_leaf(TextNode("Tom", TextType.IMAGE, "https://example.com/tom.png"))
+        self.assertEqual(
+            node.to_html(),
+            '<img src="https://example.com/tom.png" alt="Tom" loading="lazy" decoding="async">',
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+import os
+import subprocess
+import sys
+import unittest
+
+
+src_dir = os.path.dirname(os.path.abspath(__file__))
+
+# Cumulative import time budgets in microseconds, measured with -X importtime.
+# They are loose enough for a loaded CI box; the point is to catch an
+# accidental heavy import (or work at import time) sneaking back in.
+main_budget_us = 15_000
+build_budget_us = 150_000
+
+
+def import_time_us(module):
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=src_dir,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    for line in result.stderr.splitlines():
+        _, cumulative_us, name = line.split("|")
+        if name.strip() == module:
+            return int(cumulative_us)
+    raise AssertionError(f"{module} not found in -X importtime output")
+
+
+def imported_modules(module):
+    result = subprocess.run(
+        [sys.executable, "-c", f"import sys, {module}; print(' '.join(sys.modules))"],
+        cwd=src_dir,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return set(result.stdout.split())
+
+
+class TestImportTime(unittest.TestCase):
+    def test_main_import_is_minimal(self):
+        modules = imported_modules("main")
+        for heavy in ("sitebuilder", "markdown_blocks", "argparse", "shutil"):
+            self.assertNotIn(heavy, modules)
+        self.assertLess(import_time_us("main"), main_budget_us)
+
+    def test_build_import_budget(self):
+        self.assertNotIn("http.server", imported_modules("sitebuilder"))
+        self.assertLess(import_time_us("sitebuilder"), build_budget_us)
+
+    def test_no_work_at_import(self):
+        result = subprocess.run(
+            [sys.executable, "-c", "import main, supporting_funcs"],
+            cwd=src_dir,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        self.assertEqual(result.stdout, "")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+import os
+import tempfile
+import unittest
+
+from fixtures import write_fixture
+from inlinecss import CssInliner, minify_css
+
+
+template = """<head>
+    <link href="/index.css" rel="stylesheet">
+    <link rel='stylesheet' href='/print.css' media='print'>
+    <link href="/big.css" rel="stylesheet">
+    <link href="/images.css" rel="stylesheet">
+    <link href="https://example.com/x.css" rel="stylesheet">
+    <link rel="icon" href="/index.css">
+</head>
+<body><link href="/index.css" rel="stylesheet">{{ Content }}</body>"""
+
+
+class TestMinifyCss(unittest.TestCase):
+    def test_minify(self):
+        css = "/* site */\nbody {\n  margin: 0 auto;\n  font: 12px/1.5 \"A  B\", serif;\n}\n\nh1 , h2 > a {\n  color: red ;\n}\n"
+        self.assertEqual(minify_css(css), 'body{margin:0 auto;font:12px/1.5 "A  B",serif}h1,h2>a{color:red}')
+
+    def test_keeps_meaningful_spaces(self):
+        self.assertEqual(minify_css("a :hover { }"), "a :hover{}")
+        self.assertEqual(minify_css("@media (max-width: 600px) { p { width: calc(1px + 2em) } }"), "@media (max-width:600px){p{width:calc(1px + 2em)}}")
+        self.assertEqual(minify_css("p { content: \";}  /* x */\"; }"), 'p{content:";}  /* x */"}')
+
+
+class TestCssInliner(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.write("index.css", "body {\n  margin: 0;\n}\n", mtime=1)
+        self.write("print.css", "a { color: black; }")
+        self.write("big.css", "p { margin: 0 }\n" * 100)
+        self.write("images.css", "body { background: url(images/bg.png); }")
+        self.inliner = CssInliner(self.tmp.name, max_size=200)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write(self, rel_path, text, mtime=None):
+        write_fixture(os.path.join(self.tmp.name, rel_path), text, mtime)
+
+    def test_inlines_small_stylesheets_in_head(self):
+        html = self.inliner.apply(template)
+        self.assertIn("<style>body{margin:0}</style>", html)
+        self.assertIn('<style media="print">a{color:black}</style>', html)
+        self.assertIn('<link href="/big.css" rel="stylesheet">', html)
+        self.assertIn('<link href="/images.css" rel="stylesheet">', html)
+        self.assertIn('<link href="https://example.com/x.css" rel="stylesheet">', html)
+        self.assertIn('<link rel="icon" href="/index.css">', html)
+        self.assertIn('<body><link href="/index.css" rel="stylesheet">', html)
+
+    def test_disabled(self):
+        self.assertEqual(CssInliner(self.tmp.name).apply(template), template)
+        self.assertEqual(CssInliner(max_size=200).apply(template), template)
+
+    def test_cached_until_mtime_changes(self):
+        self.assertEqual(self.inliner.get("/index.css"), "body{margin:0}")
+        self.write("index.css", "body { margin: 1px }", mtime=2)
+        self.assertEqual(self.inliner.get("/index.css?v=2"), "body{margin:1px}")
+        self.assertIsNone(self.inliner.get("/missing.css"))
+        self.assertIsNone(self.inliner.get("/../index.css"))
+
+
+if __name__ == "__main__":
+    unittest.main()
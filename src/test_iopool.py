@@ -0,0 +1,65 @@
+import threading
+import time
+import unittest
+
+from iopool import IOPool
+
+
+class TestIOPool(unittest.TestCase):
+    def test_prefetch_preserves_order(self):
+        def slow_square(n):
+            time.sleep(0.001 * (n % 3))
+            return n * n
+
+        with IOPool(workers=4) as io_pool:
+            self.assertEqual(list(io_pool.prefetch(slow_square, range(20), 3)), [n * n for n in range(20)])
+
+    def test_submit_is_bounded(self):
+        in_flight = []
+        peak = []
+        lock = threading.Lock()
+
+        def job():
+            with lock:
+                in_flight.append(1)
+                peak.append(len(in_flight))
+            time.sleep(0.002)
+            with lock:
+                in_flight.pop()
+
+        with IOPool(workers=2, max_pending=2) as io_pool:
+            for _ in range(10):
+                io_pool.submit(job)
+        self.assertEqual(len(peak), 10)
+        self.assertLessEqual(max(peak), 2)
+
+    def test_wait_reraises(self):
+        def fail():
+            raise OSError("disk full")
+
+        io_pool = IOPool(workers=1)
+        io_pool.submit(fail)
+        with self.assertRaises(OSError):
+            io_pool.close()
+
+    def test_batch_reuses_pool_after_error(self):
+        def fail():
+            raise OSError("disk full")
+
+        results = []
+        with IOPool(workers=1) as io_pool:
+            with self.assertRaises(OSError):
+                with io_pool.batch():
+                    io_pool.submit(fail)
+            with self.assertRaises(ValueError):
+                with io_pool.batch():
+                    io_pool.submit(time.sleep, 0.01)
+                    io_pool.submit(results.append, "cancelled")
+                    raise ValueError("render failed")
+            with io_pool.batch():
+                io_pool.submit(results.append, "next build")
+            self.assertEqual(results, ["next build"])
+
+
+if __name__ == "__main__":
+    unittest.main()
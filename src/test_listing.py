@@ -0,0 +1,101 @@
+import os
+import tempfile
+import unittest
+
+from listing import generate_listing_pages, listing_page_path, tag_slug
+from pageindex import PageIndex
+
+
+class TestListingPages(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.content = os.path.join(self.tmp.name, "content")
+        self.public = os.path.join(self.tmp.name, "docs")
+        self.template = os.path.join(self.tmp.name, "template.html")
+        with open(self.template, "w", encoding="utf-8") as f:
+            f.write("<title>{{ Title }}</title>{{ Content }}")
+        self.index = PageIndex(self.public, "/site/")
+        self.written = {}
+        self.state = {}
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def add_post(self, name, date, tags=()):
+        from_path = os.path.join(self.content, "blog", name, "index.md")
+        os.makedirs(os.path.dirname(from_path), exist_ok=True)
+        with open(from_path, "w", encoding="utf-8") as f:
+            f.write(f"# {name}")
+        dest_path = os.path.join(self.public, "blog", name, "index.html")
+        self.index.add(
+            from_path, dest_path, {"title": name, "date": date, "tags": list(tags)}
+        )
+
+    def generate(self):
+        self.written = {}
+
+        def write_file(dest_path, data):
+            self.written[os.path.relpath(dest_path, self.public)] = data.decode("utf-8")
+
+        generate_listing_pages(
+            self.index,
+            os.path.join(self.content, "blog"),
+            os.path.join(self.public, "blog"),
+            self.template,
+            "/site/",
+            "Blog",
+            per_page=2,
+            state=self.state,
+            write_file=write_file,
+            keep_file=lambda dest_path: True,
+        )
+
+    def test_paginated_by_date(self):
+        self.add_post("a", "2024-01-01")
+        self.add_post("b", "2024-03-01")
+        self.add_post("c", "2024-02-01")
+        self.generate()
+        first = self.written[os.path.join("blog", "index.html")]
+        second = self.written[os.path.join("blog", "page", "2", "index.html")]
+        self.assertLess(first.index('href="/site/blog/b/"'), first.index('href="/site/blog/c/"'))
+        self.assertIn('<a href="/site/blog/page/2/">Older</a>', first)
+        self.assertIn('href="/site/blog/a/"', second)
+        self.assertIn('<a href="/site/blog/">Newer</a>', second)
+
+    def test_tag_pages(self):
+        self.add_post("a", "2024-01-01", ["Middle Earth"])
+        self.add_post("b", "2024-02-01", ["elves", "Middle Earth"])
+        self.generate()
+        middle_earth = self.written[os.path.join("blog", "tags", "middle-earth", "index.html")]
+        self.assertIn("<title>Blog: Middle Earth</title>", middle_earth)
+        self.assertIn('href="/site/blog/a/"', middle_earth)
+        self.assertNotIn('href="/site/blog/a/"', self.written[os.path.join("blog", "tags", "elves", "index.html")])
+
+    def test_only_changed_slices_are_regenerated(self):
+        for i in range(1, 6):
+            self.add_post(f"p{i}", f"2024-01-0{i}")
+        self.generate()
+        self.assertEqual(len(self.written), 3)
+        self.add_post("p0", "2023-12-31")
+        self.generate()
+        self.assertEqual(list(self.written), [os.path.join("blog", "page", "3", "index.html")])
+
+    def test_template_change_regenerates_every_page(self):
+        for i in range(1, 4):
+            self.add_post(f"p{i}", f"2024-01-0{i}")
+        self.generate()
+        self.generate()
+        self.assertEqual(self.written, {})
+        with open(self.template, "w", encoding="utf-8") as f:
+            f.write("<title>{{ Title }}</title><main>{{ Content }}</main>")
+        self.generate()
+        self.assertEqual(len(self.written), 2)
+        self.assertIn("<main>", self.written[os.path.join("blog", "index.html")])
+
+    def test_helpers(self):
+        self.assertEqual(tag_slug("Middle Earth!"), "middle-earth")
+        self.assertEqual(listing_page_path("blog", 3), os.path.join("blog", "page", "3", "index.html"))
+
+
+if __name__ == "__main__":
+    unittest.main()
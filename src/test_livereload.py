@@ -0,0 +1,143 @@
+import io
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+
+from devserver import DevServer
+from fixtures import write_fixture
+from livereload import LiveDocument, LiveReload, send_events
+from markdown_blocks import markdown_to_html_node
+
+
+template = "<title>{{ Title }}</title>{{ Content }}"
+metadata = {"body_offset": 0}
+
+
+def apply(fragments, ops):
+    fragments = list(fragments)
+    for start, end, html in ops:
+        fragments[start:end] = html
+    return fragments
+
+
+class TestLiveDocument(unittest.TestCase):
+    def assertPatches(self, old_markdown, new_markdown):
+        document = LiveDocument()
+        document.update(old_markdown, metadata, template)
+        old = [html for html, _ in document.fragments]
+        ops = document.update(new_markdown, metadata, template)
+        patched = "<div>" + "".join(apply(old, ops)) + "</div>"
+        self.assertEqual(patched, markdown_to_html_node(new_markdown).to_html())
+        return ops
+
+    def test_only_changed_blocks_are_sent(self):
+        ops = self.assertPatches("# T\n\none\n\ntwo\n\nthree", "# T\n\none\n\n2\n\nthree")
+        self.assertEqual(ops, [[2, 3, ["<p>2</p>"]]])
+
+    def test_insert_and_delete(self):
+        ops = self.assertPatches("# T\n\na\n\nb\n\nc", "# T\n\nnew\n\na\n\nc")
+        self.assertEqual(ops, [[2, 3, []], [1, 1, ["<p>new</p>"]]])
+
+    def test_heading_ids_follow_earlier_headings(self):
+        ops = self.assertPatches("# T\n\n## A\n\ntext", "# T\n\n## A\n\n## A\n\ntext")
+        self.assertEqual(ops, [[2, 2, ['<h2 id="a-1">A</h2>']]])
+        self.assertPatches("# T\n\n## A\n\n## A\n\ntext", "# T\n\n## B\n\n## A\n\ntext")
+
+    def test_unchanged_content(self):
+        document = LiveDocument()
+        document.update("# T\n\ntext", metadata, template)
+        version = document.version
+        self.assertEqual(document.update("# T\n\ntext", metadata, template), [])
+        self.assertEqual(document.version, version)
+
+    def test_title_change_needs_reload(self):
+        document = LiveDocument()
+        document.update("# T\n\ntext", metadata, template)
+        self.assertIsNone(document.update("# New\n\ntext", metadata, template))
+        self.assertIsNone(document.update("# New\n\ntext", {"body_offset": 5}, template))
+
+    def test_page_html(self):
+        document = LiveDocument()
+        document.update("# T\n\ntext", metadata, "<body>{{ Content }}</body>")
+        html = document.page_html()
+        self.assertTrue(html.startswith('<body><div data-live-root><h1 id="t">T</h1><p>text</p></div><script>'))
+        self.assertIn(f"&version={document.version}", html)
+        self.assertTrue(html.endswith("</script></body>"))
+
+
+class TestLiveReload(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.content = os.path.join(self.tmp.name, "content")
+        os.makedirs(self.content)
+        self.template = os.path.join(self.tmp.name, "template.html")
+        self.page = os.path.join(self.content, "index.md")
+        write_fixture(self.template, template)
+        write_fixture(self.page, "# Home\n\nfirst", mtime=1)
+        self.server = DevServer(self.content, self.tmp.name, self.template, live_reload=True)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def render(self):
+        with redirect_stdout(io.StringIO()):
+            return self.server.render(self.page)
+
+    def test_edit_is_pushed_to_subscribers(self):
+        live_reload = self.server.live_reload
+        self.assertIn(b"&version=1", self.render())
+        subscriber = live_reload.subscribe(self.page, 1)
+        stale = live_reload.subscribe(self.page, 0)
+        self.assertEqual(stale.get_nowait(), {"reload": True})
+
+        write_fixture(self.page, "# Home\n\nsecond", mtime=2)
+        live_reload.poll()
+        self.assertEqual(subscriber.get_nowait(), {"ops": [[1, 2, ["<p>second</p>"]]]})
+        live_reload.poll()
+        self.assertTrue(subscriber.empty())
+        self.assertIn(b"&version=2", self.render())
+
+        live_reload.unsubscribe(self.page, subscriber)
+        live_reload.unsubscribe(self.page, stale)
+        self.assertEqual(live_reload.subscribers, {})
+
+    def test_template_edit_reloads_subscribers(self):
+        live_reload = self.server.live_reload
+        self.render()
+        subscriber = live_reload.subscribe(self.page, 1)
+        write_fixture(self.template, "<h1>{{ Title }}</h1>{{ Content }}", mtime=2)
+        live_reload.poll()
+        self.assertEqual(subscriber.get_nowait(), {"reload": True})
+        self.assertTrue(live_reload.documents[self.page].page_html().startswith("<h1>Home</h1>"))
+
+    def test_documents_dropped_with_cache_entries(self):
+        live_reload = self.server.live_reload
+        self.server.cache.max_size = 1
+        other = os.path.join(self.content, "other.md")
+        write_fixture(other, "# Other")
+        self.render()
+        subscriber = live_reload.subscribe(self.page, 1)
+        with redirect_stdout(io.StringIO()):
+            self.server.render(other)
+        # Still open in a browser, so kept until it unsubscribes.
+        self.assertIn(self.page, live_reload.documents)
+        live_reload.unsubscribe(self.page, subscriber)
+        self.assertEqual(list(live_reload.documents), [other])
+
+    def test_send_events(self):
+        live_reload = LiveReload()
+        subscriber = live_reload.subscribe("page.md", 0)
+
+        class ClosedAfterOneEvent(io.BytesIO):
+            def flush(self):
+                if self.getvalue():
+                    raise BrokenPipeError
+
+        wfile = ClosedAfterOneEvent()
+        send_events(wfile, subscriber)
+        self.assertEqual(wfile.getvalue(), b'data: {"reload": true}\n\n')
+
+
+if __name__ == "__main__":
+    unittest.main()
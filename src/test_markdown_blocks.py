@@ -0,0 +1,68 @@
+import os
+import struct
+import tempfile
+import unittest
+
+import markdown_blocks
+from images import image_sizes
+from markdown_blocks import FRAGMENT_CACHE, markdown_to_html_many, markdown_to_html_node
+
+
+snippets = [
+    "# Title\n\nSome **bold** text.",
+    "## Intro\n\nSome **bold** text.\n\n## Intro",
+    "- a\n- b\n\n> quoted",
+    "Some **bold** text.",
+    "",
+    '!!! note "Intro"\n    ## Intro\n\n## Intro',
+]
+
+
+class TestMarkdownToHtmlMany(unittest.TestCase):
+    def setUp(self):
+        FRAGMENT_CACHE.clear()
+
+    def test_matches_single_conversion(self):
+        expected = [markdown_to_html_node(markdown).to_html() for markdown in snippets]
+        self.assertEqual(list(markdown_to_html_many(snippets)), expected)
+        # Again from a warm cache.
+        self.assertEqual(list(markdown_to_html_many(iter(snippets))), expected)
+
+    def test_headings_not_cached(self):
+        list(markdown_to_html_many(snippets))
+        self.assertIn("Some **bold** text.", FRAGMENT_CACHE)
+        self.assertIn("- a\n- b", FRAGMENT_CACHE)
+        self.assertNotIn("## Intro", FRAGMENT_CACHE)
+        self.assertNotIn('!!! note "Intro"\n    ## Intro', FRAGMENT_CACHE)
+
+    def test_images_not_cached(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.addCleanup(setattr, image_sizes, "static_dir", image_sizes.static_dir)
+        image_sizes.static_dir = tmp.name
+        path = os.path.join(tmp.name, "a.png")
+        for width, height, mtime in ((10, 20, 1), (30, 40, 2)):
+            with open(path, "wb") as f:
+                f.write(b"\x89PNG\r\n\x1a\n" + struct.pack(">I4sII", 13, b"IHDR", width, height))
+            os.utime(path, (mtime, mtime))
+            (html,) = markdown_to_html_many(["![x](/a.png)"])
+            self.assertIn(f'width="{width}" height="{height}"', html)
+        self.assertNotIn("![x](/a.png)", FRAGMENT_CACHE)
+
+    def test_cache_is_bounded(self):
+        size = markdown_blocks.fragment_cache_size
+        markdown_blocks.fragment_cache_size = 3
+        try:
+            list(markdown_to_html_many([f"para {i}" for i in range(10)]))
+        finally:
+            markdown_blocks.fragment_cache_size = size
+        self.assertEqual(list(FRAGMENT_CACHE), ["para 7", "para 8", "para 9"])
+
+    def test_process_pool_preserves_order(self):
+        markdowns = [f"Paragraph {i} with _emphasis_." for i in range(50)] + snippets
+        expected = [markdown_to_html_node(markdown).to_html() for markdown in markdowns]
+        self.assertEqual(list(markdown_to_html_many(markdowns, workers=2, chunk_size=7)), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+import os
+import subprocess
+import sys
+import unittest
+
+from markdown_blocks import BlockType, block_to_block_type, markdown_to_html_node
+from markdown_extensions import ExtBlockType
+
+
+class TestBlockDispatch(unittest.TestCase):
+    def test_builtin_block_types(self):
+        self.assertEqual(block_to_block_type("## Title"), BlockType.HEADING)
+        self.assertEqual(block_to_block_type("```\ncode\n```"), BlockType.CODE)
+        self.assertEqual(block_to_block_type("> a\n> b"), BlockType.QUOTE)
+        self.assertEqual(block_to_block_type("> a\nb"), BlockType.PARAGRAPH)
+        self.assertEqual(block_to_block_type("- a\n- b"), BlockType.ULIST)
+        self.assertEqual(block_to_block_type("1. a\n2. b"), BlockType.OLIST)
+        self.assertEqual(block_to_block_type("1. a\n3. b"), BlockType.PARAGRAPH)
+        self.assertEqual(block_to_block_type("#hashtag"), BlockType.PARAGRAPH)
+        self.assertEqual(block_to_block_type("plain"), BlockType.PARAGRAPH)
+        self.assertEqual(block_to_block_type(""), BlockType.PARAGRAPH)
+
+    def test_extension_block_types(self):
+        self.assertEqual(block_to_block_type("| a |\n| - |"), ExtBlockType.TABLE)
+        self.assertEqual(block_to_block_type("| a |\n| b |"), BlockType.PARAGRAPH)
+        self.assertEqual(block_to_block_type('!!! note "Hi"\n    x'), ExtBlockType.ADMONITION)
+        self.assertEqual(block_to_block_type("![alt](a.png)"), BlockType.PARAGRAPH)
+
+
+class TestRegistration(unittest.TestCase):
+    def test_enabled_on_import(self):
+        # In a fresh interpreter, whichever module is imported first.
+        for module in ("markdown_blocks", "markdown_extensions"):
+            code = (
+                f"import {module}\n"
+                "from markdown_blocks import markdown_to_html_node\n"
+                "print(markdown_to_html_node('a ~~b~~ c\\n\\n| x |\\n| - |\\n| 1 |').to_html())"
+            )
+            result = subprocess.run(
+                [sys.executable, "-c", code],
+                cwd=os.path.dirname(os.path.abspath(__file__)),
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+            self.assertIn("<del>b</del>", result.stdout)
+            self.assertIn("<table>", result.stdout)
+
+
+class TestExtensions(unittest.TestCase):
+    def test_table(self):
+        html = markdown_to_html_node(
+            "| Name | Ring |\n| :--- | ---: |\n| Frodo | **One** |\n| Sam \\| Gamgee | |"
+        ).to_html()
+        self.assertEqual(
+            html,
+            "<div><table>"
+            '<thead><tr><th style="text-align: left">Name</th>'
+            '<th style="text-align: right">Ring</th></tr></thead>'
+            '<tbody><tr><td style="text-align: left">Frodo</td>'
+            '<td style="text-align: right"><b>One</b></td></tr>'
+            '<tr><td style="text-align: left">Sam | Gamgee</td>'
+            '<td style="text-align: right"></td></tr></tbody>'
+            "</table></div>",
+        )
+
+    def test_admonition(self):
+        html = markdown_to_html_node("!!! warning\n    Do **not**\n    put it on.").to_html()
+        self.assertEqual(
+            html,
+            '<div><div class="admonition warning">'
+            '<p class="admonition-title">Warning</p>'
+            "<p>Do <b>not</b> put it on.</p>"
+            "</div></div>",
+        )
+
+    def test_admonition_title(self):
+        html = markdown_to_html_node('!!! note "Second breakfast"\n    Yes.').to_html()
+        self.assertIn('<p class="admonition-title">Second breakfast</p>', html)
+        html = markdown_to_html_node('!!! note ""\n    Yes.').to_html()
+        self.assertNotIn("admonition-title", html)
+
+    def test_strikethrough(self):
+        html = markdown_to_html_node("It was ~~mine~~ _his_, `~~x~~`").to_html()
+        self.assertEqual(
+            html, "<div><p>It was <del>mine</del> <i>his</i>, <code>~~x~~</code></p></div>"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+import tracemalloc
+import unittest
+
+from htmlnode import HTMLNode, LeafNode, ParentNode
+from memstats import MemoryReport, format_size
+from textnode import TextNode, TextType
+
+
+def render(count, size=1000):
+    text_nodes = [TextNode("word", TextType.TEXT) for _ in range(count)]
+    return ParentNode("p", [LeafNode(None, "x" * size) for _ in text_nodes])
+
+
+class TestMemoryReport(unittest.TestCase):
+    def test_measure(self):
+        report = MemoryReport(threshold=50_000)
+        report.start()
+        try:
+            small = report.measure("small.md", render, 1)
+            report.measure("large.md", render, 200)
+        finally:
+            report.stop()
+        self.assertEqual(small.to_html(), "<p>" + "x" * 1000 + "</p>")
+        (path, peak, text_nodes, html_nodes), large = report.pages
+        self.assertEqual((path, text_nodes, html_nodes), ("small.md", 1, 2))
+        self.assertEqual(large[2:], (200, 201))
+        self.assertGreater(large[1], 200 * 1000)
+        self.assertEqual([page[0] for page in report.over_threshold()], ["large.md"])
+        self.assertIn("large.md: peak", report.report())
+        self.assertNotIn("small.md: peak", report.report())
+
+    def test_stop_restores_state(self):
+        was_tracing = tracemalloc.is_tracing()
+        inits = TextNode.__init__, HTMLNode.__init__
+        first = MemoryReport()
+        second = MemoryReport()
+        first.start()
+        second.start()
+        self.assertNotEqual((TextNode.__init__, HTMLNode.__init__), inits)
+        first.stop()
+        # The counting hook stays until the last started report stops.
+        self.assertNotEqual((TextNode.__init__, HTMLNode.__init__), inits)
+        second.stop()
+        second.stop()
+        self.assertEqual((TextNode.__init__, HTMLNode.__init__), inits)
+        self.assertEqual(tracemalloc.is_tracing(), was_tracing)
+
+    def test_overlapping_reports(self):
+        was_tracing = tracemalloc.is_tracing()
+        outer = MemoryReport(threshold=0)
+        inner = MemoryReport(threshold=0)
+        outer.start()
+        inner.start()
+        try:
+            outer.measure("outer.md", lambda: (render(2), inner.measure("inner.md", render, 3)))
+        finally:
+            outer.stop()
+            inner.stop()
+        self.assertEqual(inner.pages[0][2:], (3, 4))
+        self.assertEqual(outer.pages[0][2:], (5, 7))
+        self.assertGreater(outer.pages[0][1], inner.pages[0][1])
+        self.assertEqual(tracemalloc.is_tracing(), was_tracing)
+
+    def test_nested_measure_keeps_outer_peak(self):
+        report = MemoryReport()
+        report.start()
+        try:
+            # The outer render frees its large allocation before the
+            # nested measure() resets the process-wide peak.
+            report.measure("outer.md", lambda: (len(bytearray(500_000)), report.measure("inner.md", render, 1)))
+        finally:
+            report.stop()
+        inner, outer = report.pages
+        self.assertLess(inner[1], 100_000)
+        self.assertGreater(outer[1], 500_000)
+
+    def test_format_size(self):
+        self.assertEqual(format_size(512), "512 B")
+        self.assertEqual(format_size(1536), "1.5 KiB")
+        self.assertEqual(format_size(3 * 1024 * 1024), "3.0 MiB")
+
+
+if __name__ == "__main__":
+    unittest.main()
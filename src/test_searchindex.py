@@ -0,0 +1,120 @@
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+import unittest
+
+from markdown_blocks import markdown_to_html_node
+from searchindex import SearchIndex, shard_key
+
+
+class TestSearchIndex(unittest.TestCase):
+    def setUp(self):
+        self.index = SearchIndex("docs", "/site/")
+
+    def add(self, rel_path, title, markdown):
+        node = markdown_to_html_node(markdown)
+        self.index.add_page(os.path.join("docs", rel_path), title, node)
+
+    def test_page_urls(self):
+        self.assertEqual(self.index.page_url("docs/index.html"), "/site/")
+        self.assertEqual(self.index.page_url("docs/blog/tom/index.html"), "/site/blog/tom/")
+        self.assertEqual(self.index.page_url("docs/about.html"), "/site/about.html")
+
+    def test_postings_with_positions(self):
+        self.add("index.html", "Home", "# Home\n\nThe **ring** and the ring")
+        self.assertEqual(self.index.postings["ring"], {0: [2, 5]})
+        self.assertEqual(self.index.postings["the"], {0: [1, 4]})
+        self.assertEqual(self.index.pages[0], ["/site/", "Home"])
+
+    def test_readd_replaces_own_postings(self):
+        self.add("a/index.html", "A", "alpha shared")
+        self.add("b/index.html", "B", "beta shared")
+        self.add("a/index.html", "A", "gamma shared")
+        self.assertNotIn("alpha", self.index.postings)
+        self.assertEqual(self.index.postings["gamma"], {0: [0]})
+        self.assertEqual(self.index.postings["shared"], {0: [1], 1: [1]})
+        self.assertEqual(self.index.page_ids["/site/a/"], 0)
+
+    def test_merge_shards(self):
+        shards = [SearchIndex("docs", "/site/"), SearchIndex("docs", "/site/")]
+        for shard in shards:
+            shard.reserve_page("docs/a/index.html")
+            shard.reserve_page("docs/b/index.html")
+        shards[0].add_page("docs/b/index.html", "B", markdown_to_html_node("beta shared"))
+        shards[1].add_page("docs/a/index.html", "A", markdown_to_html_node("alpha shared"))
+        self.add("a/index.html", "A", "alpha shared")
+        self.add("b/index.html", "B", "beta shared")
+
+        merged = SearchIndex("docs", "/site/")
+        for shard in shards:
+            merged.merge(shard)
+        self.assertEqual(merged.pages, self.index.pages)
+        self.assertEqual(merged.shards(), self.index.shards())
+        with self.assertRaises(ValueError):
+            merged.merge(shards[0])
+
+    def test_shard_key(self):
+        self.assertEqual(shard_key("ring"), "ri")
+        self.assertEqual(shard_key("a"), "a")
+        self.assertEqual(shard_key("éowyn"), "_")
+
+    def test_write_and_load_round_trip(self):
+        self.add("index.html", "Home", "one two")
+        self.add("blog/index.html", "Blog", "two three")
+        with tempfile.TemporaryDirectory() as tmp:
+            self.index.write(tmp)
+            with open(os.path.join(tmp, "manifest.json")) as f:
+                manifest = json.load(f)
+            self.assertEqual(manifest["shards"], ["on", "th", "tw"])
+
+            loaded = SearchIndex.load(tmp, "docs", "/site/")
+            self.assertEqual(loaded.postings, self.index.postings)
+            self.assertEqual(loaded.page_ids, self.index.page_ids)
+
+            loaded.add_page("docs/index.html", "Home", markdown_to_html_node("four"))
+            loaded_dir = os.path.join(tmp, "loaded")
+            loaded.write(loaded_dir)
+            self.assertEqual(sorted(os.listdir(loaded_dir)), ["fo.json", "manifest.json", "pages.json", "th.json", "tw.json"])
+            with open(os.path.join(loaded_dir, "fo.json")) as f:
+                self.assertEqual(json.load(f), {"four": [[0, 0]]})
+
+
+search_js = os.path.join(os.path.dirname(__file__), "..", "static", "search.js")
+
+# Runs static/search.js against a written index, with fetch() reading
+# the index files from disk.
+SEARCH_RUNNER = """
+const fs = require("fs");
+const [jsPath, root, query] = process.argv.slice(1);
+globalThis.fetch = async (url) => ({ json: async () => JSON.parse(fs.readFileSync(url, "utf8")) });
+const search = new Function(fs.readFileSync(jsPath, "utf8") + "\\nreturn search;")();
+search(root, query).then((results) => console.log(JSON.stringify(results)));
+"""
+
+
+@unittest.skipIf(shutil.which("node") is None, "node is not installed")
+class TestSearchClient(unittest.TestCase):
+    def search(self, search_dir, query):
+        result = subprocess.run(
+            ["node", "-e", SEARCH_RUNNER, search_js, search_dir + os.sep, query],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        return [page["title"] for page in json.loads(result.stdout)]
+
+    def test_non_ascii_query(self):
+        index = SearchIndex("docs", "/site/")
+        index.add_page("docs/a/index.html", "A", markdown_to_html_node("The fall of Númenor"))
+        index.add_page("docs/b/index.html", "B", markdown_to_html_node("Eä and the ring"))
+        self.assertIn("númenor", index.postings)
+        with tempfile.TemporaryDirectory() as tmp:
+            index.write(os.path.join(tmp, "search"))
+            self.assertEqual(self.search(tmp, "Númenor"), ["A"])
+            self.assertEqual(self.search(tmp, "eä ring"), ["B"])
+            self.assertEqual(self.search(tmp, "menor"), [])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,219 @@
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+
+from buildoutput import changes_filename, manifest_filename
+from gencontent import in_shard
+from highlight import highlight_cache
+from images import image_sizes
+from inlinecss import css_inliner
+from sitebuilder import Site
+
+
+class TestSiteBuild(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        root = self.tmp.name
+        self.files = {
+            "content/index.md": "# Home\n\n[Tom](/blog/tom)",
+            "content/blog/tom/index.md": "---\ndate: 2024-01-01\ntags: [tom]\n---\n# Tom\n\nHey dol!",
+            "content/blog/draft/index.md": "---\ndraft: true\n---\n# Draft",
+            "static/index.css": "body {}",
+            "static/images/tom.png": "png",
+            "static/images/tom.png:Zone.Identifier": "[ZoneTransfer]",
+            "content/blog/tom/notes.txt": "not a page",
+            "template.html": "<title>{{ Title }}</title><link href=\"/index.css\">{{ Content }}",
+        }
+        for rel_path, text in self.files.items():
+            path = os.path.join(root, rel_path)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(text)
+        self.site = Site(
+            content_dir=os.path.join(root, "content"),
+            static_dir=os.path.join(root, "static"),
+            public_dir=os.path.join(root, "docs"),
+            template_path=os.path.join(root, "template.html"),
+            cache_dir=os.path.join(root, ".cache"),
+            basepath="/site/",
+            site_url="https://example.com",
+        )
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def build(self, write):
+        with redirect_stdout(StringIO()):
+            return self.site.build(write=write)
+
+    def test_in_memory_build(self):
+        files = self.build(write=False)
+        self.assertFalse(os.path.exists(self.site.public_dir))
+        self.assertFalse(os.path.exists(self.site.cache_dir))
+        self.assertEqual(files["index.css"], b"body {}")
+        self.assertEqual(files["images/tom.png"], b"png")
+        self.assertIn(b'<link href="/site/index.css">', files["index.html"])
+        self.assertIn(b'<a href="/site/blog/tom">Tom</a>', files["index.html"])
+        self.assertIn(b"Hey dol!", files["blog/tom/index.html"])
+        self.assertNotIn("blog/draft/index.html", files)
+        self.assertNotIn("images/tom.png:Zone.Identifier", files)
+        self.assertNotIn("blog/tom/notes.html", files)
+        self.assertIn("blog/index.html", files)
+        self.assertIn("blog/tags/tom/index.html", files)
+        self.assertIn("blog/feed.xml", files)
+        self.assertIn("sitemap.xml", files)
+        self.assertIn("search/manifest.json", files)
+
+    def read_tree(self, root):
+        files = {}
+        skip = {manifest_filename, changes_filename}
+        for dir_path, _, filenames in os.walk(root):
+            for filename in filenames:
+                path = os.path.join(dir_path, filename)
+                rel_path = os.path.relpath(path, root).replace(os.sep, "/")
+                if rel_path in skip:
+                    continue
+                with open(path, "rb") as f:
+                    files[rel_path] = f.read()
+        return files
+
+    def test_disk_build_matches_memory_build(self):
+        files = self.build(write=False)
+        self.build(write=True)
+        self.assertEqual(self.read_tree(self.site.public_dir), files)
+
+    def test_merged_shards_match_single_build(self):
+        files = self.build(write=False)
+        with redirect_stdout(StringIO()):
+            for index in (1, 2, 3):
+                self.site.build(shard=(index, 3))
+            self.site.merge(3)
+        self.assertEqual(self.read_tree(self.site.public_dir), files)
+
+    def test_merge_requires_every_shard(self):
+        with redirect_stdout(StringIO()):
+            self.site.build(shard=(1, 2))
+            with self.assertRaises(ValueError):
+                self.site.merge(2)
+        self.assertFalse(os.path.exists(self.site.public_dir))
+
+    def test_static_file_does_not_replace_page(self):
+        with open(os.path.join(self.site.static_dir, "index.html"), "w") as f:
+            f.write("static")
+        files = self.build(write=False)
+        self.assertIn(b"<title>Home</title>", files["index.html"])
+
+    def test_rebuild_reports_changes(self):
+        changes = self.build(write=True)
+        self.assertIn("blog/tom/index.html", changes["added"])
+        self.assertEqual(self.build(write=True), {"added": [], "changed": [], "removed": []})
+        with open(os.path.join(self.site.content_dir, "index.md"), "a", encoding="utf-8") as f:
+            f.write("\n\nMore.")
+        changes = self.build(write=True)
+        self.assertIn("index.html", changes["changed"])
+        self.assertNotIn("blog/tom/index.html", changes["changed"])
+
+    def test_template_change_rebuilds_kept_listings(self):
+        self.build(write=True)
+        with open(self.site.template_path, "w", encoding="utf-8") as f:
+            f.write("<title>{{ Title }}</title><main>{{ Content }}</main>")
+        self.build(write=True)
+        with open(os.path.join(self.site.public_dir, "blog", "index.html"), encoding="utf-8") as f:
+            self.assertIn("<main>", f.read())
+
+    def test_listing_state_saved_after_commit(self):
+        state_path = os.path.join(self.site.cache_dir, "listings.json")
+        self.build(write=True)
+        with open(state_path, encoding="utf-8") as f:
+            saved = f.read()
+        with open(self.site.template_path, "w", encoding="utf-8") as f:
+            f.write("<title>{{ Title }}</title><main>{{ Content }}</main>")
+        self.site.commit = lambda output: 1 / 0
+        with self.assertRaises(ZeroDivisionError):
+            self.build(write=True)
+        with open(state_path, encoding="utf-8") as f:
+            self.assertEqual(f.read(), saved)
+
+    def test_stylesheet_change_rebuilds_kept_listings(self):
+        with open(self.site.template_path, "w", encoding="utf-8") as f:
+            f.write('<head><link rel="stylesheet" href="/index.css"></head>{{ Content }}')
+        self.build(write=True)
+        listing_path = os.path.join(self.site.public_dir, "blog", "index.html")
+        self.site.inline_css_max_size = 1024
+        self.build(write=True)
+        with open(listing_path, encoding="utf-8") as f:
+            self.assertIn("<style>body{}</style>", f.read())
+        with open(os.path.join(self.site.static_dir, "index.css"), "w", encoding="utf-8") as f:
+            f.write("main { color: red; }")
+        self.build(write=True)
+        with open(listing_path, encoding="utf-8") as f:
+            self.assertIn("<style>main{color:red}</style>", f.read())
+
+    def test_sitemap_and_feed_need_site_url(self):
+        files = self.build(write=False)
+        self.assertIn(b"<loc>https://example.com/site/blog/tom/</loc>", files["sitemap.xml"])
+        self.site.site_url = ""
+        files = self.build(write=False)
+        self.assertNotIn("sitemap.xml", files)
+        self.assertNotIn("blog/feed.xml", files)
+        with self.assertRaises(ValueError):
+            Site(site_url="example.com")
+
+    def test_in_memory_build_is_quiet(self):
+        out = StringIO()
+        with redirect_stdout(out):
+            self.site.build(write=False)
+        self.assertEqual(out.getvalue(), "")
+
+    def test_sites_keep_their_own_state(self):
+        with open(self.site.template_path, "w", encoding="utf-8") as f:
+            f.write('<head><link rel="stylesheet" href="/index.css"></head>{{ Content }}')
+        root = self.tmp.name
+        other = Site(
+            content_dir=os.path.join(root, "content"),
+            static_dir=os.path.join(root, "other_static"),
+            public_dir=os.path.join(root, "other_docs"),
+            template_path=self.site.template_path,
+            inline_css_max_size=1024,
+        )
+        os.makedirs(other.static_dir)
+        with open(os.path.join(other.static_dir, "index.css"), "w", encoding="utf-8") as f:
+            f.write("main { color: red; }")
+        defaults = css_inliner.max_size, image_sizes.static_dir, highlight_cache.cache_dir
+        self.build(write=True)
+        other_files = other.build(write=False)
+        files = self.build(write=False)
+        self.assertIn(b"<style>main{color:red}</style>", other_files["index.html"])
+        self.assertIn(b'<link rel="stylesheet" href="/site/index.css">', files["index.html"])
+        self.assertEqual(self.site.css_inliner.entries, {})
+        # Builds leave the module-level defaults alone.
+        self.assertEqual((css_inliner.max_size, image_sizes.static_dir, highlight_cache.cache_dir), defaults)
+
+    def test_memory_report(self):
+        plain = self.build(write=False)
+        self.site.memory_threshold = 0
+        self.assertEqual(self.build(write=False), plain)
+        pages = sorted(os.path.relpath(page[0], self.site.content_dir) for page in self.site.memory_report.over_threshold())
+        self.assertEqual(pages, [os.path.join("blog", "tom", "index.md"), "index.md"])
+
+
+class TestInShard(unittest.TestCase):
+    def test_every_path_in_exactly_one_shard(self):
+        paths = [f"blog/post{i}/index.md" for i in range(50)]
+        for path in paths:
+            shards = [index for index in (1, 2, 3, 4) if in_shard(path, (index, 4))]
+            self.assertEqual(len(shards), 1)
+
+    def test_assignment_depends_only_on_path(self):
+        # Fixed values: a page must land in the same shard on every
+        # machine and in every run, whatever else is in the tree.
+        self.assertTrue(in_shard("blog/tom/index.md", (1, 4)))
+        self.assertTrue(in_shard("index.md", (3, 4)))
+        self.assertTrue(in_shard(os.path.join("blog", "tom", "index.md"), (1, 4)))
+        self.assertTrue(in_shard("index.md", None))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,22 +1,22 @@
-import unittest
-
-from textnode import TextNode, TextType
-
-
-class TestTextNode(unittest.TestCase):
-    def test_eq(self):
-        node = TextNode("This is a text node", TextType.BOLD)
-        node2 = TextNode("This is a text node", TextType.BOLD)
-        node3 = TextNode("This is a text node", TextType.NORMAL)
-        node4 = TextNode("This is a text node", TextType.BOLD, "https://www.boot.dev")
-
-        self.assertEqual(node, node2)
-        self.assertNotEqual(node, node3)
-        self.assertNotEqual(node, node4)
-        self.assertNotEqual(node2, node3)
-
-    
- 
-
-if __name__ == "__main__":
+import unittest
+
+from textnode import TextNode, TextType
+
+
+class TestTextNode(unittest.TestCase):
+    def test_eq(self):
+        node = TextNode("This is a text node", TextType.BOLD)
+        node2 = TextNode("This is a text node", TextType.BOLD)
+        node3 = TextNode("This is a text node", TextType.NORMAL)
+        node4 = TextNode("This is a text node", TextType.BOLD, "https://www.boot.dev")
+
+        self.assertEqual(node, node2)
+        self.assertNotEqual(node, node3)
+        self.assertNotEqual(node, node4)
+        self.assertNotEqual(node2, node3)
+
+    
+ 
+
+if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,47 @@
+import unittest
+
+from markdown_blocks import heading_to_html_node, markdown_to_html_node
+from toc import TableOfContents, slugify
+
+
+class TestHeadingAnchors(unittest.TestCase):
+    def test_slugify(self):
+        self.assertEqual(slugify("The Art of World-Building!"), "the-art-of-world-building")
+        self.assertEqual(slugify("  Eä   and Númenor "), "eä-and-númenor")
+
+    def test_heading_ids(self):
+        node = heading_to_html_node("## A Theme of **Disruption**")
+        self.assertEqual(
+            node.to_html(), '<h2 id="a-theme-of-disruption">A Theme of <b>Disruption</b></h2>'
+        )
+
+    def test_duplicate_ids_within_page(self):
+        toc = TableOfContents()
+        html = markdown_to_html_node("## Intro\n\n## Intro\n\n## Intro", toc).to_html()
+        self.assertIn('id="intro"', html)
+        self.assertIn('id="intro-1"', html)
+        self.assertIn('id="intro-2"', html)
+
+    def test_ids_reset_per_page(self):
+        first = markdown_to_html_node("## Intro").to_html()
+        second = markdown_to_html_node("## Intro").to_html()
+        self.assertEqual(first, second)
+
+    def test_toc_nesting(self):
+        toc = TableOfContents()
+        markdown_to_html_node("# Title\n\n## One\n\n### One A\n\n## Two", toc)
+        self.assertEqual(
+            toc.to_html_node().to_html(),
+            '<nav class="toc"><ul><li><a href="#one">One</a>'
+            '<ul><li><a href="#one-a">One A</a></li></ul></li>'
+            '<li><a href="#two">Two</a></li></ul></nav>',
+        )
+
+    def test_empty_toc(self):
+        toc = TableOfContents()
+        markdown_to_html_node("# Only a title", toc)
+        self.assertIsNone(toc.to_html_node())
+
+
+if __name__ == "__main__":
+    unittest.main()
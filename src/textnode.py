@@ -1,4 +1,5 @@
 from htmlnode import LeafNode
+from images import current_image_sizes
 from enum import Enum
 
 
@@ -28,17 +29,52 @@ class TextNode:
         return f"TextNode({self.text}, {self.text_type.value}, {self.url})"
 
 
+def text_to_leaf(text_node):
+    return LeafNode(None, text_node.text)
+
+
+def bold_to_leaf(text_node):
+    return LeafNode("b", text_node.text)
+
+
+def italic_to_leaf(text_node):
+    return LeafNode("i", text_node.text)
+
+
+def code_to_leaf(text_node):
+    return LeafNode("code", text_node.text)
+
+
+def link_to_leaf(text_node):
+    return LeafNode("a", text_node.text, {"href": text_node.url})
+
+
+def image_to_leaf(text_node):
+    props = {"src": text_node.url, "alt": text_node.text}
+    size = current_image_sizes.get().get(text_node.url)
+    if size is not None:
+        props["width"], props["height"] = size
+    props["loading"] = "lazy"
+    props["decoding"] = "async"
+    return LeafNode("img", "", props)
+
+
+TEXT_RENDERERS = {
+    TextType.TEXT: text_to_leaf,
+    TextType.BOLD: bold_to_leaf,
+    TextType.ITALIC: italic_to_leaf,
+    TextType.CODE: code_to_leaf,
+    TextType.LINK: link_to_leaf,
+    TextType.IMAGE: image_to_leaf,
+}
+
+
+def register_text_type(text_type, render):
+    TEXT_RENDERERS[text_type] = render
+
+
 def text_node_to_html_node(text_node):
-    if text_node.text_type == TextType.TEXT:
-        return LeafNode(None, text_node.text)
-    if text_node.text_type == TextType.BOLD:
-        return LeafNode("b", text_node.text)
-    if text_node.text_type == TextType.ITALIC:
-        return LeafNode("i", text_node.text)
-    if text_node.text_type == TextType.CODE:
-        return LeafNode("code", text_node.text)
-    if text_node.text_type == TextType.LINK:
-        return LeafNode("a", text_node.text, {"href": text_node.url})
-    if text_node.text_type == TextType.IMAGE:
-        return LeafNode("img", "", {"src": text_node.url, "alt": text_node.text})
-    raise ValueError(f"invalid text type: {text_node.text_type}")
\ No newline at end of file
+    render = TEXT_RENDERERS.get(text_node.text_type)
+    if render is None:
+        raise ValueError(f"invalid text type: {text_node.text_type}")
+    return render(text_node)
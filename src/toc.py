@@ -0,0 +1,62 @@
+import re
+
+from htmlnode import LeafNode, ParentNode
+
+
+SLUG_STRIP_RE = re.compile(r"[^\w\s-]")
+SLUG_SPACE_RE = re.compile(r"\s+")
+
+
+class TableOfContents:
+    """
+    Headings of one page, collected while its blocks are converted.
+
+    add() hands out the heading's id, de-duplicated within the page the
+    way GitHub does it ("intro", "intro-1", "intro-2", ...).
+    """
+
+    def __init__(self, min_level=2):
+        self.min_level = min_level
+        self.headings = []
+        self.slug_counts = {}
+
+    def add(self, level, text):
+        slug = slugify(text) or "section"
+        count = self.slug_counts.get(slug)
+        if count is None:
+            heading_id = slug
+            self.slug_counts[slug] = 1
+        else:
+            heading_id = f"{slug}-{count}"
+            while heading_id in self.slug_counts:
+                count += 1
+                heading_id = f"{slug}-{count}"
+            self.slug_counts[slug] = count + 1
+            self.slug_counts[heading_id] = 1
+        self.headings.append((level, heading_id, text))
+        return heading_id
+
+    def to_html_node(self):
+        root = ParentNode("ul", [])
+        stack = [(self.min_level, root)]
+        for level, heading_id, text in self.headings:
+            if level < self.min_level:
+                continue
+            while len(stack) > 1 and level < stack[-1][0]:
+                stack.pop()
+            current = stack[-1][1]
+            if level > stack[-1][0] and current.children:
+                nested = ParentNode("ul", [])
+                current.children[-1].children.append(nested)
+                stack.append((level, nested))
+                current = nested
+            link = LeafNode("a", text, {"href": f"#{heading_id}"})
+            current.children.append(ParentNode("li", [link]))
+        if not root.children:
+            return None
+        return ParentNode("nav", [root], {"class": "toc"})
+
+
+def slugify(text):
+    text = SLUG_STRIP_RE.sub("", text.lower())
+    return SLUG_SPACE_RE.sub("-", text.strip())
@@ -0,0 +1,43 @@
+// Client for the sharded search index written by src/searchindex.py.
+// Only manifest.json is fetched up front; pages.json and the shards of
+// the query's terms are fetched on demand and cached.
+const searchCache = {};
+
+function fetchSearchJSON(root, name) {
+    if (!(name in searchCache)) {
+        searchCache[name] = fetch(`${root}search/${name}.json`).then((r) => r.json());
+    }
+    return searchCache[name];
+}
+
+async function search(root, query) {
+    const manifest = await fetchSearchJSON(root, "manifest");
+    // Same words as WORD_RE in src/searchindex.py, which matches Unicode
+    // letters and digits.
+    const terms = query.toLowerCase().match(/[\p{L}\p{N}_]+/gu) || [];
+    let scores = null;
+    for (const term of terms) {
+        let key = term.slice(0, manifest.prefix);
+        if (!/^[a-z0-9]+$/.test(key)) {
+            key = "_";
+        }
+        if (!manifest.shards.includes(key)) {
+            return [];
+        }
+        const shard = await fetchSearchJSON(root, key);
+        const matches = new Map();
+        for (const [pageId, ...positions] of shard[term] || []) {
+            if (scores === null || scores.has(pageId)) {
+                matches.set(pageId, (scores ? scores.get(pageId) : 0) + positions.length);
+            }
+        }
+        scores = matches;
+    }
+    if (scores === null) {
+        return [];
+    }
+    const pages = await fetchSearchJSON(root, "pages");
+    return [...scores.entries()]
+        .sort((a, b) => b[1] - a[1])
+        .map(([pageId]) => ({ url: pages[pageId][0], title: pages[pageId][1] }));
+}